@@ -0,0 +1,293 @@
+"""Engine hot-path benchmarks with fixed-seed workloads.
+
+Measures throughput of the paths every simulated roll goes through:
+
+- ``roll_once/<strategy>`` — rolls/second through ``TableRunner.roll_once``
+  with one player on each strategy in ``PlayerLineup.all_strategies``.
+- ``roll_once/full-table`` — the same with all strategies seated at once
+  (one player per strategy: a full 15-player table).
+- ``rules_engine.resolve_bet`` — bets/second through the uncompiled
+  resolver, over the bets a full table has working mid-session.
+- ``table.settle_resolved_bets`` — calls/second, timed inside a full-table
+  roll loop (only the settlement call is on the clock).
+- ``serialize_event`` and ``session_recorder.write`` — events/second over
+  the event stream of a recorded full-table session.
+
+Every workload is seeded, so two runs of the same tree do the same work;
+the best of ``--repeat`` timings is kept to damp scheduler noise. Results
+are written as JSON and can be compared against a saved baseline:
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    ... change the engine ...
+    python benchmarks/run_benchmarks.py --baseline baseline.json
+
+Usage: python benchmarks/run_benchmarks.py [--rolls N] [--repeat N]
+                                           [--seed N] [--only SUBSTR]
+                                           [--output FILE]
+                                           [--baseline FILE]
+                                           [--max-regression PCT]
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import HOUSE_RULES
+from craps.events import Event, EventBus
+from craps.house_rules import HouseRules
+from craps.lineup import PlayerLineup
+from craps.rules_engine import RulesEngine
+from craps.serialization import serialize_event
+from craps.session_recorder import SessionRecorder
+from craps.table_runner import LineupConfig, TableRunner
+
+#: Shooters are never the limit in a benchmark: the roll budget is.
+_UNBOUNDED_SHOOTERS = 10**9
+
+#: A workload returns (operations performed, seconds spent on the clock).
+Workload = Callable[[], Tuple[int, float]]
+
+
+def strategy_names() -> List[str]:
+    """Every strategy in the lineup, in registry order."""
+    return list(PlayerLineup(HouseRules(HOUSE_RULES), None, None, RulesEngine()).all_strategies)
+
+
+def full_table() -> LineupConfig:
+    return [(f"Seat {i + 1}", name) for i, name in enumerate(strategy_names())]
+
+
+def _started_runner(lineup: LineupConfig, seed: int) -> TableRunner:
+    runner = TableRunner(
+        table_id="bench",
+        players=lineup,
+        max_shooters=_UNBOUNDED_SHOOTERS,
+        dice_seed=seed,
+        quiet_mode=True,
+    )
+    runner.start_session()
+    return runner
+
+
+def roll_once_workload(lineup: LineupConfig, rolls: int, seed: int) -> Workload:
+    def run() -> Tuple[int, float]:
+        runner = _started_runner(lineup, seed)
+        started = time.perf_counter()
+        for _ in range(rolls):
+            runner.roll_once()
+        return rolls, time.perf_counter() - started
+    return run
+
+
+def resolve_bet_workload(rolls: int, seed: int) -> Workload:
+    """Resolve a mid-session full table's working bets against every
+    dice outcome, restoring each bet afterwards so the set stays fixed."""
+    runner = _started_runner(full_table(), seed)
+    for _ in range(50):
+        runner.roll_once()
+    engine = runner.engine
+    assert engine.table is not None and engine.game_state is not None
+    bets = [bet for bet in engine.table.bets if bet.status != "inactive"]
+    outcomes = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+    game_state = engine.game_state
+    house_rules = engine.house_rules
+    passes = max(1, rolls // len(outcomes))
+
+    def run() -> Tuple[int, float]:
+        ops = 0
+        started = time.perf_counter()
+        for _ in range(passes):
+            for outcome in outcomes:
+                for bet in bets:
+                    status, number = bet.status, bet.number
+                    RulesEngine.resolve_bet(bet, outcome, game_state, house_rules)
+                    bet.status, bet.number = status, number
+                ops += len(bets)
+        return ops, time.perf_counter() - started
+    return run
+
+
+def settle_workload(rolls: int, seed: int) -> Workload:
+    def run() -> Tuple[int, float]:
+        runner = _started_runner(full_table(), seed)
+        table = runner.engine.table
+        assert table is not None
+        settle = table.settle_resolved_bets
+        spent = 0.0
+
+        def timed_settle() -> Any:
+            nonlocal spent
+            started = time.perf_counter()
+            settled = settle()
+            spent += time.perf_counter() - started
+            return settled
+
+        table.settle_resolved_bets = timed_settle  # type: ignore[method-assign]
+        for _ in range(rolls):
+            runner.roll_once()
+        return rolls, spent
+    return run
+
+
+def recorded_events(rolls: int, seed: int) -> List[Event]:
+    """The event stream of a full-table session, setup included."""
+    runner = TableRunner(
+        table_id="bench",
+        players=full_table(),
+        max_shooters=_UNBOUNDED_SHOOTERS,
+        dice_seed=seed,
+        quiet_mode=True,
+    )
+    captured: List[Event] = []
+    runner.engine.events.subscribe(Event, captured.append)
+    runner.start_session()
+    for _ in range(rolls):
+        runner.roll_once()
+    return captured
+
+
+def serialize_workload(events: List[Event]) -> Workload:
+    def run() -> Tuple[int, float]:
+        started = time.perf_counter()
+        for seq, event in enumerate(events):
+            serialize_event(event, seq=seq, table_id="bench")
+        return len(events), time.perf_counter() - started
+    return run
+
+
+def recorder_workload(events: List[Event]) -> Workload:
+    def run() -> Tuple[int, float]:
+        with tempfile.TemporaryDirectory() as sessions_dir:
+            bus = EventBus()
+            recorder = SessionRecorder("bench", sessions_dir)
+            recorder.subscribe(bus)
+            started = time.perf_counter()
+            for event in events:
+                bus.publish(event)
+            recorder.close()
+            return len(events), time.perf_counter() - started
+    return run
+
+
+def workloads(rolls: int, seed: int) -> Dict[str, Tuple[str, Callable[[], Workload]]]:
+    """Benchmark name -> (unit, factory). Calling a factory does the
+    workload's setup, off the clock, so only selected benchmarks pay
+    for theirs; setup shared by several workloads is built once."""
+    events: List[Event] = []
+
+    def shared_events() -> List[Event]:
+        if not events:
+            events.extend(recorded_events(rolls, seed))
+        return events
+
+    suite: Dict[str, Tuple[str, Callable[[], Workload]]] = {}
+    for name in strategy_names():
+        suite[f"roll_once/{name}"] = ("rolls", partial(roll_once_workload, [("Solo", name)], rolls, seed))
+    suite["roll_once/full-table"] = ("rolls", lambda: roll_once_workload(full_table(), rolls, seed))
+    suite["rules_engine.resolve_bet"] = ("bets", lambda: resolve_bet_workload(rolls, seed))
+    suite["table.settle_resolved_bets"] = ("calls", lambda: settle_workload(rolls, seed))
+    suite["serialize_event"] = ("events", lambda: serialize_workload(shared_events()))
+    suite["session_recorder.write"] = ("events", lambda: recorder_workload(shared_events()))
+    return suite
+
+
+def run_suite(
+    rolls: int = 2000,
+    repeat: int = 3,
+    seed: int = 4242,
+    only: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run every benchmark (or those whose name contains ``only``) and
+    return the JSON-ready report."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, (unit, factory) in workloads(rolls, seed).items():
+        if only and only not in name:
+            continue
+        workload = factory()
+        best: Optional[Tuple[int, float]] = None
+        for _ in range(repeat):
+            ops, seconds = workload()
+            if best is None or seconds < best[1]:
+                best = (ops, seconds)
+        assert best is not None
+        ops, seconds = best
+        results[name] = {
+            "unit": unit,
+            "ops": ops,
+            "seconds": seconds,
+            "ops_per_sec": ops / seconds if seconds > 0 else float("inf"),
+        }
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rolls": rolls,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, float]:
+    """Percent change in throughput per benchmark present in both reports
+    (negative = slower than the baseline)."""
+    changes: Dict[str, float] = {}
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before and before["ops_per_sec"] > 0:
+            changes[name] = 100.0 * (result["ops_per_sec"] / before["ops_per_sec"] - 1.0)
+    return changes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Engine hot-path benchmarks.")
+    parser.add_argument("--rolls", type=int, default=2000, help="roll budget per workload")
+    parser.add_argument("--repeat", type=int, default=3, help="timings per workload; best is kept")
+    parser.add_argument("--seed", type=int, default=4242)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--max-regression", type=float, default=None,
+        help="exit non-zero if any benchmark is more than PCT%% slower than the baseline",
+    )
+    args = parser.parse_args()
+
+    report = run_suite(rolls=args.rolls, repeat=args.repeat, seed=args.seed, only=args.only)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    changes: Dict[str, float] = {}
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        changes = compare(report, baseline)
+
+    # ASCII only: Windows consoles default to cp1252.
+    width = max((len(name) for name in report["results"]), default=0)
+    for name, result in report["results"].items():
+        line = f"{name:<{width}}  {result['ops_per_sec']:>14,.0f} {result['unit']}/s"
+        if name in changes:
+            line += f"  {changes[name]:+7.1f}% vs baseline"
+        print(line)
+
+    if args.max_regression is not None:
+        regressed = [name for name, pct in changes.items() if pct < -args.max_regression]
+        if regressed:
+            print(f"FAIL - slower than baseline by more than {args.max_regression}%: {', '.join(regressed)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""Vectorized batch engine: thousands of sessions per NumPy step.
+
+``CrapsEngine`` resolves one roll at a time through Python objects, which
+caps edge and ruin studies at a few million rolls. ``BatchEngine`` runs
+many independent sessions side by side as arrays — a dice matrix, point
+and shooter-count vectors, and per-player bankroll columns — for the
+stateless line/place/field/odds subset covered by ``PassLineV2``,
+``FieldV2``, ``PlaceV2`` and ``PassLineOddsV2``.
+
+Parity, not approximation: fed the same dice, every session ends on the
+same bankrolls, roll count and amount bet as the object engine. The
+kernels therefore mirror the engine's observed behavior, quirks included:
+
+- ``Player.balance`` only moves on settlement; placement validates
+  ``amount + chips already on the table <= balance`` (``Table.validate_bet``).
+- A failed placement aborts the rest of that strategy's specs this roll
+  (``Player.place_bet``), which matters for ``PlaceV2`` near ruin.
+- Pass line odds are ephemeral: swept every roll by
+  ``settle_resolved_bets`` and re-placed on the next point-phase roll.
+- Place bets only resolve in the point phase; a come-out roll leaves them
+  untouched whether they are off or working.
+
+Players seated together never interact (bets settle per owner and the
+shooter rotation does not touch the dice), so each player is one column
+evaluated against the session's shared dice.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from config import HOUSE_RULES
+from craps.house_rules import HouseRules
+from craps.player import Player
+from craps.rules import ODDS_MULTIPLIERS
+from craps.rules_engine import RulesEngine
+from craps.strategies.field_v2 import FieldV2
+from craps.strategies.pass_line_odds_v2 import PassLineOddsV2
+from craps.strategies.pass_line_v2 import PassLineV2
+from craps.strategies.place_v2 import PlaceV2
+from craps.strategy_contract import ContractStrategy, flat_bet_minimum
+
+IntArray = npt.NDArray[np.int64]
+BoolArray = npt.NDArray[np.bool_]
+
+BOX_NUMBERS = (4, 5, 6, 8, 9, 10)
+
+#: Strategies the batch kernels reproduce exactly.
+SUPPORTED_STRATEGIES = (PassLineV2, FieldV2, PlaceV2, PassLineOddsV2)
+
+
+def is_valid_amount(bet_type: str, amount: int, house_rules: HouseRules, number: Optional[int] = None) -> bool:
+    """Table.validate_bet's static checks (minimum, maximum, unit) for one
+    bet, evaluated once up front instead of on every roll."""
+    probe = RulesEngine.create_bet(bet_type, amount, Player("Batch"), number=number)
+    valid, _ = RulesEngine.validate_bet(
+        probe, probe.valid_phases[0], house_rules.table_minimum, house_rules.table_maximum
+    )
+    return valid
+
+
+class _Kernel:
+    """One player's strategy as array operations over all sessions."""
+
+    def __init__(self, num_sessions: int, house_rules: HouseRules) -> None:
+        self.num_sessions = num_sessions
+        self.house_rules = house_rules
+
+    def place(self, live: BoolArray, point: IntArray, balance: IntArray) -> None:
+        """Accept-bets stage: put chips down where the strategy wants them."""
+
+    def settle(self, live: BoolArray, point: IntArray, total: IntArray, balance: IntArray, wagered: IntArray) -> None:
+        """Resolve this roll against ``point`` as it stood before the roll."""
+
+
+class _PassLineKernel(_Kernel):
+    """Flat pass line, plus ephemeral point-phase odds when configured."""
+
+    def __init__(
+        self,
+        num_sessions: int,
+        house_rules: HouseRules,
+        bet_amount: int,
+        odds_amounts: Optional[Dict[int, int]] = None,
+    ) -> None:
+        super().__init__(num_sessions, house_rules)
+        self.bet_amount = bet_amount
+        self.line_valid = is_valid_amount("Pass Line", bet_amount, house_rules)
+        self.line = np.zeros(num_sessions, dtype=np.int64)
+        self.odds = np.zeros(num_sessions, dtype=np.int64)
+        # Indexed by point: odds amount, and its profit numerator/denominator.
+        self.odds_amount = np.zeros(13, dtype=np.int64)
+        self.odds_num = np.zeros(13, dtype=np.int64)
+        self.odds_den = np.ones(13, dtype=np.int64)
+        for point, amount in (odds_amounts or {}).items():
+            if is_valid_amount("Pass Line Odds", amount, house_rules):
+                self.odds_amount[point] = amount
+                self.odds_num[point], self.odds_den[point] = RulesEngine.get_payout_ratio("Pass Line Odds", point)
+
+    def place(self, live: BoolArray, point: IntArray, balance: IntArray) -> None:
+        if self.line_valid:
+            want = live & (point == 0) & (self.line == 0) & (self.bet_amount <= balance)
+            self.line[want] = self.bet_amount
+        odds_amount = self.odds_amount[point]
+        want = live & (point != 0) & (self.line > 0) & (odds_amount > 0)
+        want &= odds_amount + self.line <= balance
+        self.odds[want] = odds_amount[want]
+
+    def settle(self, live: BoolArray, point: IntArray, total: IntArray, balance: IntArray, wagered: IntArray) -> None:
+        on = live & (self.line > 0)
+        come_out = point == 0
+        won = on & np.where(come_out, (total == 7) | (total == 11), total == point)
+        lost = on & np.where(come_out, (total == 2) | (total == 3) | (total == 12), total == 7)
+        resolved = won | lost
+        balance += np.where(won, self.line, 0) - np.where(lost, self.line, 0)
+        wagered += np.where(resolved, self.line, 0)
+        self.line[resolved] = 0
+
+        # Odds ride with the line bet, then come down either way.
+        with_odds = self.odds > 0
+        odds_won = won & with_odds
+        odds_lost = lost & with_odds
+        profit = (self.odds * self.odds_num[point]) // self.odds_den[point]
+        balance += np.where(odds_won, profit, 0) - np.where(odds_lost, self.odds, 0)
+        wagered += np.where(odds_won | odds_lost, self.odds, 0)
+        self.odds[live] = 0
+
+
+class _FieldKernel(_Kernel):
+    """A single field bet kept up in every phase."""
+
+    def __init__(self, num_sessions: int, house_rules: HouseRules, amount: int) -> None:
+        super().__init__(num_sessions, house_rules)
+        self.amount = amount
+        self.valid = is_valid_amount("Field", amount, house_rules)
+        self.up = np.zeros(num_sessions, dtype=np.bool_)
+        # Profit per roll total for a winning field bet; 0 marks a loser.
+        self.profit = np.zeros(13, dtype=np.int64)
+        for roll in range(2, 13):
+            numerator, denominator = RulesEngine.get_win_ratio("Field", None, roll, house_rules)
+            self.profit[roll] = (amount * numerator) // denominator
+
+    def place(self, live: BoolArray, point: IntArray, balance: IntArray) -> None:
+        if self.valid:
+            self.up |= live & ~self.up & (self.amount <= balance)
+
+    def settle(self, live: BoolArray, point: IntArray, total: IntArray, balance: IntArray, wagered: IntArray) -> None:
+        on = live & self.up
+        profit = self.profit[total]
+        won = on & (profit > 0)
+        lost = on & (profit == 0)
+        balance += np.where(won, profit, 0) - np.where(lost, self.amount, 0)
+        wagered += np.where(on, self.amount, 0)
+        self.up &= ~lost
+        if not self.house_rules.leave_winning_bets_up:
+            self.up &= ~won
+
+
+class _PlaceKernel(_Kernel):
+    """Place bets across a number group, filled in order during the point."""
+
+    def __init__(self, num_sessions: int, house_rules: HouseRules, numbers: Sequence[int]) -> None:
+        super().__init__(num_sessions, house_rules)
+        self.numbers = list(numbers)
+        self.amounts = [flat_bet_minimum(house_rules.table_minimum, n) for n in self.numbers]
+        self.valid = [
+            is_valid_amount("Place", amount, house_rules, number)
+            for number, amount in zip(self.numbers, self.amounts)
+        ]
+        self.profits = []
+        for number, amount in zip(self.numbers, self.amounts):
+            numerator, denominator = RulesEngine.get_payout_ratio("Place", number)
+            self.profits.append((amount * numerator) // denominator)
+        self.up = np.zeros((len(self.numbers), num_sessions), dtype=np.bool_)
+
+    def _risk(self) -> IntArray:
+        risk = np.zeros(self.num_sessions, dtype=np.int64)
+        for i, amount in enumerate(self.amounts):
+            risk += np.where(self.up[i], amount, 0)
+        return risk
+
+    def place(self, live: BoolArray, point: IntArray, balance: IntArray) -> None:
+        pending = live & (point != 0)
+        if not pending.any():
+            return
+        risk = self._risk()
+        for i, amount in enumerate(self.amounts):
+            attempt = pending & ~self.up[i]
+            ok = attempt & (amount + risk <= balance) if self.valid[i] else np.zeros_like(attempt)
+            self.up[i] |= ok
+            risk += np.where(ok, amount, 0)
+            pending &= ~(attempt & ~ok)  # a refused spec aborts the rest
+
+    def settle(self, live: BoolArray, point: IntArray, total: IntArray, balance: IntArray, wagered: IntArray) -> None:
+        working = live & (point != 0)
+        seven = working & (total == 7)
+        for i, number in enumerate(self.numbers):
+            on = working & self.up[i]
+            won = on & (total == number)
+            lost = on & seven
+            balance += np.where(won, self.profits[i], 0) - np.where(lost, self.amounts[i], 0)
+            wagered += np.where(won | lost, self.amounts[i], 0)
+            self.up[i] &= ~lost
+            if not self.house_rules.leave_winning_bets_up:
+                self.up[i] &= ~won
+
+
+def odds_amounts(contract: PassLineOddsV2, table_minimum: int) -> Dict[int, int]:
+    """Odds ``contract`` lays behind each point on a line bet of
+    ``table_minimum``; points its multiple doesn't cover are left out."""
+    amounts: Dict[int, int] = {}
+    for point in BOX_NUMBERS:
+        if isinstance(contract.odds_multiple, str):
+            data = ODDS_MULTIPLIERS.get(contract.odds_multiple)
+            multiplier = data.get(point) if isinstance(data, dict) else data
+            if multiplier is None:
+                continue
+            amounts[point] = table_minimum * multiplier
+        else:
+            amounts[point] = table_minimum * contract.odds_multiple
+    return amounts
+
+
+def _kernel_for(contract: ContractStrategy, num_sessions: int, house_rules: HouseRules) -> _Kernel:
+    # Exact type checks: a subclass may override wants() with anything.
+    kind = type(contract)
+    if kind is PassLineV2:
+        assert isinstance(contract, PassLineV2)
+        return _PassLineKernel(num_sessions, house_rules, contract.bet_amount)
+    if kind is PassLineOddsV2:
+        assert isinstance(contract, PassLineOddsV2)
+        return _PassLineKernel(
+            num_sessions, house_rules, house_rules.table_minimum,
+            odds_amounts=odds_amounts(contract, house_rules.table_minimum),
+        )
+    if kind is FieldV2:
+        assert isinstance(contract, FieldV2)
+        return _FieldKernel(num_sessions, house_rules, contract.min_bet)
+    if kind is PlaceV2:
+        assert isinstance(contract, PlaceV2)
+        return _PlaceKernel(num_sessions, house_rules, contract.numbers)
+    raise ValueError(
+        f"BatchEngine has no kernel for {kind.__name__}; "
+        f"supported: {[cls.__name__ for cls in SUPPORTED_STRATEGIES]}"
+    )
+
+
+@dataclass
+class BatchResult:
+    """Per-session outcomes; player columns follow the strategy order."""
+    initial_bankroll: int
+    bankrolls: IntArray  # (sessions, players) final balances
+    wagered: IntArray    # (sessions, players) amount bet at resolution
+    rolls: IntArray      # (sessions,) rolls played
+    shooters: IntArray   # (sessions,) seven-outs completed
+    finished: BoolArray  # (sessions,) reached num_shooters before dice/max_rolls ran out
+
+    @property
+    def total_rolls(self) -> int:
+        return int(self.rolls.sum())
+
+    def house_edge(self) -> List[float]:
+        """Per-player realized edge in percent: bankroll lost over amount bet."""
+        net = (self.bankrolls - self.initial_bankroll).sum(axis=0)
+        bet = self.wagered.sum(axis=0)
+        return [(-float(n) / float(b)) * 100 if b else 0.0 for n, b in zip(net, bet)]
+
+
+class BatchEngine:
+    """Runs many independent sessions of the same lineup in lockstep.
+
+    A session ends after ``num_shooters`` seven-outs, exactly like
+    ``TableRunner.run``; ``max_rolls`` caps it early.
+    """
+
+    def __init__(
+        self,
+        strategies: Sequence[ContractStrategy],
+        house_rules: Optional[Dict[str, Any]] = None,
+        num_shooters: int = 10,
+        initial_bankroll: int = 500,
+        max_rolls: Optional[int] = None,
+    ) -> None:
+        self.strategies = list(strategies)
+        self.house_rules = HouseRules(house_rules or HOUSE_RULES)
+        self.num_shooters = num_shooters
+        self.initial_bankroll = initial_bankroll
+        self.max_rolls = max_rolls
+        for contract in self.strategies:
+            _kernel_for(contract, 0, self.house_rules)  # fail fast on unsupported strategies
+
+    def run(self, dice: npt.ArrayLike) -> BatchResult:
+        """Play a fixed dice matrix of shape (sessions, rolls, 2)."""
+        matrix = np.asarray(dice)
+        if matrix.ndim != 3 or matrix.shape[2] != 2:
+            raise ValueError(f"dice must have shape (sessions, rolls, 2), got {matrix.shape}")
+        state = _BatchState(self, matrix.shape[0])
+        state.play(matrix)
+        return state.result()
+
+    def run_random(
+        self,
+        num_sessions: int,
+        seed: Optional[int] = None,
+        block_rolls: int = 256,
+    ) -> BatchResult:
+        """Play freshly generated dice, in blocks, until every session ends."""
+        rng = np.random.default_rng(seed)
+        state = _BatchState(self, num_sessions)
+        while state.live.any():
+            state.play(rng.integers(1, 7, size=(num_sessions, block_rolls, 2), dtype=np.int8))
+        return state.result()
+
+
+class _BatchState:
+    """Mutable arrays for one batch run."""
+
+    def __init__(self, engine: BatchEngine, num_sessions: int) -> None:
+        self.engine = engine
+        self.kernels = [_kernel_for(c, num_sessions, engine.house_rules) for c in engine.strategies]
+        num_players = len(self.kernels)
+        self.balance = np.full((num_players, num_sessions), engine.initial_bankroll, dtype=np.int64)
+        self.wagered = np.zeros((num_players, num_sessions), dtype=np.int64)
+        self.point = np.zeros(num_sessions, dtype=np.int64)
+        self.rolls = np.zeros(num_sessions, dtype=np.int64)
+        self.shooters = np.zeros(num_sessions, dtype=np.int64)
+        self.live = np.full(num_sessions, engine.num_shooters > 0, dtype=np.bool_)
+
+    def play(self, dice: npt.NDArray[Any]) -> None:
+        max_rolls = self.engine.max_rolls
+        totals = dice.sum(axis=2, dtype=np.int64)
+        for r in range(totals.shape[1]):
+            live = self.live
+            if not live.any():
+                return
+            total = totals[:, r]
+            point = self.point
+            for i, kernel in enumerate(self.kernels):
+                kernel.place(live, point, self.balance[i])
+            for i, kernel in enumerate(self.kernels):
+                kernel.settle(live, point, total, self.balance[i], self.wagered[i])
+
+            # GameState.update_state, vectorized.
+            come_out = point == 0
+            sets_point = live & come_out & np.isin(total, BOX_NUMBERS)
+            point_hit = live & ~come_out & (total == point)
+            seven_out = live & ~come_out & (total == 7)
+            self.point = np.where(sets_point, total, np.where(point_hit | seven_out, 0, point))
+
+            self.rolls += live
+            self.shooters += seven_out
+            self.live = live & (self.shooters < self.engine.num_shooters)
+            if max_rolls is not None:
+                self.live &= self.rolls < max_rolls
+
+    def result(self) -> BatchResult:
+        return BatchResult(
+            initial_bankroll=self.engine.initial_bankroll,
+            bankrolls=self.balance.T.copy(),
+            wagered=self.wagered.T.copy(),
+            rolls=self.rolls,
+            shooters=self.shooters,
+            finished=self.shooters >= self.engine.num_shooters,
+        )
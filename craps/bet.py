@@ -2,8 +2,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 from craps.rules import BET_RULES
 import logging
+import sys
 
 if TYPE_CHECKING:
+    from craps.bet_store import BetStore
     from craps.player import Player
     from craps.rules_engine import RulesEngine
     from craps.play_by_play import PlayByPlay
@@ -14,6 +16,15 @@ class Bet:
 
     VALID_PHASES: List[str] = ["come-out", "point"]  # Ensures class-level definition
 
+    # A Bet is created for every chip placed; slots keep them compact.
+    # amount and status are properties so the BetStore holding the bet
+    # (``_store``) can keep its running risk totals current.
+    __slots__ = (
+        "bet_type", "_amount", "owner", "payout_ratio", "locked", "vig", "unit",
+        "valid_phases", "number", "_status", "parent_bet", "is_contract_bet",
+        "linked_bet", "resolved_payout", "hits", "_store",
+    )
+
     def __init__(
         self,
         bet_type: str,
@@ -35,8 +46,11 @@ class Bet:
 
         :param number: The number associated with the bet (e.g., 6 for Place 6 or (2,5) for Hop bets).
         """
-        self.bet_type: str = bet_type
-        self.amount: int = amount
+        # Interned so the hot-loop bet_type comparisons and dict lookups
+        # hit the identity fast path, whatever string the caller built.
+        self.bet_type: str = sys.intern(bet_type)
+        self._store: Optional[BetStore] = None
+        self._amount: int = amount
         self.owner: Player = owner
         self.payout_ratio: Tuple[int, int] = payout_ratio  # Ensuring payout is stored as a ratio tuple
         self.locked: bool = locked
@@ -44,13 +58,35 @@ class Bet:
         self.unit: int = unit
         self.valid_phases: List[str] = valid_phases if valid_phases is not None else self.VALID_PHASES
         self.number: Optional[Union[int, Tuple[int, int]]] = number  # ✅ Now supports both int and tuple
-        self.status: str = "active"
+        self._status: str = "active"
         self.parent_bet: Optional[Bet] = parent_bet
         self.is_contract_bet: bool = is_contract_bet  # Whether the bet is a contract bet
         self.linked_bet: Optional[Bet] = linked_bet
         self.resolved_payout: int = 0
         self.hits: int = hits
 
+    @property
+    def amount(self) -> int:
+        return self._amount
+
+    @amount.setter
+    def amount(self, value: int) -> None:
+        """Set the amount, keeping the holding table's risk totals current."""
+        if self._store is not None:
+            self._store._amount_changed(self, value - self._amount)
+        self._amount = value
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        """Set the status, keeping the holding table's active totals current."""
+        if self._store is not None and value != self._status:
+            self._store._status_changed(self, value)
+        self._status = value
+
     def resolve(
         self,
         rules_engine: RulesEngine,
@@ -0,0 +1,193 @@
+"""Indexed storage for the bets on a table.
+
+``Table.bets`` was a flat list, so every "this player's bets", "does he
+already have a Place 6" and "which odds ride on this bet" question was a
+scan of the whole table — and ``settle_resolved_bets`` asked the last one
+inside a scan, quadratic in the number of bets. With fifteen Iron Cross
+and 3-Point Molly players that scanning dominated the roll.
+
+``BetStore`` keeps the list's public behavior (iteration in placement
+order, ``len``, ``in``, indexing, ``append``/``remove``/``clear``) on top
+of insertion-ordered dicts keyed by object identity, plus three indexes:
+
+- per owner, in placement order,
+- per (owner, bet_type), for duplicate checks — ``number`` is filtered at
+  lookup time because Come bets change it while they sit on the table,
+- parent → children, for odds attached through ``parent_bet``.
+
+It also keeps running risk totals — the table total and, per owner, the
+total and the active amount — so ``Table.total_risk`` and the per-player
+at-risk figures published every roll cost O(1) instead of a scan. A bet
+on the table points back at its store and reports ``amount`` and
+``status`` changes (placement, removal, presses, on/off toggles) as they
+happen.
+
+Bets compare by identity everywhere in the engine (neither ``Bet`` nor
+``Player`` defines ``__eq__``), so identity keys change no semantics.
+Iteration walks a snapshot, so removing bets mid-loop is safe.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from craps.bet import Bet
+
+BetNumber = Optional[Union[int, Tuple[int, int]]]
+
+
+class BetStore:
+    def __init__(self, bets: Iterable[Bet] = ()) -> None:
+        self._bets: Dict[int, Bet] = {}
+        self._by_owner: Dict[int, Dict[int, Bet]] = {}
+        self._by_owner_type: Dict[Tuple[int, str], Dict[int, Bet]] = {}
+        self._children: Dict[int, Dict[int, Bet]] = {}
+        self._snapshot: Optional[Tuple[Bet, ...]] = ()
+        self._total_amount = 0
+        self._owner_amount: Dict[int, int] = {}
+        self._owner_active: Dict[int, int] = {}
+        for bet in bets:
+            self.append(bet)
+
+    # --- list protocol -------------------------------------------------
+
+    def _ordered(self) -> Tuple[Bet, ...]:
+        if self._snapshot is None:
+            self._snapshot = tuple(self._bets.values())
+        return self._snapshot
+
+    def __iter__(self) -> Iterator[Bet]:
+        return iter(self._ordered())
+
+    def __len__(self) -> int:
+        return len(self._bets)
+
+    def __bool__(self) -> bool:
+        return bool(self._bets)
+
+    def __contains__(self, bet: object) -> bool:
+        return id(bet) in self._bets and self._bets[id(bet)] is bet
+
+    @overload
+    def __getitem__(self, index: int) -> Bet: ...
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[Bet, ...]: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bet, Tuple[Bet, ...]]:
+        return self._ordered()[index]
+
+    def __repr__(self) -> str:
+        return f"BetStore({list(self._ordered())!r})"
+
+    def append(self, bet: Bet) -> None:
+        key = id(bet)
+        if key in self._bets:
+            raise ValueError(f"{bet} is already on the table")
+        self._bets[key] = bet
+        owner_key = id(bet.owner)
+        self._by_owner.setdefault(owner_key, {})[key] = bet
+        self._by_owner_type.setdefault((owner_key, bet.bet_type), {})[key] = bet
+        if bet.parent_bet is not None:
+            self._children.setdefault(id(bet.parent_bet), {})[key] = bet
+        self._snapshot = None
+        amount = bet.amount
+        self._total_amount += amount
+        self._owner_amount[owner_key] = self._owner_amount.get(owner_key, 0) + amount
+        if bet.status == "active":
+            self._owner_active[owner_key] = self._owner_active.get(owner_key, 0) + amount
+        bet._store = self
+
+    def extend(self, bets: Iterable[Bet]) -> None:
+        for bet in bets:
+            self.append(bet)
+
+    def remove(self, bet: Bet) -> None:
+        key = id(bet)
+        if self._bets.get(key) is not bet:
+            raise ValueError(f"{bet} is not on the table")
+        del self._bets[key]
+        owner_key = id(bet.owner)
+        self._discard(self._by_owner, owner_key, key)
+        self._discard(self._by_owner_type, (owner_key, bet.bet_type), key)
+        if bet.parent_bet is not None:
+            self._discard(self._children, id(bet.parent_bet), key)
+        self._snapshot = None
+        bet._store = None
+        if owner_key not in self._by_owner:
+            self._owner_amount.pop(owner_key, None)
+            self._owner_active.pop(owner_key, None)
+        else:
+            self._owner_amount[owner_key] -= bet.amount
+            if bet.status == "active":
+                self._owner_active[owner_key] -= bet.amount
+        self._total_amount -= bet.amount
+
+    def clear(self) -> None:
+        for bet in self._bets.values():
+            bet._store = None
+        self._bets.clear()
+        self._by_owner.clear()
+        self._by_owner_type.clear()
+        self._children.clear()
+        self._snapshot = ()
+        self._total_amount = 0
+        self._owner_amount.clear()
+        self._owner_active.clear()
+
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[int, Bet]], bucket_key: Any, key: int) -> None:
+        bucket = index.get(bucket_key)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del index[bucket_key]
+
+    # --- running totals (called by Bet's amount/status setters) ---------
+
+    def _amount_changed(self, bet: Bet, delta: int) -> None:
+        owner_key = id(bet.owner)
+        self._total_amount += delta
+        self._owner_amount[owner_key] += delta
+        if bet.status == "active":
+            self._owner_active[owner_key] += delta
+
+    def _status_changed(self, bet: Bet, status: str) -> None:
+        owner_key = id(bet.owner)
+        if bet.status == "active":
+            self._owner_active[owner_key] -= bet.amount
+        elif status == "active":
+            self._owner_active[owner_key] = self._owner_active.get(owner_key, 0) + bet.amount
+
+    # --- indexed lookups -----------------------------------------------
+
+    def for_owner(self, owner: Any) -> List[Bet]:
+        """The owner's bets, in placement order."""
+        bucket = self._by_owner.get(id(owner))
+        return list(bucket.values()) if bucket else []
+
+    def of_type(self, owner: Any, bet_type: str) -> List[Bet]:
+        """The owner's bets of one type, in placement order."""
+        bucket = self._by_owner_type.get((id(owner), bet_type))
+        return list(bucket.values()) if bucket else []
+
+    def find(self, owner: Any, bet_type: str, number: BetNumber = None, any_number: bool = False) -> Optional[Bet]:
+        """The owner's first bet of this type on ``number`` (or on any
+        number with ``any_number``), or None."""
+        bucket = self._by_owner_type.get((id(owner), bet_type))
+        if not bucket:
+            return None
+        for bet in bucket.values():
+            if any_number or bet.number == number:
+                return bet
+        return None
+
+    def children(self, parent: Bet) -> List[Bet]:
+        """Bets placed with ``parent_bet=parent`` (odds), in placement order."""
+        bucket = self._children.get(id(parent))
+        return list(bucket.values()) if bucket else []
+
+    def owner_total(self, owner: Any, active_only: bool = False) -> int:
+        """Sum of the owner's bet amounts (optionally only active bets)."""
+        totals = self._owner_active if active_only else self._owner_amount
+        return totals.get(id(owner), 0)
+
+    def total(self) -> int:
+        """Sum of every bet amount on the table."""
+        return self._total_amount
@@ -64,9 +64,7 @@ class CommonTableSetup:
         :return: The created bet.
         """
         if bet_type == "Come Odds":
-            come_bet = next(
-                (bet for bet in self.table.bets if bet.bet_type == "Come" and bet.owner == self.player), None
-            )
+            come_bet = self.table.bets.find(self.player, "Come", any_number=True)
             if come_bet is None or come_bet.number is None:
                 raise ValueError("Cannot place Come Odds bet without an active Come bet with a number.")
             number = come_bet.number
@@ -0,0 +1,141 @@
+"""Precompiled bet resolution tables.
+
+``RulesEngine.resolve_bet`` re-derives everything on every call: it walks
+``BET_RULES`` through ``get_bet_rules``, copies the rule dicts and rebuilds
+the phase-keyed win/lose lookups — once per bet per roll. For most bet
+types the outcome is a pure function of (bet_type, number, point, dice),
+so ``CompiledRules`` evaluates that function once per table configuration
+and turns resolution into a single dict lookup.
+
+The tables are built by *probing* ``RulesEngine.resolve_bet`` itself over
+every reachable key, so the compiled path cannot drift from the reference
+resolver — quirks included. Bets whose outcome depends on more than the
+key (odds follow their parent bet, ATS reads the shooter's hit tracking)
+and bet types the resolver does not handle miss the table and fall back
+to ``resolve_bet`` unchanged.
+"""
+from __future__ import annotations
+from itertools import product
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, cast
+
+from craps.bet import Bet
+from craps.game_state import GameState
+from craps.player import Player
+from craps.rules_engine import RulesEngine
+
+BetNumber = Optional[Union[int, Tuple[int, int]]]
+
+#: (bet_type, number, point, die_1, die_2) — point None is the come-out.
+ResolutionKey = Tuple[str, BetNumber, Optional[int], int, int]
+
+BOX_NUMBERS = (4, 5, 6, 8, 9, 10)
+POINTS: Tuple[Optional[int], ...] = (None, *BOX_NUMBERS)
+DIE_FACES = range(1, 7)
+
+#: Bet types whose resolution depends only on the resolution key. Everything
+#: else (odds, All/Tall/Small, untabulated types) resolves dynamically.
+COMPILED_BET_TYPES = (
+    "Pass Line", "Don't Pass", "Come", "Don't Come",
+    "Field", "Place", "Buy", "Lay",
+    "Proposition", "Any Craps", "Horn", "World", "Hardways", "Hop",
+)
+
+
+class CompiledOutcome(NamedTuple):
+    """What one roll does to an active bet: the new status (None = no
+    change) and, for wins, the profit ratio applied to the bet amount."""
+    status: Optional[str]
+    numerator: int = 0
+    denominator: int = 1
+
+
+def _numbers_for(bet_type: str) -> List[BetNumber]:
+    """Every number a live bet of this type can carry."""
+    if bet_type in ("Come", "Don't Come"):
+        return [None, *BOX_NUMBERS]  # before and after travelling
+    valid_numbers = RulesEngine.get_bet_rules(bet_type).get("valid_numbers")
+    if valid_numbers is None:
+        return [None]
+    return list(valid_numbers)
+
+
+class CompiledRules:
+    """Resolution lookup table for one house-rules configuration.
+
+    Build through ``compile_rules`` so tables sharing a configuration
+    share one compiled instance.
+    """
+
+    def __init__(self, house_rules: Optional[Any] = None) -> None:
+        self.house_rules = house_rules
+        self.table: Dict[ResolutionKey, CompiledOutcome] = {}
+        probe_state = GameState(stats=None)
+        for bet_type in COMPILED_BET_TYPES:
+            for number in _numbers_for(bet_type):
+                for point, die_1, die_2 in product(POINTS, DIE_FACES, DIE_FACES):
+                    probe_state.point = point
+                    outcome = self._probe(bet_type, number, (die_1, die_2), probe_state)
+                    if outcome is not None:
+                        self.table[(bet_type, number, point, die_1, die_2)] = outcome
+
+    def _probe(
+        self,
+        bet_type: str,
+        number: BetNumber,
+        dice: Tuple[int, int],
+        game_state: GameState,
+    ) -> Optional[CompiledOutcome]:
+        """Run the reference resolver on a throwaway bet and record the result."""
+        probe = Bet(bet_type, 1, cast(Player, None), (1, 1), number=number)
+        RulesEngine.resolve_bet(probe, dice, game_state, self.house_rules)
+        if probe.number != number:
+            return None  # resolver repositioned the bet: not a table entry
+        if probe.status == "active":
+            return CompiledOutcome(None)
+        if probe.status != "won":
+            return CompiledOutcome(probe.status)
+        numerator, denominator = RulesEngine.get_win_ratio(
+            bet_type, number, sum(dice), self.house_rules
+        )
+        return CompiledOutcome("won", numerator, denominator)
+
+    def lookup(self, bet: Bet, dice_outcome: Tuple[int, int], game_state: GameState) -> Optional[CompiledOutcome]:
+        """The compiled outcome for this bet and roll, or None if uncompiled."""
+        return self.table.get(
+            (bet.bet_type, bet.number, game_state.point, dice_outcome[0], dice_outcome[1])
+        )
+
+    def resolve(self, bet: Bet, dice_outcome: Tuple[int, int], game_state: GameState) -> None:
+        """Drop-in for ``Bet.resolve``: update status and resolved_payout."""
+        if bet.status != "active":
+            bet.resolved_payout = 0
+            return
+        outcome = self.lookup(bet, dice_outcome, game_state)
+        if outcome is None:
+            bet.resolved_payout = RulesEngine.resolve_bet(bet, dice_outcome, game_state, self.house_rules)
+            return
+        if outcome.status is None:
+            bet.resolved_payout = 0
+            return
+        bet.status = outcome.status
+        bet.resolved_payout = (bet.amount * outcome.numerator) // outcome.denominator
+
+
+_compiled: Dict[Optional[Tuple[int, int]], CompiledRules] = {}
+
+
+def compile_rules(house_rules: Optional[Any] = None) -> CompiledRules:
+    """Return the (cached) compiled tables for a house-rules configuration.
+
+    Only the Field 2/12 multiples change resolution outcomes, so they are
+    the cache key; every other flag shares the same tables.
+    """
+    key = (
+        (house_rules.field_bet_payout_2, house_rules.field_bet_payout_12)
+        if house_rules is not None
+        else None
+    )
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = CompiledRules(house_rules)
+    return compiled
@@ -28,6 +28,7 @@ from craps.events import (
     BankrollsUpdated,
     RiskUpdated,
     SevenOut,
+    SessionFinalized,
 )
 
 if TYPE_CHECKING:
@@ -110,6 +111,7 @@ class PlayByPlayConsumer:
         bus.subscribe(DiceRolled, self._on_dice_rolled)        # type: ignore[arg-type]
         bus.subscribe(NumberHit, self._on_number_hit)          # type: ignore[arg-type]
         bus.subscribe(GameStateChanged, self._on_state)        # type: ignore[arg-type]
+        bus.subscribe(SessionFinalized, self._on_finalized)    # type: ignore[arg-type]
 
     def _on_bets_requested(self, e: BetsRequested) -> None:
         self.play_by_play.write("  ---------- Place Your Bets! -------------")
@@ -129,6 +131,9 @@ class PlayByPlayConsumer:
     def _on_state(self, e: GameStateChanged) -> None:
         self.play_by_play.write(e.message)
 
+    def _on_finalized(self, e: SessionFinalized) -> None:
+        self.play_by_play.close()
+
 
 class RollHistoryConsumer:
     """Appends each roll to the session roll-history list."""
@@ -155,7 +160,10 @@ def attach_default_consumers(engine: Any) -> None:
 
     Subscription order matters: stats first, so play-by-play narration on
     the same event observes updated statistics if it ever needs them.
+    Quiet engines write no narration, so the play-by-play consumer is left
+    off and the events only it reads are never built.
     """
     StatsConsumer(engine.stats, engine.player_lineup.get_active_players_list).subscribe(engine.events)
-    PlayByPlayConsumer(engine.play_by_play).subscribe(engine.events)
+    if not engine.quiet_mode:
+        PlayByPlayConsumer(engine.play_by_play).subscribe(engine.events)
     RollHistoryConsumer(engine.roll_history).subscribe(engine.events)
@@ -1,17 +1,18 @@
 from __future__ import annotations
 import sys
 import os
+import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from typing import Optional, Any, NamedTuple
 from config import HOUSE_RULES, ACTIVE_PLAYERS
 from craps.house_rules import HouseRules
 from craps.log_manager import LogManager
-from craps.play_by_play import PlayByPlay
+from craps.play_by_play import PlayByPlay, narrating
 from craps.rules_engine import RulesEngine
 from craps.session_initializer import InitializeSession
 from craps.lineup import PlayerLineup
-from craps.dice import Dice
+from craps.dice import CLASSIC_RNG, Dice
 from craps.table import Table
 from craps.roll_history_manager import RollHistoryManager
 from craps.statistics import Statistics
@@ -20,6 +21,7 @@ from craps.player import Player
 from craps.view_log import InteractiveLogViewer
 from craps.statistics_report import StatisticsReport
 from craps.visualizer import Visualizer
+from craps.profiler import RollProfiler
 from craps.events import (
     EventBus,
     SessionStarted,
@@ -80,6 +82,8 @@ class CrapsEngine:
         self._report_writer: Optional[StatisticsReport] = None
         self.play_by_play = PlayByPlay(engine=self)
         self.events = EventBus()
+        #: Set by TableRunner when profiling; splits resolve_bets timing.
+        self.profiler: Optional[RollProfiler] = None
         
     @property
     def quiet_mode(self) -> bool:
@@ -105,6 +109,7 @@ class CrapsEngine:
         dice_mode: str = "live", # "live" or "history"
         roll_history_file: Optional[str] = None,
         dice_seed: Optional[int] = None,
+        dice_rng_version: int = CLASSIC_RNG,
     ) -> bool:
         """
         Initializes core game components and prepares the session.
@@ -119,7 +124,7 @@ class CrapsEngine:
         if dice_mode == "history" and roll_history_file:
             self.dice = Dice(roll_history_file)
         else:
-            self.dice = Dice(seed=dice_seed)
+            self.dice = Dice(seed=dice_seed, rng_version=dice_rng_version)
 
         # ✅ Initialize Session
         session_initializer = InitializeSession(
@@ -193,12 +198,18 @@ class CrapsEngine:
         if not self.play_by_play or not self.game_state or not self.table or not self.player_lineup:
             return 0
 
-        self.events.publish(BetsRequested())
+        events = self.events
+        if events.has_subscribers(BetsRequested):
+            events.publish(BetsRequested())
         total_bets = 0
+        publish_placed = events.has_subscribers(BetPlaced)
 
         # Strategy status specs at collection time reshape live bets in
         # place (e.g. hardway reactivation) without going through place_bet.
-        statuses_before = [(bet, bet.status) for bet in self.table.bets]
+        statuses_before = (
+            [(bet, bet.status) for bet in self.table.bets]
+            if events.has_subscribers(BetStatusChanged) else []
+        )
 
         for player in self.player_lineup.get_active_players_list():
             if not player.betting_strategy:
@@ -211,7 +222,7 @@ class CrapsEngine:
             )
 
             if bets:
-                on_table_before = {id(b) for b in self.table.bets}
+                placed_before = len(self.table.bets)
                 success = player.place_bet(
                     bets,
                     table=self.table,
@@ -223,18 +234,20 @@ class CrapsEngine:
                 # Publish what actually landed, not what was requested:
                 # place_bet aborts mid-list on a failure without rolling
                 # back the bets already placed, and those chips are live.
-                for bet in self.table.bets:
-                    if id(bet) not in on_table_before:
-                        self.events.publish(BetPlaced(
-                            player_name=player.name,
-                            bet_type=bet.bet_type,
-                            amount=bet.amount,
-                            number=bet.number,
-                        ))
+                # Placement only appends, so the new bets are the tail.
+                if not publish_placed:
+                    continue
+                for bet in self.table.bets[placed_before:]:
+                    events.publish(BetPlaced(
+                        player_name=player.name,
+                        bet_type=bet.bet_type,
+                        amount=bet.amount,
+                        number=bet.number,
+                    ))
 
         for bet, old_status in statuses_before:
             if bet.status != old_status:
-                self.events.publish(BetStatusChanged(
+                events.publish(BetStatusChanged(
                     player_name=bet.owner.name,
                     bet_type=bet.bet_type,
                     number=bet.number,
@@ -247,10 +260,12 @@ class CrapsEngine:
         if not (self.dice and self.stats and self.table and self.play_by_play and self.roll_history_manager and self.game_state and self.player_lineup):
             raise RuntimeError("SessionManager missing required components for rolling dice.")
 
+        outcome = self.dice.roll()
+        if not self.events.has_subscribers(DiceRolled):
+            return outcome
+
         shooter_name = self.game_state.shooter.name if self.game_state.shooter else f"Shooter {self.shooter_index + 1}"
         roll_num = self.stats.session_rolls + 1  # next roll
-
-        outcome = self.dice.roll()
         total = sum(outcome)
 
         self.events.publish(DiceRolled(
@@ -270,12 +285,14 @@ class CrapsEngine:
         if not (self.table and self.game_state and self.stats and self.play_by_play and self.house_rules):
             raise RuntimeError("Missing components for resolving bets.")
 
+        events = self.events
+
         # Step 0: Update ATS tracking
         total = sum(outcome)
         if total != 7:
             ats_message = self.game_state.record_number_hit(total)
-            if ats_message:
-                self.events.publish(NumberHit(total=total, message=ats_message))
+            if ats_message and events.has_subscribers(NumberHit):
+                events.publish(NumberHit(total=total, message=ats_message))
         
         # Snapshot number-fill candidates so travel is observable after
         # settlement (the mutation itself happens deep in resolution).
@@ -283,19 +300,31 @@ class CrapsEngine:
             id(bet)
             for bet in self.table.bets
             if bet.bet_type in _NUMBER_FILL_BET_TYPES and bet.number is None
-        }
+        } if events.has_subscribers(BetMoved) else set()
+
+        profiler = self.profiler
+        if profiler is not None:
+            started = time.perf_counter()
 
         # Step 1: Check active bets
         self.table.check_bets(outcome, self.game_state)
+        if profiler is not None:
+            now = time.perf_counter()
+            profiler.add_phase("resolve_bets.check", now - started)
+            started = now
 
         # Step 2: Settle resolved bets
         resolved_bets = self.table.settle_resolved_bets()
+        if profiler is not None:
+            now = time.perf_counter()
+            profiler.add_phase("resolve_bets.settle", now - started)
+            started = now
 
         # Step 2b: Publish bets that acquired their number and stayed up
         # (Come/Don't Come travel, odds attaching to the point).
-        for bet in self.table.bets:
+        for bet in self.table.bets if unfilled_numbers else ():
             if id(bet) in unfilled_numbers and isinstance(bet.number, int):
-                self.events.publish(BetMoved(
+                events.publish(BetMoved(
                     player_name=bet.owner.name,
                     bet_type=bet.bet_type,
                     amount=bet.amount,
@@ -303,17 +332,19 @@ class CrapsEngine:
                 ))
 
         # Step 3: Publish resolutions (stats consumer keeps the ledger)
+        publish_resolved = events.has_subscribers(BetResolved)
         for bet in resolved_bets:
-            self.events.publish(BetResolved(
-                player_name=bet.owner.name,
-                bet_type=bet.bet_type,
-                amount=bet.amount,
-                number=bet.number,
-                status=bet.status,
-                payout=bet.resolved_payout,
-                win_payout=bet.payout(),
-                removed=not any(b is bet for b in self.table.bets),
-            ))
+            if publish_resolved:
+                events.publish(BetResolved(
+                    player_name=bet.owner.name,
+                    bet_type=bet.bet_type,
+                    amount=bet.amount,
+                    number=bet.number,
+                    status=bet.status,
+                    payout=bet.resolved_payout,
+                    win_payout=bet.payout(),
+                    removed=bet not in self.table.bets,
+                ))
 
             # Step 4: Notify strategy if bet won
             if bet.status == "won":
@@ -322,9 +353,13 @@ class CrapsEngine:
                 if strategy and hasattr(strategy, "notify_payout"):
                     strategy.notify_payout(payout)
 
+        if profiler is not None:
+            profiler.add_phase("resolve_bets.publish", time.perf_counter() - started)
+
         # Step 5: Update game state
         state_message = self.game_state.update_state(outcome)
-        self.events.publish(GameStateChanged(message=state_message))
+        if events.has_subscribers(GameStateChanged):
+            events.publish(GameStateChanged(message=state_message))
 
         # Step 6: Adjust strategy bets
         self.adjust_bets()
@@ -334,13 +369,17 @@ class CrapsEngine:
         if not self.game_state or not self.player_lineup or not self.table:
             raise RuntimeError("Missing game components for adjusting bets.")
 
+        events = self.events
+        publish_adjusted = events.has_subscribers(BetAdjusted)
         players = self.player_lineup.get_active_players_list()
         for player in players:
             strategy = getattr(player, "betting_strategy", None)
             if strategy and hasattr(strategy, "adjust_bets"):
                 changed = strategy.adjust_bets(self.game_state, player, self.table)
+                if not publish_adjusted:
+                    continue
                 for bet in changed or ():
-                    self.events.publish(BetAdjusted(
+                    events.publish(BetAdjusted(
                         player_name=bet.owner.name,
                         bet_type=bet.bet_type,
                         amount=bet.amount,
@@ -348,8 +387,8 @@ class CrapsEngine:
                         status=bet.status,
                     ))
 
-        if self.stats:
-            self.events.publish(BankrollsUpdated(
+        if self.stats and events.has_subscribers(BankrollsUpdated):
+            events.publish(BankrollsUpdated(
                 bankrolls=tuple((p.name, p.balance) for p in players),
             ))
 
@@ -386,7 +425,11 @@ class CrapsEngine:
         if not self.table or not self.game_state or not self.house_rules:
             return
 
-        statuses_before = [(bet, bet.status) for bet in self.table.bets]
+        events = self.events
+        statuses_before = (
+            [(bet, bet.status) for bet in self.table.bets]
+            if events.has_subscribers(BetStatusChanged) else []
+        )
 
         for bet in self.table.bets:
             strategy = getattr(bet.owner, "betting_strategy", None)
@@ -407,18 +450,18 @@ class CrapsEngine:
 
         for bet, old_status in statuses_before:
             if bet.status != old_status:
-                self.events.publish(BetStatusChanged(
+                events.publish(BetStatusChanged(
                     player_name=bet.owner.name,
                     bet_type=bet.bet_type,
                     number=bet.number,
                     status=bet.status,
                 ))
 
-        if self.stats and self.player_lineup:
-            self.events.publish(RiskUpdated(at_risk=tuple(
+        if self.stats and self.player_lineup and events.has_subscribers(RiskUpdated):
+            events.publish(RiskUpdated(at_risk=tuple(
                 (
                     player.name,
-                    sum(b.amount for b in self.table.bets if b.owner == player and b.status == "active"),
+                    self.table.bets.owner_total(player, active_only=True),
                 )
                 for player in self.player_lineup.get_active_players_list()
             )))
@@ -504,6 +547,7 @@ class CrapsEngine:
 
         # View the play-by-play log
         if not self.quiet_mode:
+            play_by_play.close()
             log_viewer = InteractiveLogViewer()
             log_viewer.view(play_by_play.play_by_play_file)
 
@@ -549,11 +593,11 @@ class CrapsEngine:
         return stats
 
     def log_player_bets(self) -> None:
-        if not self.player_lineup or not self.table or not self.play_by_play:
+        if not self.player_lineup or not self.table or not narrating(self.play_by_play):
             return
 
         for player in self.player_lineup.get_active_players_list():
-            remaining_bets = [b for b in self.table.bets if b.owner == player]
+            remaining_bets = self.table.bets.for_owner(player)
             if remaining_bets:
                 summary = ", ".join(
                     f"{b.bet_type} {b.number} (${b.amount} {b.status})" if b.number is not None else f"{b.bet_type} (${b.amount} {b.status})"
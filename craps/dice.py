@@ -1,53 +1,98 @@
 import csv
 import random
 import os
-from typing import Optional, List, Dict, Tuple, cast
+from typing import Dict, Iterator, Optional, List, Tuple
 from collections import deque
 
+import numpy as np
+
+from craps.roll_store import RollStore, is_roll_store
+
+#: Dice RNG versions. A seed only reproduces a roll sequence under the
+#: version it was recorded with, so the version travels with the seed.
+#: 1 — random.Random, two randint(1, 6) calls per roll (goldens, recordings).
+#: 2 — NumPy PCG64, pairs drawn in blocks and handed out from a buffer.
+CLASSIC_RNG = 1
+FAST_RNG = 2
+RNG_VERSIONS = (CLASSIC_RNG, FAST_RNG)
+
+DEFAULT_BUFFER_SIZE = 4096
+
+#: ``.rolls`` dice byte (``die1 << 4 | die2``) -> the (die1, die2) pair.
+_DICE_BY_CODE: Dict[int, Tuple[int, int]] = {
+    die1 << 4 | die2: (die1, die2) for die1 in range(1, 7) for die2 in range(1, 7)
+}
+
 class Dice:
-    def __init__(self, roll_history_file: Optional[str] = None, seed: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        roll_history_file: Optional[str] = None,
+        seed: Optional[int] = None,
+        rng_version: int = CLASSIC_RNG,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
         """
         Initialize the Dice class.
 
-        :param roll_history_file: Path to a CSV file containing roll history. If None, rolls are random.
+        :param roll_history_file: Path to a ``.rolls`` (or legacy CSV) roll history. If None, rolls are random.
         :param seed: Seed for a private RNG. Same seed → identical roll sequence.
                      When None, rolls use the global random module (legacy behavior).
+        :param rng_version: CLASSIC_RNG, or FAST_RNG for buffered block generation.
+        :param buffer_size: Rolls generated per block in FAST_RNG mode.
         """
+        if rng_version not in RNG_VERSIONS:
+            raise ValueError(f"Unknown dice RNG version {rng_version}; expected one of {RNG_VERSIONS}")
         self.values: Tuple[int, int] = (1, 1)  # Ensure this is a fixed-size tuple
-        self._rng: Optional[random.Random] = random.Random(seed) if seed is not None else None
+        self.rng_version = rng_version
+        self._rng: Optional[random.Random] = None
+        self._generator: Optional[np.random.Generator] = None
+        if rng_version == FAST_RNG:
+            self._generator = np.random.default_rng(seed)
+        elif seed is not None:
+            self._rng = random.Random(seed)
+        self.buffer_size = buffer_size
+        self._buffer: List[Tuple[int, int]] = []
+        self._cursor = 0
         self.roll_history_file: Optional[str] = roll_history_file
-        self.roll_history: List[Dict[str, int | Tuple[int, int]]] = []
+        # History mode streams rolls from disk: a .rolls file through its
+        # memory map, a legacy CSV row by row. Nothing is held beyond the
+        # current block, so a recording of any length plays in constant memory.
+        self._history: Optional[Iterator[Tuple[int, int]]] = None
         self.current_roll_index: int = 0
         self.forced_rolls: deque[Tuple[int, int]] = deque()
-        self.current_roll_index = 0
 
         if self.roll_history_file:
             self._load_roll_history()
 
     def _load_roll_history(self) -> None:
-        """Load roll history from a CSV file."""
+        """Open a ``.rolls`` file or a legacy CSV file for history mode."""
         if not self.roll_history_file:
             return  # Prevent passing None to open()
 
         if not os.path.exists(self.roll_history_file):
             raise FileNotFoundError(f"Roll history file '{self.roll_history_file}' not found.")
 
-        with open(self.roll_history_file, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Convert dice and total to proper types
+        if is_roll_store(self.roll_history_file):
+            self._history = self._stream_roll_store(self.roll_history_file)
+        else:
+            self._history = self._stream_csv(self.roll_history_file)
+
+    def _stream_roll_store(self, path: str) -> Iterator[Tuple[int, int]]:
+        """Decode the dice column of a ``.rolls`` file a block at a time."""
+        codes = RollStore(path).records["dice"]
+        for start in range(0, len(codes), self.buffer_size):
+            for code in codes[start:start + self.buffer_size].tolist():
+                yield _DICE_BY_CODE[code]
+
+    @staticmethod
+    def _stream_csv(path: str) -> Iterator[Tuple[int, int]]:
+        """Parse a legacy CSV roll history one row per roll."""
+        with open(path, 'r', newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
                 dice_list = row["dice"].strip('[]').split(', ')
                 if len(dice_list) != 2:
                     raise ValueError(f"Invalid dice format in roll history: {row['dice']}")
-                
-                dice: Tuple[int, int] = (int(dice_list[0]), int(dice_list[1]))  # Ensure exactly two values
-                total: int = int(row["total"])
-                shooter_num: int = int(row["shooter_num"])
-                self.roll_history.append({
-                    "dice": dice,
-                    "total": total,
-                    "shooter_num": shooter_num
-                })
+                yield (int(dice_list[0]), int(dice_list[1]))
 
     def roll(self) -> Tuple[int, int]:
         """Forced Rolls used for testing"""
@@ -55,21 +100,31 @@ class Dice:
             self.values = self.forced_rolls.popleft()
             return self.values
         """Roll the dice. If roll history is loaded, use the next roll from the history."""
-        if self.roll_history:
-            if self.current_roll_index >= len(self.roll_history):
+        if self._history is not None:
+            values = next(self._history, None)
+            if values is None:
                 raise IndexError("No more rolls in the history.")
-            roll = self.roll_history[self.current_roll_index]
-            dice = cast(Tuple[int, int], roll["dice"])
-            if len(dice) != 2:
-                raise ValueError(f"Invalid dice format in roll history: {roll['dice']}")
-
-            self.values = dice  # Ensure it's a valid (int, int) tuple
+            self.values = values
             self.current_roll_index += 1
         else:
             """ Generate random rolls if no history is loaded """
-            if self._rng is not None:
+            if self._generator is not None:
+                if self._cursor >= len(self._buffer):
+                    self._refill()
+                self.values = self._buffer[self._cursor]
+                self._cursor += 1
+            elif self._rng is not None:
                 self.values = (self._rng.randint(1, 6), self._rng.randint(1, 6))
             else:
                 self.values = (random.randint(1, 6), random.randint(1, 6))  # Ensure it's a tuple
         
         return self.values
+
+    def _refill(self) -> None:
+        """Draw the next block of pairs for FAST_RNG mode."""
+        assert self._generator is not None
+        # int32 draws one 32-bit word per die, so the stream is the same
+        # whatever the block size; int8 would pack draws per block.
+        block = self._generator.integers(1, 7, size=(self.buffer_size, 2), dtype=np.int32)
+        self._buffer = list(map(tuple, block.tolist()))
+        self._cursor = 0
@@ -3,28 +3,28 @@ from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """Base class for all engine events."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionStarted(Event):
     num_shooters: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShooterAssigned(Event):
     shooter_index: int
     shooter_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetsRequested(Event):
     """The engine is about to collect bets from strategies."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetPlaced(Event):
     player_name: str
     bet_type: str
@@ -32,7 +32,7 @@ class BetPlaced(Event):
     number: Optional[Union[int, Tuple[int, int]]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiceRolled(Event):
     shooter_index: int
     roll_number: int
@@ -44,7 +44,7 @@ class DiceRolled(Event):
     shooter_name: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetResolved(Event):
     player_name: str
     bet_type: str
@@ -61,7 +61,7 @@ class BetResolved(Event):
     removed: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetMoved(Event):
     """A bet acquired its number after placement: Come/Don't Come travel,
     or an odds bet attaching to the established point."""
@@ -71,7 +71,7 @@ class BetMoved(Event):
     number: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetAdjusted(Event):
     """A live bet was reshaped between rolls (pressing/regression or an
     on/off flip requested by the strategy)."""
@@ -82,7 +82,7 @@ class BetAdjusted(Event):
     status: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetStatusChanged(Event):
     """A live bet's working status changed outside resolution (phase
     refresh or a strategy status spec at bet-collection time)."""
@@ -92,49 +92,49 @@ class BetStatusChanged(Event):
     status: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NumberHit(Event):
     """ATS tracking recorded a number this roll (message pre-formatted)."""
     total: int
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameStateChanged(Event):
     """Phase/point transition after resolution (message pre-formatted)."""
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BankrollsUpdated(Event):
     """Per-player bankrolls after post-roll adjustments, in lineup order."""
     bankrolls: Tuple[Tuple[str, int], ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskUpdated(Event):
     """Per-player active amounts at risk after status refresh, in lineup order."""
     at_risk: Tuple[Tuple[str, int], ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PointEstablished(Event):
     point: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PointHit(Event):
     point: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SevenOut(Event):
     shooter_index: int
     #: Per-player bankroll delta over this shooter's hand, in lineup order.
     shooter_results: Tuple[Tuple[str, int], ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionFinalized(Event):
     session_rolls: int
 
@@ -149,17 +149,42 @@ class EventBus:
     that class or any subclass — subscribing to ``Event`` observes the full
     stream. Dispatch is synchronous and in subscription order, keeping
     session runs deterministic.
+
+    Publishers on hot paths ask ``has_subscribers`` first and skip building
+    events (and the snapshots they are derived from) that nobody consumes.
     """
 
     def __init__(self) -> None:
         self._handlers: Dict[Type[Event], List[EventHandler]] = {}
+        # Concrete event class -> every handler it reaches, in dispatch
+        # order (own class first, then up the MRO). Built on first publish,
+        # dropped whenever a subscription changes.
+        self._dispatch: Dict[Type[Event], Tuple[EventHandler, ...]] = {}
 
     def subscribe(self, event_type: Type[Event], handler: EventHandler) -> None:
         self._handlers.setdefault(event_type, []).append(handler)
+        self._dispatch.clear()
+
+    def _handlers_for(self, event_type: Type[Event]) -> Tuple[EventHandler, ...]:
+        handlers = tuple(
+            handler
+            for cls in event_type.__mro__
+            if cls is not object
+            for handler in self._handlers.get(cls, ())
+        )
+        self._dispatch[event_type] = handlers
+        return handlers
+
+    def has_subscribers(self, event_type: Type[Event]) -> bool:
+        """Whether publishing an ``event_type`` would reach any handler."""
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = self._handlers_for(event_type)
+        return bool(handlers)
 
     def publish(self, event: Event) -> None:
-        for cls in type(event).__mro__:
-            if cls is object:
-                continue
-            for handler in self._handlers.get(cls, ()):
-                handler(event)
+        handlers = self._dispatch.get(type(event))
+        if handlers is None:
+            handlers = self._handlers_for(type(event))
+        for handler in handlers:
+            handler(event)
@@ -0,0 +1,336 @@
+"""Fast-forward engine: line-bet sessions one decision at a time.
+
+A pass line bet only cares about two things: the come-out total, and —
+once a point is set — whether the point or a seven comes first and how
+many rolls that takes. Both have closed forms (``WAYS`` and
+``p_before_seven`` in ``craps.edge``): the come-out total is one of 36
+equally likely dice pairs, the point phase lasts a geometric number of
+rolls with per-roll resolution chance ``(ways + 6) / 36``, and it ends on
+the point with probability ``p_before_seven``. ``FastForwardEngine``
+samples exactly that, so a shooter's hand costs a few draws per line
+decision instead of a trip through ``CrapsEngine`` for every roll — the
+tool for bankroll-ruin studies over millions of hands.
+
+It covers the strategies whose behavior is fully determined by those
+decisions, ``PassLineV2`` and ``PassLineOddsV2``, with the engine's
+observed rules (the same ones ``BatchEngine`` mirrors): the line goes up
+on the come-out if the bankroll covers it; odds ride the whole point
+phase if the bankroll covers line plus odds when the point is set; the
+balance only moves on settlement.
+
+Sessions come back as ordinary ``Statistics`` — rolls, amounts bet, won
+and lost, per-player stats, per-shooter results, seven-out and point
+rolls, and per-roll bankroll and at-risk histories — and every won/lost
+bet is published as ``BetResolved`` on ``events``, so ``StatsConsumer``
+style summaries and ``EdgeTracker`` work unchanged. Only what a skipped
+roll would have shown is missing: the dice of non-deciding rolls (so no
+roll history and no ATS tracking).
+
+``replay`` plays the same decisions off real dice instead of samples;
+fed the dice a ``CrapsEngine`` session rolled, it reproduces that
+session's statistics exactly.
+"""
+from __future__ import annotations
+import math
+import random
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from config import HOUSE_RULES
+from craps.batch_engine import is_valid_amount, odds_amounts
+from craps.dice import Dice
+from craps.edge import WAYS, p_before_seven
+from craps.events import BetResolved, EventBus
+from craps.house_rules import HouseRules
+from craps.player import Player
+from craps.rules_engine import RulesEngine
+from craps.statistics import Statistics
+from craps.strategies.pass_line_odds_v2 import PassLineOddsV2
+from craps.strategies.pass_line_v2 import PassLineV2
+from craps.strategy_contract import ContractStrategy
+
+#: Strategies the fast-forward engine reproduces.
+SUPPORTED_STRATEGIES = (PassLineV2, PassLineOddsV2)
+
+POINTS = (4, 5, 6, 8, 9, 10)
+
+#: The come-out total of each of the 36 equally likely dice pairs.
+_TOTALS = tuple(d1 + d2 for d1 in range(1, 7) for d2 in range(1, 7))
+#: log P(a point-phase roll neither makes the point nor sevens out).
+_LOG_CONTINUE = {point: math.log(1 - (WAYS[point] + 6) / 36) for point in POINTS}
+_P_MADE = {point: float(p_before_seven(point)) for point in POINTS}
+
+
+class _SampledDecisions:
+    """Line decisions drawn from their exact distributions."""
+
+    def __init__(self, seed: Optional[int]) -> None:
+        self._random = random.Random(seed).random
+
+    def come_out(self) -> int:
+        return _TOTALS[int(self._random() * 36)]
+
+    def point_phase(self, point: int, limit: int) -> Tuple[int, Optional[bool]]:
+        """Rolls until the point or a seven, and whether the point was
+        made; ``(limit, None)`` if it takes more than ``limit`` rolls."""
+        rolls = 1 + int(math.log(1.0 - self._random()) / _LOG_CONTINUE[point])
+        if rolls > limit:
+            return limit, None
+        return rolls, self._random() < _P_MADE[point]
+
+
+class _RolledDecisions:
+    """The same decisions read off real dice."""
+
+    def __init__(self, roll: Callable[[], Tuple[int, int]]) -> None:
+        self._roll = roll
+
+    def come_out(self) -> int:
+        return sum(self._roll())
+
+    def point_phase(self, point: int, limit: int) -> Tuple[int, Optional[bool]]:
+        for rolls in range(1, limit + 1):
+            total = sum(self._roll())
+            if total == point:
+                return rolls, True
+            if total == 7:
+                return rolls, False
+        return limit, None
+
+
+@dataclass
+class _LineBets:
+    """One player's pass line (and odds) amounts, validated up front."""
+    amount: int
+    valid: bool
+    #: point -> odds amount, for points where the odds bet is valid.
+    odds: Dict[int, int] = field(default_factory=dict)
+    #: point -> odds payout ratio.
+    odds_ratio: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+
+
+def _line_bets_for(contract: ContractStrategy, house_rules: HouseRules) -> _LineBets:
+    # Exact type checks: a subclass may override wants() with anything.
+    kind = type(contract)
+    if kind is PassLineV2:
+        assert isinstance(contract, PassLineV2)
+        amount = contract.bet_amount
+        return _LineBets(amount, is_valid_amount("Pass Line", amount, house_rules))
+    if kind is PassLineOddsV2:
+        assert isinstance(contract, PassLineOddsV2)
+        amount = house_rules.table_minimum
+        line = _LineBets(amount, is_valid_amount("Pass Line", amount, house_rules))
+        for point, odds in odds_amounts(contract, amount).items():
+            if odds > 0 and is_valid_amount("Pass Line Odds", odds, house_rules):
+                line.odds[point] = odds
+                line.odds_ratio[point] = RulesEngine.get_payout_ratio("Pass Line Odds", point)
+        return line
+    raise ValueError(
+        f"FastForwardEngine has no model for {kind.__name__}; "
+        f"supported: {[cls.__name__ for cls in SUPPORTED_STRATEGIES]}"
+    )
+
+
+class FastForwardEngine:
+    """Plays sessions of a line-bet lineup a decision at a time.
+
+    A session ends after ``num_shooters`` seven-outs, exactly like
+    ``TableRunner.run``; ``max_rolls`` caps it early.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[Tuple[str, ContractStrategy]],
+        house_rules: Optional[Dict[str, Any]] = None,
+        num_shooters: int = 10,
+        initial_bankroll: int = 500,
+        max_rolls: Optional[int] = None,
+    ) -> None:
+        self.players = list(players)
+        self.house_rules = HouseRules(house_rules or HOUSE_RULES)
+        self.num_shooters = num_shooters
+        self.initial_bankroll = initial_bankroll
+        self.max_rolls = max_rolls
+        self.events = EventBus()
+        self._line_bets = [_line_bets_for(contract, self.house_rules) for _, contract in self.players]
+
+    def run(self, seed: Optional[int] = None) -> Statistics:
+        """Play one session from sampled decisions."""
+        return _Session(self).play(_SampledDecisions(seed))
+
+    def replay(self, dice: Dice) -> Statistics:
+        """Play one session off ``dice`` (e.g. a seeded ``Dice``)."""
+        return _Session(self).play(_RolledDecisions(dice.roll))
+
+
+class _Session:
+    """Mutable state for one fast-forward session."""
+
+    def __init__(self, engine: FastForwardEngine) -> None:
+        self.engine = engine
+        self.lines = engine._line_bets
+        self.players = [
+            Player(name, strategy_name=contract.name, initial_balance=engine.initial_bankroll)
+            for name, contract in engine.players
+        ]
+        rules = engine.house_rules
+        self.stats = Statistics(rules.table_minimum, engine.num_shooters, len(self.players))
+        self.stats.initialize_player_stats(self.players)
+        self.publish = engine.events.publish if engine.events.has_subscribers(BetResolved) else None
+        self.shooter_index = 1
+        self.shooter_start = [p.balance for p in self.players]
+
+    def play(self, decisions: Union[_SampledDecisions, _RolledDecisions]) -> Statistics:
+        engine = self.engine
+        stats = self.stats
+        max_rolls = engine.max_rolls if engine.max_rolls is not None else sys.maxsize
+        players = self.players
+        lines = self.lines
+        seven_outs = 0
+        while seven_outs < engine.num_shooters and stats.session_rolls < max_rolls:
+            # Come-out roll: the line goes up if the bankroll covers it.
+            stakes = [
+                line.amount if line.valid and line.amount <= player.balance else 0
+                for line, player in zip(lines, players)
+            ]
+            total = decisions.come_out()
+            point_set = total in POINTS
+            if total in (7, 11):
+                self._settle_line(stakes, None, None, True)
+            elif total in (2, 3, 12):
+                self._settle_line(stakes, None, None, False)
+            self._record_rolls(1, total, sum(stakes), None, stakes if point_set else None)
+            if total == 7:
+                stats.total_sevens += 1
+            if not point_set or stats.session_rolls >= max_rolls:
+                continue
+
+            # Point phase: odds ride it if the bankroll covers line + odds.
+            point = total
+            odds = [
+                line.odds.get(point, 0) if stake and stake + line.odds.get(point, 0) <= player.balance else 0
+                for line, player, stake in zip(lines, players, stakes)
+            ]
+            rolls, made = decisions.point_phase(point, max_rolls - stats.session_rolls)
+            risk = sum(stakes) + sum(odds)
+            if made is None:
+                self._record_rolls(rolls, None, risk, stakes, stakes)
+                break
+            # Balances going into the phase, shown for every roll but the last.
+            balances = [player.balance for player in players]
+            self._settle_line(stakes, odds, point, made)
+            self._record_rolls(rolls, point if made else 7, risk, stakes, None, balances)
+            if made:
+                stats.point_number_rolls.append(stats.session_rolls)
+            else:
+                seven_outs += 1
+                self._seven_out()
+
+        return self._finalize()
+
+    def _settle_line(self, stakes: List[int], odds: Optional[List[int]], point: Optional[int], won: bool) -> None:
+        stats = self.stats
+        publish = self.publish
+        for i, player in enumerate(self.players):
+            stake = stakes[i]
+            if not stake:
+                continue
+            player_stats = stats.player_stats[player.name]
+            bets: List[Tuple[str, int, Optional[int], int]] = [("Pass Line", stake, None, stake)]
+            if odds is not None and odds[i] and point is not None:
+                numerator, denominator = self.lines[i].odds_ratio[point]
+                bets.append(("Pass Line Odds", odds[i], point, (odds[i] * numerator) // denominator))
+            for bet_type, amount, number, profit in bets:
+                stats.total_amount_bet += amount
+                player_stats["bets_settled"] += 1
+                if won:
+                    player.balance += profit
+                    stats.total_amount_won += profit
+                    player_stats["bets_won"] += 1
+                else:
+                    player.balance -= amount
+                    stats.total_amount_lost += amount
+                if publish is not None:
+                    publish(BetResolved(
+                        player_name=player.name,
+                        bet_type=bet_type,
+                        amount=amount,
+                        number=number,
+                        status="won" if won else "lost",
+                        payout=profit if won else 0,
+                        win_payout=profit if won else 0,
+                        removed=True,
+                    ))
+
+    def _record_rolls(
+        self,
+        rolls: int,
+        last_total: Optional[int],
+        table_risk: int,
+        held: Optional[List[int]],
+        after: Optional[List[int]],
+        balances_before: Optional[List[int]] = None,
+    ) -> None:
+        """Per-roll bookkeeping for ``rolls`` rolls, settlement (if any)
+        already applied. Only the last roll can have moved a balance, so
+        earlier rolls show ``balances_before`` (default: unchanged);
+        ``held`` is what each player had at risk after each earlier roll
+        (the line — odds are swept every roll) and ``after`` what is left
+        after the last one, None meaning nothing."""
+        stats = self.stats
+        start = stats.session_rolls
+        stats.session_rolls += rolls
+        stats.roll_numbers.extend(range(start + 1, start + rolls + 1))
+        if last_total is not None:
+            stats.last_roll_total = last_total
+        stats.max_table_risk = max(stats.max_table_risk, table_risk)
+
+        balances = [player.balance for player in self.players]
+        for i, player in enumerate(self.players):
+            name = player.name
+            balance = balances[i]
+            history = stats.bankroll_history.setdefault(name, [])
+            if rolls > 1:
+                history.extend([balances_before[i] if balances_before is not None else balance] * (rolls - 1))
+            history.append(balance)
+            at_risk = stats.at_risk_history.setdefault(name, [])
+            if rolls > 1:
+                at_risk.extend([held[i] if held is not None else 0] * (rolls - 1))
+            at_risk.append(after[i] if after is not None else 0)
+            player_stats = stats.player_stats[name]
+            player_stats["highest_bankroll"] = max(player_stats["highest_bankroll"], balance)
+            player_stats["lowest_bankroll"] = min(player_stats["lowest_bankroll"], balance)
+        stats.player_bankrolls = balances
+        stats.highest_bankroll = max(balances)
+        stats.lowest_bankroll = min(balances)
+        stats.session_highest_bankroll = max(stats.session_highest_bankroll, stats.highest_bankroll)
+        stats.session_lowest_bankroll = min(stats.session_lowest_bankroll, stats.lowest_bankroll)
+
+    def _seven_out(self) -> None:
+        stats = self.stats
+        stats.total_sevens += 1
+        # Recorded twice per seven-out, as the roll-by-roll engine does.
+        stats.seven_out_rolls.extend((stats.session_rolls, stats.session_rolls))
+        stats.shooter_stats[self.shooter_index] = {
+            player.name: player.balance - start
+            for player, start in zip(self.players, self.shooter_start)
+        }
+        self.shooter_index += 1
+        self.shooter_start = [p.balance for p in self.players]
+
+    def _finalize(self) -> Statistics:
+        """What ``CrapsEngine.finalize_session`` adds after the last roll."""
+        stats = self.stats
+        stats.update_player_stats(self.players)
+        best = worst = None
+        for player in self.players:
+            profit = stats.player_stats[player.name]["net_win_loss"]
+            entry = (player.name, player.strategy_name or "Unknown", profit)
+            if best is None or profit > best[2]:
+                best = entry
+            if worst is None or profit < worst[2]:
+                worst = entry
+        stats.session_high_roller = best
+        stats.session_low_roller = worst
+        return stats
@@ -1,6 +1,7 @@
 import os
-import csv
 from typing import Any
+from craps.roll_store import ROLLS_SUFFIX, write_rolls
+from craps.simulation_aggregate import SimulationAggregate
 from craps.statistics import Statistics
 
 
@@ -19,18 +20,19 @@ def export_high_roller_histories(simulation_data: dict[str, Any], output_dir: st
             best_sessions[strategy_name] = (profit, session)
 
     for strategy, (_, session) in best_sessions.items():
-        file_name = f"high_roller_{strategy}_session_{getattr(session, 'session_number', 'unknown')}.csv"
-        file_path = os.path.join(output_dir, file_name)
-
-        with open(file_path, mode="w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["shooter_num", "roll_number", "dice", "total", "phase", "point"])
-            for entry in session.roll_history:
-                writer.writerow([
-                    entry["shooter_num"],
-                    entry["roll_number"],
-                    entry["dice"],
-                    entry["total"],
-                    entry["phase"],
-                    entry.get("point", "")
-                ])
+        file_name = f"high_roller_{strategy}_session_{getattr(session, 'session_number', 'unknown')}{ROLLS_SUFFIX}"
+        write_rolls(os.path.join(output_dir, file_name), session.roll_history)
+
+
+def export_high_roller_replays(aggregate: SimulationAggregate, output_dir: str = "output/high_rollers") -> None:
+    """Replay each strategy's best session from the run's master seed and
+    export its roll history — nothing per-roll is kept during the run."""
+    from craps.simulation_runner import replay_session
+
+    if aggregate.master_seed is None:
+        raise ValueError("Aggregate has no master seed; its sessions cannot be replayed.")
+    sessions = [
+        replay_session(aggregate.master_seed, session_number, aggregate.rng_version)
+        for _, session_number, _, _ in aggregate.best_sessions.values()
+    ]
+    export_high_roller_histories(simulation_data={"sessions": sessions}, output_dir=output_dir)
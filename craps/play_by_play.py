@@ -1,26 +1,77 @@
+import gzip
+import io
 import os
 import logging
-from typing import TYPE_CHECKING, Optional
+import time
+import weakref
+from typing import IO, TYPE_CHECKING, Any, Optional, TypeGuard
 if TYPE_CHECKING:
     from craps.craps_engine import CrapsEngine
 
 
+def narrating(play_by_play: Optional[Any]) -> TypeGuard["PlayByPlay"]:
+    """Whether a narration line written to ``play_by_play`` would land.
+
+    Hot-path callers check this before formatting a message, so quiet
+    runs build no narration strings at all.
+    """
+    return play_by_play is not None and play_by_play.enabled
+
+
 class PlayByPlay:
+    """Session narration, appended to ``output/play_by_play.txt``.
+
+    The file is opened on the first write and kept open for the session;
+    lines collect in a write buffer that is flushed once ``flush_bytes``
+    accumulate or ``flush_seconds`` pass, and on ``flush()``/``close()``
+    (the engine closes it before the log viewer opens the file and on
+    ``SessionFinalized``). A write after ``close()`` reopens in append mode.
+
+    ``compress`` writes gzip text to ``<file>.gz`` instead, still behind a
+    ``flush_bytes`` buffer. ``max_bytes`` rotates the log once roughly that
+    many UTF-8 bytes have been written to it, keeping ``backups`` older
+    files as ``<file>.1`` (newest) … ``<file>.N``. For a compressed log the
+    limit counts uncompressed bytes, and only those this writer wrote: a
+    pre-existing ``.gz`` file's contents aren't counted.
+    """
+
     def __init__(
         self,
         output_folder: str = "output",
         play_by_play_file: str = "play_by_play.txt",
-        engine: Optional["CrapsEngine"] = None
+        engine: Optional["CrapsEngine"] = None,
+        flush_bytes: int = 64 * 1024,
+        flush_seconds: float = 1.0,
+        compress: bool = False,
+        max_bytes: Optional[int] = None,
+        backups: int = 3,
     ) -> None:
         """
         Initialize the PlayByPlay writer.
 
         :param output_folder: The folder where the play-by-play file will be saved.
         :param play_by_play_file: The name of the play-by-play file.
+        :param flush_bytes: Write-buffer size; a full buffer is flushed.
+        :param flush_seconds: Longest a written line may sit unflushed.
+        :param compress: Write gzip-compressed text to ``<file>.gz``.
+        :param max_bytes: Rotate the file after this many bytes (None: never);
+            uncompressed bytes when ``compress`` is set.
+        :param backups: Rotated files to keep.
         """
         self.engine = engine
         self.output_folder: str = output_folder
+        if compress:
+            play_by_play_file += ".gz"
         self.play_by_play_file: str = os.path.join(output_folder, play_by_play_file)
+        self.flush_bytes = flush_bytes
+        self.flush_seconds = flush_seconds
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file: Optional[IO[str]] = None
+        self._closer: Optional[weakref.finalize] = None
+        self._written = 0
+        self._last_flush = 0.0
         self.ensure_output_folder_exists()
 
     def ensure_output_folder_exists(self) -> None:
@@ -29,19 +80,78 @@ class PlayByPlay:
             os.makedirs(self.output_folder)
             print(f"Created output folder: {self.output_folder}")
 
+    @property
+    def enabled(self) -> bool:
+        """False when the owning engine runs quiet: writes are dropped."""
+        return not getattr(self.engine, "quiet_mode", False)
+
     def write(self, message: str) -> None:
         """
         Write a pre-formatted message (with embedded Colorama colors) to the play-by-play file.
 
         :param message: The message to write.
         """
-        if getattr(self.engine, "quiet_mode", False):
+        if not self.enabled:
             return
-        with open(self.play_by_play_file, "a", encoding="utf-8") as file:
-            file.write(message + "\n")
+        file = self._file if self._file is not None else self._open()
+        line = message + "\n"
+        file.write(line)
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_seconds:
+            file.flush()
+            self._last_flush = now
+        if self.max_bytes is not None:
+            self._written += len(line.encode("utf-8"))
+            if self._written >= self.max_bytes:
+                self._rotate()
+
+    def flush(self) -> None:
+        """Push buffered lines to disk, keeping the file open."""
+        if self._file is not None:
+            self._file.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the file (the next write reopens it)."""
+        if self._closer is not None:
+            self._closer()  # closes the file, once
+            self._closer = None
+        self._file = None
+
+    def _open(self) -> IO[str]:
+        file: IO[str]
+        if self.compress:
+            raw = gzip.GzipFile(self.play_by_play_file, "ab")
+            file = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=self.flush_bytes), encoding="utf-8")
+        else:
+            file = open(self.play_by_play_file, "a", encoding="utf-8", buffering=self.flush_bytes)
+        # Writers created outside an engine are never closed explicitly;
+        # the finalizer still flushes their tail at collection or exit.
+        self._closer = weakref.finalize(self, file.close)
+        self._file = file
+        self._last_flush = time.monotonic()
+        if self.max_bytes is not None and not self.compress:
+            self._written = os.path.getsize(self.play_by_play_file)
+        # A compressed log keeps its running uncompressed count across
+        # reopens; its file size is in different units.
+        return file
+
+    def _rotate(self) -> None:
+        self.close()
+        path = self.play_by_play_file
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                older = f"{path}.{index}"
+                if os.path.exists(older):
+                    os.replace(older, f"{path}.{index + 1}")
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+        self._written = 0
 
     def clear_play_by_play_file(self) -> None:
         """Clear the play-by-play file if it exists."""
+        self.close()
         if os.path.exists(self.play_by_play_file):
             # Ensure the file is closed before attempting to delete it
             for handler in logging.root.handlers[:]:
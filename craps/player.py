@@ -1,6 +1,6 @@
 from typing import List, Union, Optional, Any, Tuple, TYPE_CHECKING
 from craps.bet import Bet
-from craps.play_by_play import PlayByPlay
+from craps.play_by_play import PlayByPlay, narrating
 import random
 
 if TYPE_CHECKING:
@@ -42,12 +42,11 @@ class Player:
 
         for b in bets:
             if not table.place_bet(b, phase, play_by_play=play_by_play):
-                message = f"  ❌ Failed to place {b.bet_type} bet for {self.name}"
-                if play_by_play:
-                    play_by_play.write(message)
+                if narrating(play_by_play):
+                    play_by_play.write(f"  ❌ Failed to place {b.bet_type} bet for {self.name}")
                 return False
 
-            if play_by_play:
+            if narrating(play_by_play):
                 risk = self.get_total_at_risk(table)
 
                 # 🧩 Compose the bet label
@@ -86,10 +85,7 @@ class Player:
         :param number: The number associated with the bet (e.g., 6 for Place 6).
         :return: True if the player has an active bet of the specified type and number, False otherwise.
         """
-        return any(
-            bet.owner == self and bet.bet_type == bet_type and (number is None or bet.number == number)
-            for bet in table.bets
-        )
+        return table.bets.find(self, bet_type, number, any_number=number is None) is not None
 
     def roll_dice(self) -> Tuple[int, int]:
         """
@@ -110,31 +106,30 @@ class Player:
 
     def has_odds_bets(self, table: "Table") -> bool:
         """Check if the player has any active Come Odds bets."""
-        return any(bet.bet_type == "Come Odds" and bet.status == "active" for bet in table.bets if bet.owner == self)
+        return any(bet.status == "active" for bet in table.bets.of_type(self, "Come Odds"))
 
     def update_come_odds_status(self, table: "Table", should_work: bool) -> None:
         """Update the status of the player's Come Odds bets based on strategy preference."""
-        for bet in table.bets:
-            if bet.owner == self and bet.bet_type == "Come Odds":
-                bet.status = "active" if should_work else "inactive"
+        for bet in table.bets.of_type(self, "Come Odds"):
+            bet.status = "active" if should_work else "inactive"
 
     def get_total_at_risk(self, table: "Table") -> int:
         """Return the total amount this player has at risk on the table."""
-        return sum(bet.amount for bet in table.bets if bet.owner == self and bet.status == "active")
+        return table.bets.owner_total(self, active_only=True)
 
     def win_bet(self, bet: Bet, play_by_play: Optional[Any] = None) -> None:
         """Handle a winning bet: update bankroll and optionally log result."""
         winnings = bet.payout()
         self.balance += winnings
 
-        if play_by_play:
+        if narrating(play_by_play):
             play_by_play.write(
                 f"  ⚡ {bet} WON ${winnings}! New Bankroll: ${self.balance}" 
             )
 
     def lose_bet(self, bet: Bet, play_by_play: Optional[Any] = None) -> None:
         self.balance -= bet.amount  # This line was missing!
-        if play_by_play:
+        if narrating(play_by_play):
             play_by_play.write(
                 f"  ❌ {bet} LOST ${bet.amount}. New Bankroll: ${self.balance}"
             )
\ No newline at end of file
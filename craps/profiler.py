@@ -0,0 +1,105 @@
+"""Per-phase wall-time profiling for the roll loop.
+
+A ``RollProfiler`` handed to ``TableRunner`` accumulates call counts and
+wall time for each stage of ``roll_once`` — bet collection, the roll,
+resolution (split into check / settle / publish), status refresh, bet
+logging and post-roll handling — and for each strategy's ``wants()``
+calls, keyed by the lineup strategy name. It answers one question: is a
+slow run slow in the engine, or in a particular strategy?
+
+Profiling is opt-in. Without a profiler the roll loop and the strategy
+adapters take their usual path, paying only an ``is None`` check per
+stage. Like ``SimulationAggregate``, profiles merge additively, so worker
+processes can each keep one and the parent folds them together.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+#: roll_once stages, in the order they run (resolve_bets.* nest inside
+#: resolve_bets).
+PHASES = (
+    "accept_bets",
+    "roll_dice",
+    "resolve_bets",
+    "resolve_bets.check",
+    "resolve_bets.settle",
+    "resolve_bets.publish",
+    "refresh_bet_statuses",
+    "log_player_bets",
+    "handle_post_roll",
+)
+
+
+@dataclass
+class PhaseTiming:
+    calls: int = 0
+    seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.seconds += seconds
+
+    def merge(self, other: "PhaseTiming") -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+
+
+@dataclass
+class RollProfiler:
+    #: Stage name (see PHASES) -> cumulative timing.
+    phases: Dict[str, PhaseTiming] = field(default_factory=dict)
+    #: Lineup strategy name -> cumulative timing of its wants() calls.
+    strategies: Dict[str, PhaseTiming] = field(default_factory=dict)
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        timing = self.phases.get(phase)
+        if timing is None:
+            timing = self.phases[phase] = PhaseTiming()
+        timing.add(seconds)
+
+    def add_strategy(self, strategy_name: str, seconds: float) -> None:
+        timing = self.strategies.get(strategy_name)
+        if timing is None:
+            timing = self.strategies[strategy_name] = PhaseTiming()
+        timing.add(seconds)
+
+    def merge(self, other: "RollProfiler") -> None:
+        for phase, timing in other.phases.items():
+            self.phases.setdefault(phase, PhaseTiming()).merge(timing)
+        for strategy_name, timing in other.strategies.items():
+            self.strategies.setdefault(strategy_name, PhaseTiming()).merge(timing)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready totals: phases in roll order, strategies slowest first."""
+        ordered = [p for p in PHASES if p in self.phases]
+        ordered += sorted(p for p in self.phases if p not in PHASES)
+        return {
+            "phases": {
+                phase: {"calls": self.phases[phase].calls, "seconds": self.phases[phase].seconds}
+                for phase in ordered
+            },
+            "strategies": {
+                name: {"calls": timing.calls, "seconds": timing.seconds}
+                for name, timing in sorted(
+                    self.strategies.items(), key=lambda item: -item[1].seconds
+                )
+            },
+        }
+
+    def report(self) -> str:
+        """Plain-text table of the snapshot, for terminals."""
+        snapshot = self.snapshot()
+        rows: List[tuple] = [("phase", "calls", "total s", "avg us")]
+        for section in ("phases", "strategies"):
+            if section == "strategies" and snapshot[section]:
+                rows.append(("strategy wants()", "", "", ""))
+            for name, timing in snapshot[section].items():
+                calls, seconds = timing["calls"], timing["seconds"]
+                average = seconds / calls * 1e6 if calls else 0.0
+                indent = "  " if section == "strategies" or "." in name else ""
+                rows.append((indent + name, f"{calls:,}", f"{seconds:.3f}", f"{average:.1f}"))
+        width = max(len(row[0]) for row in rows)
+        return "\n".join(
+            f"{row[0]:<{width}}  {row[1]:>12}  {row[2]:>10}  {row[3]:>10}" for row in rows
+        )
@@ -1,13 +1,13 @@
 import os
-import csv
 from typing import List, Dict, Any, Optional
 from craps.play_by_play import PlayByPlay
+from craps.roll_store import RollStore, is_roll_store, read_legacy_rolls, write_rolls
 
 class RollHistoryManager:
     def __init__(
         self,
         output_folder: str = "output",
-        roll_history_file: str = "single_session_roll_history.csv",
+        roll_history_file: str = "single_session_roll_history.rolls",
         play_by_play: Optional[PlayByPlay] = None
     ) -> None:
         self.output_folder: str = output_folder
@@ -30,48 +30,39 @@ class RollHistoryManager:
 
     def save_roll_history(self, roll_history: List[Dict[str, Any]]) -> None:
         """
-        Save the roll history to a CSV file.
-        Dice will be stored as stringified lists: "[6, 4]"
+        Save the roll history as a binary ``.rolls`` file (see craps.roll_store).
         """
 
         self.ensure_output_folder_exists()
-        with open(self.roll_history_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ["shooter_num", "roll_number", "dice", "total", "phase", "point"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            # Write the header
-            writer.writeheader()
-
-            # Write the roll history
-            for roll in roll_history:
-                row_to_write = roll.copy()
-                row_to_write["dice"] = str(list(roll["dice"]))
-                writer.writerow(row_to_write)
+        write_rolls(self.roll_history_file, roll_history)
 
         if self.play_by_play:
                 self.play_by_play.write(f"Roll history saved to: {self.roll_history_file}")
 
     def load_roll_history(self) -> List[Dict[str, Any]]:
         """
-        Load the roll history from a CSV file.
+        Load the roll history from a ``.rolls`` file (or a legacy CSV/JSON one).
 
         :return: A list of dictionaries representing the roll history.
         """
         if not os.path.exists(self.roll_history_file):
             raise FileNotFoundError(f"💾 Roll history file '{self.roll_history_file}' not found.")
 
-        roll_history: List[Dict[str, Any]] = []
-        with open(self.roll_history_file, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Convert dice and total to integers
-                row["roll_number"] = int(row["roll_number"])
-                row["shooter_num"] = int(row["shooter_num"])
-                dice_str = row["dice"].strip("[] ")
-                dice_parts = dice_str.split(",")
-                row["dice"] = [int(dice_parts[0]), int(dice_parts[1])]
-                row["total"] = int(row["total"])
-                roll_history.append(row)
+        roll_history: List[Dict[str, Any]]
+        if is_roll_store(self.roll_history_file):
+            roll_history = list(RollStore(self.roll_history_file).rolls())
+        else:
+            roll_history = []
+            for roll_number, roll in enumerate(read_legacy_rolls(self.roll_history_file), start=1):
+                dice = [int(roll["dice"][0]), int(roll["dice"][1])]
+                roll_history.append({
+                    "shooter_num": roll.get("shooter_num"),
+                    "roll_number": roll.get("roll_number", roll_number),
+                    "dice": dice,
+                    "total": sum(dice),
+                    "phase": roll["phase"],
+                    "point": roll.get("point"),
+                })
 
         if self.play_by_play:
                 self.play_by_play.write(f"💾 Roll history loaded from: {self.roll_history_file}")
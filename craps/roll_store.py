@@ -0,0 +1,178 @@
+"""Binary roll-history files (``.rolls``).
+
+A fixed 16-byte header followed by one 2-byte record per roll:
+
+- byte 0 — the dice, ``die1 << 4 | die2`` (so a hex dump reads ``0x34`` for
+  a 3 and a 4);
+- byte 1 — flags: the point in the low nibble (0 when the puck is off),
+  ``PHASE_POINT`` when the roll was thrown in the point phase, and
+  ``NEW_SHOOTER`` on a shooter's first roll.
+
+``roll_number`` is the record index plus one and ``shooter_num`` counts
+``NEW_SHOOTER`` flags up from the header's first shooter number, so
+neither is stored per roll. Records are fixed-width, so ``RollStore``
+maps the file read-only and exposes whole columns as NumPy arrays without
+parsing anything; a million rolls is 2 MB.
+
+``convert_roll_history`` turns the legacy CSV exports and the JSON files
+in ``saves/`` into this format.
+"""
+from __future__ import annotations
+import csv
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"CRPSROLL"
+FORMAT_VERSION = 1
+#: magic, format version, record size, first roll's shooter_num.
+_HEADER = struct.Struct("<8sHHI")
+HEADER_SIZE = _HEADER.size
+RECORD_DTYPE = np.dtype([("dice", "u1"), ("flags", "u1")])
+
+POINT_MASK = 0x0F
+PHASE_POINT = 0x10
+NEW_SHOOTER = 0x20
+
+ROLLS_SUFFIX = ".rolls"
+
+PathLike = Union[str, Path]
+
+
+def pack_roll(dice: Tuple[int, int], phase: str, point: Optional[int], new_shooter: bool) -> Tuple[int, int]:
+    """The (dice, flags) bytes for one roll."""
+    die1, die2 = dice
+    if not (1 <= die1 <= 6 and 1 <= die2 <= 6):
+        raise ValueError(f"Invalid dice {dice!r}")
+    if point is not None and not 4 <= point <= 10:
+        raise ValueError(f"Invalid point {point!r}")
+    flags = point or 0
+    if phase == "point":
+        flags |= PHASE_POINT
+    if new_shooter:
+        flags |= NEW_SHOOTER
+    return die1 << 4 | die2, flags
+
+
+def write_rolls(path: PathLike, rolls: Iterable[Mapping[str, Any]]) -> int:
+    """Write roll dicts (``dice``, ``phase``, ``point`` and, when known,
+    ``shooter_num``) to a ``.rolls`` file; returns the number written.
+
+    Without ``shooter_num`` a new shooter starts after each seven-out.
+    """
+    records: List[Tuple[int, int]] = []
+    previous: Optional[Mapping[str, Any]] = None
+    first_shooter = 1
+    for roll in rolls:
+        dice = (int(roll["dice"][0]), int(roll["dice"][1]))
+        if previous is None:
+            new_shooter = True
+            first_shooter = int(roll.get("shooter_num") or 1)
+        elif "shooter_num" in roll and "shooter_num" in previous:
+            new_shooter = roll["shooter_num"] != previous["shooter_num"]
+        else:
+            new_shooter = previous["phase"] == "point" and sum(previous["dice"]) == 7
+        point = roll.get("point")
+        records.append(pack_roll(dice, roll["phase"], int(point) if point not in (None, "") else None, new_shooter))
+        previous = roll
+
+    data = np.array(records, dtype=RECORD_DTYPE)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, first_shooter))
+        f.write(data.tobytes())
+    return len(records)
+
+
+def is_roll_store(path: PathLike) -> bool:
+    """Whether ``path`` is a ``.rolls`` file (by its magic, not its name)."""
+    with Path(path).open("rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class RollStore:
+    """Read-only, memory-mapped view of a ``.rolls`` file."""
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is too short to be a roll-history file")
+        magic, version, record_size, self.first_shooter = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a roll-history file")
+        if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{self.path}: unsupported roll-history format v{version}")
+        count = (self.path.stat().st_size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        self.records: np.ndarray = (
+            np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+            if count
+            else np.empty(0, dtype=RECORD_DTYPE)
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Every field as a whole-history array (decoded in bulk)."""
+        dice = self.records["dice"]
+        flags = self.records["flags"]
+        die1 = dice >> 4
+        die2 = dice & 0x0F
+        return {
+            "roll_number": np.arange(1, len(self) + 1),
+            "shooter_num": np.cumsum((flags & NEW_SHOOTER) != 0) + (self.first_shooter - 1),
+            "die1": die1,
+            "die2": die2,
+            "total": die1.astype(np.int64) + die2,
+            "point_phase": (flags & PHASE_POINT) != 0,
+            "point": flags & POINT_MASK,
+        }
+
+    def rolls(self) -> Iterator[Dict[str, Any]]:
+        """Rows in the shape ``RollHistoryManager`` has always returned."""
+        columns = {name: column.tolist() for name, column in self.columns().items()}
+        for i in range(len(self)):
+            point = columns["point"][i]
+            yield {
+                "shooter_num": columns["shooter_num"][i],
+                "roll_number": columns["roll_number"][i],
+                "dice": [columns["die1"][i], columns["die2"][i]],
+                "total": columns["total"][i],
+                "phase": "point" if columns["point_phase"][i] else "come-out",
+                "point": point or None,
+            }
+
+
+def read_legacy_rolls(path: PathLike) -> List[Dict[str, Any]]:
+    """Roll dicts from a legacy CSV export or a ``saves/`` JSON file."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return list(data)
+    rolls: List[Dict[str, Any]] = []
+    with path.open("r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            die1, die2 = row["dice"].strip("[]() ").split(",")
+            rolls.append({
+                "shooter_num": int(row["shooter_num"]),
+                "dice": (int(die1), int(die2)),
+                "phase": row["phase"],
+                "point": int(row["point"]) if row.get("point") else None,
+            })
+    return rolls
+
+
+def convert_roll_history(source: PathLike, destination: Optional[PathLike] = None) -> Path:
+    """Convert a CSV or JSON roll history to ``.rolls`` (next to the
+    source unless ``destination`` is given) and return the new path."""
+    source = Path(source)
+    target = Path(destination) if destination is not None else source.with_suffix(ROLLS_SUFFIX)
+    write_rolls(target, read_legacy_rolls(source))
+    return target
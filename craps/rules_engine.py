@@ -437,9 +437,29 @@ class RulesEngine:
         if bet.status != "won":
             return 0  # ✅ No payout if the bet didn't win
 
+        numerator, denominator = RulesEngine.get_win_ratio(bet.bet_type, bet.number, roll, house_rules)
+        profit = (bet.amount * numerator) // denominator
+
+        return profit
+
+    @staticmethod
+    def get_win_ratio(
+        bet_type: str,
+        number: Optional[Union[int, Tuple[int, int]]],
+        roll: Optional[int] = None,
+        house_rules: Optional[Any] = None,
+    ) -> Tuple[int, int]:
+        """
+        The profit ratio a winning bet is paid at, honoring house rules.
+
+        Unlike get_payout_ratio this resolves roll-dependent payouts (Field,
+        Horn/World) and the configured Field 2/12 multiples. A (0, 1) ratio
+        means the roll pays nothing.
+        """
         # Ensure the correct roll value is used for bets that depend on it
         # (Field, and the Horn/World splits, pay by the rolled total)
-        number = roll if bet.bet_type in ("Field", "Horn", "World") else bet.number
+        if bet_type in ("Field", "Horn", "World"):
+            number = roll
 
         # ✅ Field bets should only request payout if they actually won
         field_payouts = BET_PAYOUT.get("Field", {})
@@ -447,21 +467,17 @@ class RulesEngine:
         if not isinstance(field_payouts, (dict, list, set)):
             raise TypeError(f"Expected dict, list, or set for Field payouts, got {type(field_payouts)}")
 
-        if bet.bet_type == "Field" and number not in field_payouts:
-            return 0  # ✅ If the number isn't a winning Field number, payout is $0
+        if bet_type == "Field" and number not in field_payouts:
+            return (0, 1)  # ✅ If the number isn't a winning Field number, payout is $0
 
         # Table-configured Field 2/12 (T4/D6: double vs triple field)
-        if bet.bet_type == "Field" and house_rules is not None:
+        if bet_type == "Field" and house_rules is not None:
             if number == 2:
-                return bet.amount * house_rules.field_bet_payout_2
+                return (house_rules.field_bet_payout_2, 1)
             if number == 12:
-                return bet.amount * house_rules.field_bet_payout_12
+                return (house_rules.field_bet_payout_12, 1)
 
-        payout_ratio = RulesEngine.get_payout_ratio(bet.bet_type, number)
-        numerator, denominator = payout_ratio
-        profit = (bet.amount * numerator) // denominator
-
-        return profit
+        return RulesEngine.get_payout_ratio(bet_type, number)
 
     @staticmethod
     def calculate_vig(bet_type: str, amount: int, number: Optional[Union[int, Tuple[int, int]]]) -> int:
@@ -10,12 +10,19 @@ JSON has no tuples, so deserialization rebuilds the tuple-shaped fields
 (dice pairs, per-player pair lists, hop-bet numbers) before
 reconstructing the frozen dataclass. Round-tripping any event yields an
 equal instance.
+
+``EventEncoder`` is the one place a live table's events are encoded:
+it numbers them, dumps each envelope to JSON once and builds its SSE
+frame once, then hands that ``EncodedEvent`` to every wire consumer
+(recorder, broadcaster) — no per-consumer or per-client ``json.dumps``.
 """
 from __future__ import annotations
 import dataclasses
-from typing import Any, Dict, Tuple, Type
+import json
+import sys
+from typing import Any, Callable, Dict, List, Tuple, Type
 
-from craps.events import Event
+from craps.events import Event, EventBus
 
 ENVELOPE_KEYS = ("seq", "table_id", "type")
 
@@ -31,7 +38,11 @@ def _build_registry() -> Dict[str, Type[Event]]:
     stack = list(Event.__subclasses__())
     while stack:
         cls = stack.pop()
-        registry[cls.__name__] = cls
+        # @dataclass(slots=True) replaces each class with a rebuilt copy;
+        # the pre-slots original lingers in __subclasses__ until collected.
+        # Only register the class its module actually exports.
+        if getattr(sys.modules.get(cls.__module__), cls.__qualname__, None) is cls:
+            registry[cls.__name__] = cls
         stack.extend(cls.__subclasses__())
     return registry
 
@@ -50,6 +61,64 @@ def serialize_event(event: Event, seq: int, table_id: str) -> Dict[str, Any]:
     return {"seq": seq, "table_id": table_id, "type": type(event).__name__, **payload}
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class EncodedEvent:
+    """One event's finished wire forms."""
+    seq: int
+    type: str
+    #: The compact JSON envelope — exactly one recording line, sans newline.
+    line: str
+    #: The complete SSE frame (id, event, data, blank line), UTF-8 encoded.
+    sse: bytes
+
+    @classmethod
+    def from_line(cls, line: str) -> "EncodedEvent":
+        """Rebuild the wire forms from a recorded line."""
+        envelope = json.loads(line)
+        return cls._build(envelope["seq"], envelope["type"], line)
+
+    @classmethod
+    def _build(cls, seq: int, type_name: str, line: str) -> "EncodedEvent":
+        sse = f"id: {seq}\nevent: {type_name}\ndata: {line}\n\n".encode("utf-8")
+        return cls(seq=seq, type=type_name, line=line, sse=sse)
+
+
+def encode_event(event: Event, seq: int, table_id: str) -> EncodedEvent:
+    """Serialize an event's envelope once into every wire form."""
+    envelope = serialize_event(event, seq=seq, table_id=table_id)
+    line = json.dumps(envelope, separators=(",", ":"))
+    return EncodedEvent._build(seq, envelope["type"], line)
+
+
+#: A wire consumer: receives the event and its encoding.
+EncodedSink = Callable[[Event, EncodedEvent], None]
+
+
+class EventEncoder:
+    """Encodes a bus's events once, in publish order, for every sink.
+
+    ``seq`` is assigned here, monotonically from 0, so every sink sees the
+    same numbering.
+    """
+
+    def __init__(self, table_id: str) -> None:
+        self.table_id = table_id
+        self._seq = 0
+        self._sinks: List[EncodedSink] = []
+
+    def subscribe(self, bus: EventBus) -> None:
+        bus.subscribe(Event, self._on_event)
+
+    def add_sink(self, sink: EncodedSink) -> None:
+        self._sinks.append(sink)
+
+    def _on_event(self, event: Event) -> None:
+        encoded = encode_event(event, seq=self._seq, table_id=self.table_id)
+        self._seq += 1
+        for sink in self._sinks:
+            sink(event, encoded)
+
+
 def deserialize_event(envelope: Dict[str, Any]) -> Tuple[int, str, Event]:
     """Rebuild ``(seq, table_id, event)`` from a decoded JSON envelope."""
     data = dict(envelope)
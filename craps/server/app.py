@@ -11,18 +11,31 @@ from typing import AsyncIterator, Union
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from craps.server.broadcaster import COALESCE, HISTORY_CAPACITY, LISTENER_QUEUE_SIZE
 from craps.server.director import TableDirector
 from craps.server.routes import recordings_router, tables_router
 
 
-def create_app(sessions_dir: Union[str, Path] = "sessions") -> FastAPI:
+def create_app(
+    sessions_dir: Union[str, Path] = "sessions",
+    history_capacity: int = HISTORY_CAPACITY,
+    listener_queue_size: int = LISTENER_QUEUE_SIZE,
+    slow_listener_policy: str = COALESCE,
+    compress_recordings: bool = False,
+) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         yield
         await app.state.director.shutdown()
 
     app = FastAPI(title="Craps Observatory API", lifespan=lifespan)
-    app.state.director = TableDirector(sessions_dir=sessions_dir)
+    app.state.director = TableDirector(
+        sessions_dir=sessions_dir,
+        history_capacity=history_capacity,
+        listener_queue_size=listener_queue_size,
+        slow_listener_policy=slow_listener_policy,
+        compress_recordings=compress_recordings,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -1,76 +1,245 @@
 """Per-table event fan-out (Phase 2, Step 1).
 
-Subscribes to the engine bus the same way the recorder does (one
-subscription to ``Event`` observes the full stream), keeps every
-serialized envelope in memory indexed by seq, and feeds any number of
-SSE subscribers through asyncio queues.
-
-The runner's roll loop executes inside the event loop, so ``_on_event``
-never races a subscriber — ``put_nowait`` is safe and ordering is the
-bus's deterministic publish order. ``listen(after_seq)`` is what makes
-``Last-Event-ID`` resume gapless: history replays from the buffer, the
-seq guard drops the overlap with anything queued meanwhile.
+Takes the table's encoded event stream the same way the recorder does
+(``attach`` to the shared ``EventEncoder``, or ``subscribe`` to a bus
+with an encoder of its own), keeps recent ``EncodedEvent``s in memory,
+and feeds any number of SSE subscribers through asyncio queues. Events
+arrive already encoded, so a frame is built once however many clients
+are listening.
+
+History is a ring of the last ``capacity`` events when the broadcaster
+has an ``archive`` — the ``SessionRecorder`` writing the same stream —
+so memory per table stays constant however long the session runs. Older
+seqs are read back from the archive (which seeks via its offset index),
+so replay and paging still cover the whole session. Without an archive
+the broadcaster keeps everything.
+
+The runner's roll loop executes inside the event loop, so
+``_on_encoded`` never races a subscriber and ordering is the bus's
+deterministic publish order. ``listen(after_seq)`` is what makes
+``Last-Event-ID`` resume gapless: history replays from the archive and
+the ring, the seq guard drops the overlap with anything queued meanwhile.
+
+Each listener's queue holds at most ``queue_size`` events, so server
+memory never depends on the slowest client. What happens to a listener
+that falls that far behind is the ``policy``:
+
+- ``RESYNC`` — its queue is dropped, it is sent a ``resync`` frame whose
+  id (and ``after_seq``) is the last seq it received, and its stream
+  ends; reconnecting from there (EventSource does so by itself, with
+  that id as ``Last-Event-ID``) catches up from history.
+- ``COALESCE`` — superseded state snapshots (``BankrollsUpdated``,
+  ``RiskUpdated``) are squeezed out of the queue first, keeping only
+  the latest of each; a queue still full after that resyncs.
+- ``DISCONNECT`` — its stream simply ends.
+
+``metrics()`` reports live queue depths and what was dropped.
 """
 from __future__ import annotations
 import asyncio
-from typing import Any, AsyncIterator, Dict, List, Optional
+import json
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
 
 from craps.events import Event, EventBus, SessionFinalized
-from craps.serialization import serialize_event
+from craps.serialization import EncodedEvent, EventEncoder
+from craps.session_recorder import SessionRecorder
+
+#: Events a table with an archive keeps in memory.
+HISTORY_CAPACITY = 10_000
+#: Events a listener may fall behind before its ``policy`` applies.
+LISTENER_QUEUE_SIZE = 1_000
+
+RESYNC = "resync"
+COALESCE = "coalesce"
+DISCONNECT = "disconnect"
+SLOW_LISTENER_POLICIES = (RESYNC, COALESCE, DISCONNECT)
+
+#: Full-state snapshots, each superseded by the next of its type.
+COALESCIBLE_TYPES = frozenset({"BankrollsUpdated", "RiskUpdated"})
+
+
+def _resync_frame(after_seq: int) -> bytes:
+    data = json.dumps({"after_seq": after_seq}, separators=(",", ":"))
+    return f"id: {after_seq}\nevent: {RESYNC}\ndata: {data}\n\n".encode("utf-8")
 
-_CLOSE: Optional[Dict[str, Any]] = None  # queue sentinel
+
+class _Listener:
+    """One listen()'s bounded queue and its bookkeeping."""
+
+    def __init__(self) -> None:
+        self.pending: Deque[EncodedEvent] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+        #: Why the broadcaster cut this listener off (RESYNC/DISCONNECT).
+        self.evicted: Optional[str] = None
+        self.dropped = 0
+
+    def push(self, encoded: EncodedEvent) -> None:
+        self.pending.append(encoded)
+        self.ready.set()
+
+    def coalesce(self) -> int:
+        """Keep only the newest queued event of each coalescible type;
+        returns how many were dropped."""
+        seen = set()
+        kept: Deque[EncodedEvent] = deque()
+        for encoded in reversed(self.pending):
+            if encoded.type in COALESCIBLE_TYPES:
+                if encoded.type in seen:
+                    continue
+                seen.add(encoded.type)
+            kept.appendleft(encoded)
+        dropped = len(self.pending) - len(kept)
+        self.pending = kept
+        self.dropped += dropped
+        return dropped
+
+    def evict(self, reason: str) -> int:
+        """Drop the queue and end the listen; returns how many were dropped."""
+        dropped = len(self.pending)
+        self.pending.clear()
+        self.dropped += dropped
+        self.evicted = reason
+        self.ready.set()
+        return dropped
 
 
 class Broadcaster:
-    def __init__(self, table_id: str) -> None:
+    def __init__(
+        self,
+        table_id: str,
+        archive: Optional[SessionRecorder] = None,
+        capacity: int = HISTORY_CAPACITY,
+        queue_size: int = LISTENER_QUEUE_SIZE,
+        policy: str = COALESCE,
+    ) -> None:
+        if policy not in SLOW_LISTENER_POLICIES:
+            raise ValueError(f"Unknown slow-listener policy {policy!r}; valid: {SLOW_LISTENER_POLICIES}")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
         self.table_id = table_id
-        #: buffer[i] is the envelope with seq == i, from session start.
-        self.buffer: List[Dict[str, Any]] = []
+        self.archive = archive
+        #: The most recent events, oldest first; bounded only with an archive.
+        self.ring: Deque[EncodedEvent] = deque(maxlen=capacity if archive is not None else None)
+        self.queue_size = queue_size
+        self.policy = policy
         self.finished = False
-        self._queues: List["asyncio.Queue[Optional[Dict[str, Any]]]"] = []
+        self._next_seq = 0
+        self._listeners: List[_Listener] = []
+        #: Session totals, kept as listeners come and go.
+        self.dropped_events = 0
+        self.coalesced_events = 0
+        self.evictions: Dict[str, int] = {RESYNC: 0, DISCONNECT: 0}
 
     def subscribe(self, bus: EventBus) -> None:
-        bus.subscribe(Event, self._on_event)
+        encoder = EventEncoder(self.table_id)
+        encoder.subscribe(bus)
+        self.attach(encoder)
+
+    def attach(self, encoder: EventEncoder) -> None:
+        encoder.add_sink(self._on_encoded)
 
     @property
     def next_seq(self) -> int:
-        return len(self.buffer)
+        return self._next_seq
 
-    def _on_event(self, event: Event) -> None:
-        envelope = serialize_event(event, seq=len(self.buffer), table_id=self.table_id)
-        self.buffer.append(envelope)
-        for queue in list(self._queues):
-            queue.put_nowait(envelope)
+    def _on_encoded(self, event: Event, encoded: EncodedEvent) -> None:
+        self.ring.append(encoded)
+        self._next_seq = encoded.seq + 1
+        for listener in self._listeners:
+            self._offer(listener, encoded)
         if isinstance(event, SessionFinalized):
             self.close()
 
+    def _offer(self, listener: _Listener, encoded: EncodedEvent) -> None:
+        if listener.evicted is not None:
+            return
+        if len(listener.pending) >= self.queue_size and self.policy == COALESCE:
+            coalesced = listener.coalesce()
+            self.coalesced_events += coalesced
+            self.dropped_events += coalesced
+        if len(listener.pending) >= self.queue_size:
+            reason = DISCONNECT if self.policy == DISCONNECT else RESYNC
+            listener.dropped += 1  # the event that didn't fit
+            self.dropped_events += listener.evict(reason) + 1
+            self.evictions[reason] += 1
+            return
+        listener.push(encoded)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Live listener queue depths and session drop totals."""
+        depths = [len(listener.pending) for listener in self._listeners]
+        return {
+            "policy": self.policy,
+            "queue_size": self.queue_size,
+            "listeners": len(depths),
+            "queue_depths": depths,
+            "max_queue_depth": max(depths, default=0),
+            "dropped_events": self.dropped_events,
+            "coalesced_events": self.coalesced_events,
+            "resyncs": self.evictions[RESYNC],
+            "disconnects": self.evictions[DISCONNECT],
+        }
+
+    def history(self, after_seq: int = -1, limit: Optional[int] = None) -> Iterator[EncodedEvent]:
+        """Published events with seq > after_seq, oldest first (at most
+        ``limit``): evicted ones from the archive, the rest from the ring.
+
+        The ring is snapshotted up front, so events published while the
+        caller is suspended between items never disturb the iteration.
+        """
+        ring = list(self.ring)
+        first_in_ring = self._next_seq - len(ring)
+        remaining = limit
+        if after_seq + 1 < first_in_ring and self.archive is not None:
+            for line in self.archive.read_lines(after_seq, stop_seq=first_in_ring):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield EncodedEvent.from_line(line)
+        start = max(after_seq + 1 - first_in_ring, 0)
+        stop = len(ring) if remaining is None else start + max(remaining, 0)
+        yield from ring[start:stop]
+
     def close(self) -> None:
-        """End all live listens; the buffer stays readable."""
+        """End all live listens; history stays readable."""
         if not self.finished:
             self.finished = True
-            for queue in list(self._queues):
-                queue.put_nowait(_CLOSE)
+            for listener in self._listeners:
+                listener.closed = True
+                listener.ready.set()
 
-    async def listen(self, after_seq: int = -1) -> AsyncIterator[Dict[str, Any]]:
-        """Yield every envelope with seq > after_seq: buffered history
-        first, then live events, ending when the session finalizes."""
-        queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+    async def listen(self, after_seq: int = -1) -> AsyncIterator[bytes]:
+        """Yield the SSE frame of every event with seq > after_seq: history
+        first, then live events, ending when the session finalizes — or
+        when this listener falls ``queue_size`` events behind (a resync
+        ends with a ``resync`` frame)."""
+        listener = _Listener()
         # Register before replaying history so nothing published in
-        # between is missed; the seq guard below drops the overlap.
-        self._queues.append(queue)
+        # between is missed; the seq guard below drops the overlap. A
+        # session that closes meanwhile leaves its tail in the queue.
+        listener.closed = self.finished
+        self._listeners.append(listener)
         try:
             last = after_seq
-            for envelope in self.buffer[after_seq + 1:]:
-                yield envelope
-                last = envelope["seq"]
-            if self.finished:
-                return
+            for encoded in self.history(after_seq):
+                yield encoded.sse
+                last = encoded.seq
             while True:
-                item = await queue.get()
-                if item is None:  # _CLOSE sentinel
+                pending = listener.pending
+                if pending:
+                    item = pending.popleft()
+                    if item.seq > last:
+                        yield item.sse
+                        last = item.seq
+                    continue
+                if listener.evicted == RESYNC:
+                    yield _resync_frame(last)
+                if listener.evicted is not None or listener.closed:
                     return
-                if item["seq"] > last:
-                    yield item
-                    last = item["seq"]
+                listener.ready.clear()
+                await listener.ready.wait()
         finally:
-            self._queues.remove(queue)
+            self._listeners.remove(listener)
@@ -3,12 +3,24 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from craps.server.broadcaster import COALESCE, HISTORY_CAPACITY, LISTENER_QUEUE_SIZE
 from craps.server.table_session import TableSession
 
 
 class TableDirector:
-    def __init__(self, sessions_dir: Union[str, Path] = "sessions") -> None:
+    def __init__(
+        self,
+        sessions_dir: Union[str, Path] = "sessions",
+        history_capacity: int = HISTORY_CAPACITY,
+        listener_queue_size: int = LISTENER_QUEUE_SIZE,
+        slow_listener_policy: str = COALESCE,
+        compress_recordings: bool = False,
+    ) -> None:
         self.sessions_dir = Path(sessions_dir)
+        self.history_capacity = history_capacity
+        self.listener_queue_size = listener_queue_size
+        self.slow_listener_policy = slow_listener_policy
+        self.compress_recordings = compress_recordings
         self.tables: Dict[str, TableSession] = {}
 
     def create(self, table_id: Optional[str] = None, **kwargs: Any) -> TableSession:
@@ -20,7 +32,13 @@ class TableDirector:
         if table_id in self.tables:
             raise ValueError(f"table {table_id!r} already exists")
         session = TableSession(
-            table_id=table_id, sessions_dir=self.sessions_dir, **kwargs
+            table_id=table_id,
+            sessions_dir=self.sessions_dir,
+            history_capacity=self.history_capacity,
+            listener_queue_size=self.listener_queue_size,
+            slow_listener_policy=self.slow_listener_policy,
+            compress_recording=self.compress_recordings,
+            **kwargs,
         )
         self.tables[table_id] = session
         return session
@@ -31,6 +49,13 @@ class TableDirector:
     def list(self) -> List[Dict[str, Any]]:
         return [session.snapshot() for session in self.tables.values()]
 
+    async def remove(self, table_id: str) -> Optional[TableSession]:
+        """Stop and forget a table, deleting any spilled history."""
+        session = self.tables.pop(table_id, None)
+        if session is not None:
+            await session.close()
+        return session
+
     async def shutdown(self) -> None:
         for session in self.tables.values():
-            await session.stop()
+            await session.close()
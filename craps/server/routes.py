@@ -9,7 +9,7 @@ import json
 from typing import Any, AsyncIterator, Dict, List
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from craps.house_rules import HouseRules
 from craps.lineup import PlayerLineup
@@ -18,6 +18,7 @@ from craps.rules_engine import RulesEngine
 from craps.server.director import TableDirector
 from craps.server.schemas import CreateTableRequest, PaceRequest
 from craps.server.table_session import TableSession
+from craps.session_recorder import RECORDING_SUFFIXES, RecordingIndex, is_recording
 
 tables_router = APIRouter(prefix="/tables", tags=["Observatory"])
 recordings_router = APIRouter(prefix="/recordings", tags=["Recordings"])
@@ -70,6 +71,7 @@ async def create_table(request: Request, body: CreateTableRequest) -> Dict[str,
             max_rolls=body.max_rolls,
             dice_seed=body.dice_seed,
             record=body.record,
+            profile=body.profile,
         )
     except ValueError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
@@ -141,26 +143,54 @@ async def stop_table(request: Request, table_id: str) -> Dict[str, Any]:
     return session.snapshot()
 
 
+@tables_router.delete("/{table_id}", status_code=204)
+async def delete_table(request: Request, table_id: str) -> Response:
+    """Stop a table and drop it; its recording, if any, stays."""
+    if await _director(request).remove(table_id) is None:
+        raise HTTPException(status_code=404, detail=f"No table {table_id!r}")
+    return Response(status_code=204)
+
+
 @tables_router.get("/{table_id}/stats")
 async def table_stats(request: Request, table_id: str) -> Dict[str, Any]:
     return _session(request, table_id).stats_snapshot()
 
 
+@tables_router.get("/{table_id}/profile")
+async def table_profile(request: Request, table_id: str) -> Dict[str, Any]:
+    """Cumulative roll-stage and strategy wants() timings (tables created
+    with ``profile: true``)."""
+    profile = _session(request, table_id).profile_snapshot()
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Table {table_id!r} is not profiled")
+    return profile
+
+
 @tables_router.get("/{table_id}/events")
 async def table_events(
     request: Request, table_id: str, after_seq: int = -1, limit: int = 1000
-) -> Dict[str, Any]:
-    """Paged event log for the live/just-finished session (D2)."""
-    session = _session(request, table_id)
-    buffer = session.broadcaster.buffer
-    page = buffer[after_seq + 1 : after_seq + 1 + max(0, limit)]
-    return {
+) -> Response:
+    """Paged event log for the live/just-finished session (D2).
+
+    The page is spliced from the buffer's already-encoded envelopes
+    rather than re-serialized."""
+    broadcaster = _session(request, table_id).broadcaster
+    page = list(broadcaster.history(after_seq, limit=max(0, limit)))
+    return _events_page({
         "table_id": table_id,
-        "events": page,
-        "next_after_seq": page[-1]["seq"] if page else after_seq,
-        "total": len(buffer),
-        "finished": session.broadcaster.finished,
-    }
+        "next_after_seq": page[-1].seq if page else after_seq,
+        "total": broadcaster.next_seq,
+        "finished": broadcaster.finished,
+    }, [encoded.line for encoded in page])
+
+
+def _events_page(fields: Dict[str, Any], lines: List[str]) -> Response:
+    """A JSON page of ``fields`` plus ``events`` spliced from
+    already-encoded envelope lines, which are never parsed or re-dumped."""
+    head = json.dumps(fields, separators=(",", ":"))
+    return Response(
+        content=f'{head[:-1]},"events":[{",".join(lines)}]}}', media_type="application/json"
+    )
 
 
 @tables_router.get("/{table_id}/stream")
@@ -178,16 +208,22 @@ async def stream_table(request: Request, table_id: str) -> StreamingResponse:
                 status_code=400, detail=f"Bad Last-Event-ID {last_event_id!r}"
             ) from exc
 
-    async def event_source() -> AsyncIterator[str]:
-        async for envelope in session.broadcaster.listen(after_seq):
-            data = json.dumps(envelope, separators=(",", ":"))
-            yield f"id: {envelope['seq']}\nevent: {envelope['type']}\ndata: {data}\n\n"
+    async def event_source() -> AsyncIterator[bytes]:
+        # Frames are encoded once and shared by every client.
+        async for frame in session.broadcaster.listen(after_seq):
+            yield frame
 
     return StreamingResponse(
         event_source(), media_type="text/event-stream", headers=SSE_HEADERS
     )
 
 
+@tables_router.get("/{table_id}/listeners")
+async def table_listeners(request: Request, table_id: str) -> Dict[str, Any]:
+    """SSE listener queue depths and slow-listener drop counts."""
+    return {"table_id": table_id, **_session(request, table_id).broadcaster.metrics()}
+
+
 @recordings_router.get("")
 async def list_recordings(request: Request) -> List[Dict[str, Any]]:
     sessions_dir = _director(request).sessions_dir
@@ -200,7 +236,8 @@ async def list_recordings(request: Request) -> List[Dict[str, Any]]:
                 "size_bytes": path.stat().st_size,
                 "modified": path.stat().st_mtime,
             }
-            for path in sessions_dir.glob("*.jsonl")
+            for suffix in RECORDING_SUFFIXES
+            for path in sessions_dir.glob(f"*{suffix}")
         ),
         key=lambda entry: str(entry["name"]),
     )
@@ -209,30 +246,25 @@ async def list_recordings(request: Request) -> List[Dict[str, Any]]:
 @recordings_router.get("/{name}/events")
 async def recording_events(
     request: Request, name: str, after_seq: int = -1, limit: int = 1000
-) -> Dict[str, Any]:
-    """Paged raw envelopes from a recorded JSONL session (D2/Step 4)."""
+) -> Response:
+    """Paged raw envelopes from a recorded session, JSONL or
+    block-compressed (D2/Step 4).
+
+    Seeks via the recording's sidecar index (built and saved on first
+    use for recordings without one), so a page costs O(page), not
+    O(recording)."""
     sessions_dir = _director(request).sessions_dir
     path = (sessions_dir / name).resolve()
     if (
-        path.suffix != ".jsonl"
+        not is_recording(path)
         or path.parent != sessions_dir.resolve()
         or not path.is_file()
     ):
         raise HTTPException(status_code=404, detail=f"No recording {name!r}")
-    events: List[Dict[str, Any]] = []
-    total = 0
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            total += 1
-            envelope = json.loads(line)
-            if envelope["seq"] > after_seq and len(events) < max(0, limit):
-                events.append(envelope)
-    return {
+    index = RecordingIndex.for_recording(path)
+    lines = list(index.read_lines(path, after_seq, after_seq + 1 + max(0, limit)))
+    return _events_page({
         "name": name,
-        "events": events,
-        "next_after_seq": events[-1]["seq"] if events else after_seq,
-        "total": total,
-    }
+        "next_after_seq": json.loads(lines[-1])["seq"] if lines else after_seq,
+        "total": index.count,
+    }, lines)
@@ -25,6 +25,8 @@ class CreateTableRequest(BaseModel):
     roll_delay_ms: int = Field(default=0, ge=0)
     dice_seed: Optional[int] = None
     record: bool = True
+    #: Time each roll stage and strategy wants(); read via GET .../profile.
+    profile: bool = False
 
 
 class PaceRequest(BaseModel):
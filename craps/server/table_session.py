@@ -9,11 +9,19 @@ sequence as TableRunner.run()'s nested loop.
 """
 from __future__ import annotations
 import asyncio
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 from craps.edge import EdgeTracker
-from craps.server.broadcaster import Broadcaster
+from craps.profiler import RollProfiler
+from craps.server.broadcaster import (
+    COALESCE,
+    HISTORY_CAPACITY,
+    LISTENER_QUEUE_SIZE,
+    Broadcaster,
+)
+from craps.session_recorder import SessionRecorder
 from craps.statistics import Statistics
 from craps.table_runner import LineupConfig, TableRunner
 
@@ -30,6 +38,11 @@ class TableSession:
         dice_seed: Optional[int] = None,
         record: bool = True,
         sessions_dir: Union[str, Path] = "sessions",
+        compress_recording: bool = False,
+        profile: bool = False,
+        history_capacity: int = HISTORY_CAPACITY,
+        listener_queue_size: int = LISTENER_QUEUE_SIZE,
+        slow_listener_policy: str = COALESCE,
     ) -> None:
         self.table_id = table_id
         self.roll_delay_ms = roll_delay_ms
@@ -43,11 +56,29 @@ class TableSession:
             dice_seed=dice_seed,
             record=record,
             sessions_dir=sessions_dir,
+            compress_recording=compress_recording,
             quiet_mode=True,
+            profiler=RollProfiler() if profile else None,
+        )
+        # The broadcaster keeps only recent history in memory and reads
+        # older events back from the recording; an unrecorded table
+        # spills to a private temporary one instead.
+        archive = self.runner.recorder
+        self._spill_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+        if archive is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="craps-history-")
+            archive = SessionRecorder(table_id, self._spill_dir.name)
+            archive.attach(self.runner.encoder)
+        self.broadcaster = Broadcaster(
+            table_id,
+            archive=archive,
+            capacity=history_capacity,
+            queue_size=listener_queue_size,
+            policy=slow_listener_policy,
         )
-        self.broadcaster = Broadcaster(table_id)
         # Before start_session(), so SessionStarted reaches subscribers.
-        self.broadcaster.subscribe(self.runner.engine.events)
+        # Shares the recorder's encoder: each event is encoded once.
+        self.broadcaster.attach(self.runner.encoder)
         # D5 ledger: realized vs theoretical edge per player.
         self.edge_tracker = EdgeTracker(lambda: self.runner.engine.house_rules)
         self.edge_tracker.subscribe(self.runner.engine.events)
@@ -110,6 +141,17 @@ class TableSession:
             except asyncio.CancelledError:
                 pass
 
+    async def close(self) -> None:
+        """Stop the table and delete its spilled history, if it spilled;
+        only the in-memory ring stays readable."""
+        await self.stop()
+        if self._spill_dir is not None:
+            assert self.broadcaster.archive is not None
+            self.broadcaster.archive.close()
+            self.broadcaster.archive = None
+            self._spill_dir.cleanup()
+            self._spill_dir = None
+
     async def _drive(self) -> None:
         runner = self.runner
         rolls = 0
@@ -195,3 +237,10 @@ class TableSession:
             "at_risk_history": stats.at_risk_history,
             "edges": self.edge_tracker.snapshot(),
         }
+
+    def profile_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Per-phase roll timings so far, or None if not profiling."""
+        profiler = self.runner.profiler
+        if profiler is None:
+            return None
+        return {"table_id": self.table_id, **profiler.snapshot()}
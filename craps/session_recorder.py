@@ -3,53 +3,295 @@
 A consumer that subscribes to the full event stream (the bus dispatches
 by MRO, so one subscription to ``Event`` observes everything) and writes
 one wire envelope per line to ``sessions/<table_id>_<timestamp>.jsonl``
-(D2). ``seq`` is assigned here, monotonically from 0 per session — the
-engine knows nothing about sequence numbers or files.
+(D2). ``seq`` is assigned by the ``EventEncoder`` feeding it,
+monotonically from 0 per session — the engine knows nothing about
+sequence numbers or files. ``subscribe`` gives the recorder an encoder of
+its own; ``attach`` shares a table's encoder so each event is encoded
+once for the recorder and the broadcaster together.
 
 Attach before ``setup_session()`` so the ``SessionStarted`` event
 published at the end of setup is captured. The file closes itself on
 ``SessionFinalized``; ``close()`` is the fallback for interrupted runs.
+
+While it writes, the recorder keeps a ``RecordingIndex`` — the byte
+offset of every ``index_stride``-th line — so ``read_lines`` can seek
+close to any seq and serve the history a bounded ``Broadcaster`` has
+already evicted. Lines are ASCII (``json.dumps`` escapes everything
+else) and written with ``\n`` endings on every platform, so offsets are
+just summed lengths. On close the index is saved next to the recording
+(``<name>.jsonl.idx``), which lets the replay endpoint page a recording
+of any size by seeking instead of reading it from the top.
+
+``compress=True`` records block-compressed JSONL instead
+(``<name>.jsonl.gz``): every ``index_stride`` lines are written as one
+independent gzip member, so the file is still ordinary gzip (``zcat``
+reads it) while each indexed offset is a member boundary ``read_lines``
+can start decompressing from. The repeated keys, player names and bet
+types that make up most of a line fall well inside deflate's window, so
+a block shrinks to a small fraction of its JSONL. Lines of the block
+being filled stay in memory until it is written. ``load_session``, the
+index and the replay endpoint read either format by its suffix.
 """
 from __future__ import annotations
+import gzip
 import json
+import zlib
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import IO, Iterator, Optional, Tuple, Union
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
 
 from craps.events import Event, EventBus, SessionFinalized
-from craps.serialization import deserialize_event, serialize_event
+from craps.serialization import EncodedEvent, EventEncoder, deserialize_event
+
+
+#: Lines between indexed offsets: the most ``read_lines`` ever skips.
+INDEX_STRIDE = 256
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 2
+RECORDING_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.gz"
+RECORDING_SUFFIXES = (RECORDING_SUFFIX, COMPRESSED_SUFFIX)
+#: Speed over the last few percent: a block is compressed per ``stride`` events.
+COMPRESS_LEVEL = 6
+_READ_CHUNK = 1 << 16
+
+
+def index_path(recording: Union[str, Path]) -> Path:
+    """The sidecar index file of a recording."""
+    recording = Path(recording)
+    return recording.with_name(recording.name + INDEX_SUFFIX)
+
+
+def is_compressed(recording: Union[str, Path]) -> bool:
+    """Whether a recording is block-compressed JSONL."""
+    return Path(recording).name.endswith(COMPRESSED_SUFFIX)
+
+
+def is_recording(recording: Union[str, Path]) -> bool:
+    """Whether a file name is a recording in either format."""
+    return Path(recording).name.endswith(RECORDING_SUFFIXES)
+
+
+def _gzip_members(f: IO[bytes]) -> Iterator[Tuple[int, int, int]]:
+    """``(offset, end, newlines)`` of each complete gzip member in ``f``;
+    a truncated trailing member (an interrupted recording) is left out."""
+    pending = b""
+    position = 0  # file offset of pending[0]
+    while True:
+        if not pending:
+            pending = f.read(_READ_CHUNK)
+            if not pending:
+                return
+        start = position
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        newlines = 0
+        while True:
+            newlines += decompressor.decompress(pending).count(b"\n")
+            if decompressor.eof:
+                position += len(pending) - len(decompressor.unused_data)
+                pending = decompressor.unused_data
+                break
+            position += len(pending)
+            pending = f.read(_READ_CHUNK)
+            if not pending:
+                return
+        yield start, position, newlines
+
+
+@dataclass
+class RecordingIndex:
+    """Byte offsets into a recording, every ``stride`` lines (seqs).
+
+    In a compressed recording an offset is the start of the gzip member
+    holding that seq, which may be an earlier one than ``k * stride``
+    when the file was compressed by something else (a single-member
+    ``gzip`` of a JSONL recording indexes, but every read starts at 0).
+    """
+    stride: int = INDEX_STRIDE
+    #: Lines covered; line i holds seq i.
+    count: int = 0
+    #: Bytes covered.
+    size: int = 0
+    #: offsets[k] is the byte offset reads of seq k * stride start from.
+    offsets: List[int] = field(default_factory=list)
+    #: seqs[k] is the seq of the line at offsets[k].
+    seqs: List[int] = field(default_factory=list)
+
+    def add(self, line_bytes: int) -> None:
+        """Account for one more line of ``line_bytes`` bytes (newline included)."""
+        if self.count % self.stride == 0:
+            self.offsets.append(self.size)
+            self.seqs.append(self.count)
+        self.size += line_bytes
+        self.count += 1
+
+    def add_block(self, lines: int, block_bytes: int) -> None:
+        """Account for one more compressed block (gzip member) of
+        ``lines`` lines taking ``block_bytes`` bytes."""
+        while len(self.offsets) * self.stride < self.count + lines:
+            self.offsets.append(self.size)
+            self.seqs.append(self.count)
+        self.size += block_bytes
+        self.count += lines
+
+    def read_lines(self, recording: Union[str, Path], after_seq: int = -1,
+                   stop_seq: Optional[int] = None) -> Iterator[str]:
+        """Lines for seqs in ``(after_seq, stop_seq)`` — by default every
+        indexed one — starting from the nearest indexed offset."""
+        start = max(after_seq + 1, 0)
+        stop = self.count if stop_seq is None else min(stop_seq, self.count)
+        if start >= stop:
+            return
+        block = start // self.stride
+        seq = self.seqs[block]
+        with Path(recording).open("rb") as f:
+            f.seek(self.offsets[block])
+            source: Iterable[bytes] = gzip.GzipFile(fileobj=f, mode="rb") if is_compressed(recording) else f
+            for raw in source:
+                line = raw.rstrip(b"\r\n")
+                if not line.strip():
+                    continue
+                if seq >= start:
+                    yield line.decode("utf-8")
+                seq += 1
+                if seq >= stop:
+                    return
+
+    def save(self, recording: Union[str, Path]) -> None:
+        data = {"version": INDEX_VERSION, **self.__dict__}
+        index_path(recording).write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, recording: Union[str, Path]) -> Optional["RecordingIndex"]:
+        """The saved index, if there is one and it still covers the
+        whole recording (a live or appended file outgrows its index)."""
+        try:
+            data = json.loads(index_path(recording).read_text(encoding="utf-8"))
+            if data.pop("version") != INDEX_VERSION:
+                return None
+            index = cls(**data)
+            if index.size != Path(recording).stat().st_size:
+                return None
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return index
+
+    @classmethod
+    def build(cls, recording: Union[str, Path], stride: int = INDEX_STRIDE) -> "RecordingIndex":
+        """Index a recording by scanning it once (no JSON parsing).
+
+        A compressed one is decompressed member by member and its lines
+        counted by newline; it is expected to hold no blank lines."""
+        index = cls(stride=stride)
+        with Path(recording).open("rb") as f:
+            if is_compressed(recording):
+                for offset, end, newlines in _gzip_members(f):
+                    index.add_block(newlines, end - offset)
+                return index
+            for raw in f:
+                if raw.strip():
+                    index.add(len(raw))
+                else:
+                    index.size += len(raw)
+        return index
+
+    @classmethod
+    def for_recording(cls, recording: Union[str, Path]) -> "RecordingIndex":
+        """The saved index, else one built now and saved for next time."""
+        index = cls.load(recording)
+        if index is None:
+            index = cls.build(recording)
+            try:
+                index.save(recording)
+            except OSError:
+                pass  # a read-only sessions dir just means no caching
+        return index
 
 
 class SessionRecorder:
-    def __init__(self, table_id: str, sessions_dir: Union[str, Path] = "sessions") -> None:
+    def __init__(
+        self,
+        table_id: str,
+        sessions_dir: Union[str, Path] = "sessions",
+        index_stride: int = INDEX_STRIDE,
+        compress: bool = False,
+    ) -> None:
         self.table_id = table_id
+        self.compress = compress
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        self.path = Path(sessions_dir) / f"{table_id}_{timestamp}.jsonl"
-        self._file: Optional[IO[str]] = None  # opened lazily on first event
-        self._seq = 0
+        suffix = COMPRESSED_SUFFIX if compress else RECORDING_SUFFIX
+        self.path = Path(sessions_dir) / f"{table_id}_{timestamp}{suffix}"
+        self.index = RecordingIndex(stride=index_stride)
+        self._file: Optional[IO[bytes]] = None  # opened lazily on first event
+        #: Lines of the compressed block not yet written.
+        self._block: List[str] = []
 
     def subscribe(self, bus: EventBus) -> None:
-        bus.subscribe(Event, self._on_event)
+        encoder = EventEncoder(self.table_id)
+        encoder.subscribe(bus)
+        self.attach(encoder)
 
-    def _on_event(self, event: Event) -> None:
+    def attach(self, encoder: EventEncoder) -> None:
+        encoder.add_sink(self._on_encoded)
+
+    def _on_encoded(self, event: Event, encoded: EncodedEvent) -> None:
         if self._file is None:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self._file = self.path.open("w", encoding="utf-8")
-        envelope = serialize_event(event, seq=self._seq, table_id=self.table_id)
-        self._file.write(json.dumps(envelope, separators=(",", ":")) + "\n")
-        self._seq += 1
+            self._file = self.path.open("wb")
+        line = encoded.line + "\n"
+        if self.compress:
+            self._block.append(line)
+            if len(self._block) == self.index.stride:
+                self._write_block()
+        else:
+            self._file.write(line.encode("ascii"))
+            self.index.add(len(line))
         if isinstance(event, SessionFinalized):
             self.close()
 
+    def _write_block(self) -> None:
+        assert self._file is not None
+        member = gzip.compress("".join(self._block).encode("ascii"), COMPRESS_LEVEL, mtime=0)
+        self._file.write(member)
+        self.index.add_block(len(self._block), len(member))
+        self._block = []
+
+    @property
+    def count(self) -> int:
+        """Events recorded so far."""
+        return self.index.count + len(self._block)
+
+    def read_lines(self, after_seq: int = -1, stop_seq: Optional[int] = None) -> Iterator[str]:
+        """Recorded lines for seqs in ``(after_seq, stop_seq)`` — by default
+        everything recorded so far — seeking via the index. The unwritten
+        block is snapshotted now, so lines recorded while the caller is
+        suspended between items never disturb the iteration."""
+        if self._file is not None:
+            self._file.flush()
+        written = self.index.count
+        stop = self.count if stop_seq is None else min(stop_seq, self.count)
+        pending = self._block[max(after_seq + 1 - written, 0):max(stop - written, 0)]
+        return chain(
+            self.index.read_lines(self.path, after_seq, min(stop, written)),
+            (line[:-1] for line in pending),
+        )
+
     def close(self) -> None:
         if self._file is not None:
+            if self._block:
+                self._write_block()
             self._file.close()
             self._file = None
+            self.index.save(self.path)
 
 
 def load_session(path: Union[str, Path]) -> Iterator[Tuple[int, str, Event]]:
-    """Yield ``(seq, table_id, event)`` for each line of a recorded session."""
-    with Path(path).open("r", encoding="utf-8") as f:
+    """Yield ``(seq, table_id, event)`` for each line of a recorded
+    session, plain or compressed."""
+    opener = gzip.open if is_compressed(path) else open
+    with opener(path, "rt", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if line:
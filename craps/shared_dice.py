@@ -0,0 +1,102 @@
+"""Common-random-numbers runs: several strategies against one dice stream.
+
+Comparing strategies across separately seeded sessions leaves the dice
+variance in every difference. ``SharedDiceRunner`` seats each strategy
+alone at its own ``TableRunner`` — its own ``Table``, bankroll and
+statistics — and drives all of them in lockstep from a single ``Dice``.
+Each roll is drawn once and handed to every sub-table through its
+engine's ``forced_rolls``, so every strategy sees the identical
+sequence and a run costs one dice stream rather than one per strategy.
+
+The point, seven-outs and shooter changes depend only on the dice, so
+the sub-tables reach every shooter boundary on the same roll. The first
+sub-table's post-roll summary therefore stands for the whole run and
+drives the shooter / roll limits once per roll.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+from config import ACTIVE_PLAYERS
+from craps.craps_engine import PostRollSummary
+from craps.dice import CLASSIC_RNG, Dice
+from craps.profiler import RollProfiler
+from craps.statistics import Statistics
+from craps.table_runner import LineupConfig, TableRunner
+
+
+class SharedDiceRunner:
+    def __init__(
+        self,
+        table_id: str = "shared",
+        players: Optional[LineupConfig] = None,
+        house_rules: Optional[Dict[str, Any]] = None,
+        max_shooters: int = 10,
+        max_rolls: Optional[int] = None,
+        dice_seed: Optional[int] = None,
+        dice_rng_version: int = CLASSIC_RNG,
+        profiler: Optional[RollProfiler] = None,
+    ) -> None:
+        if players is None:
+            players = [
+                (name, strategy_name)
+                for name, (strategy_name, enabled) in ACTIVE_PLAYERS.items() if enabled
+            ]
+        if not players:
+            raise ValueError("A shared-dice run needs at least one player.")
+        names = [name for name, _ in players]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Player names must be unique: {names}")
+        self.table_id = table_id
+        self.max_shooters = max_shooters
+        self.max_rolls = max_rolls
+        self.dice = Dice(seed=dice_seed, rng_version=dice_rng_version)
+        #: Player name -> that player's single-seat sub-table.
+        self.runners: Dict[str, TableRunner] = {
+            name: TableRunner(
+                table_id=f"{table_id}:{name}",
+                players=[(name, strategy_name)],
+                house_rules=house_rules,
+                max_shooters=max_shooters,
+                quiet_mode=True,
+                profiler=profiler,
+            )
+            for name, strategy_name in players
+        }
+
+    def start_session(self) -> None:
+        for runner in self.runners.values():
+            runner.start_session()
+
+    def roll_once(self) -> PostRollSummary:
+        """Roll the shared dice once and play that roll at every sub-table."""
+        outcome = self.dice.roll()
+        summaries: List[PostRollSummary] = []
+        for runner in self.runners.values():
+            dice = runner.engine.dice
+            if dice is None:
+                raise RuntimeError("Session must be started before rolling.")
+            dice.forced_rolls.append(outcome)
+            summaries.append(runner.roll_once())
+        return summaries[0]
+
+    def run(self) -> Dict[str, Statistics]:
+        """Play the session and return each player's sub-table statistics."""
+        self.start_session()
+
+        rolls = 0
+        shooters_done = 0
+        try:
+            while shooters_done < self.max_shooters:
+                summary = self.roll_once()
+                rolls += 1
+                if summary.new_shooter_assigned:
+                    shooters_done += 1
+                if self.max_rolls is not None and rolls >= self.max_rolls:
+                    break
+        except KeyboardInterrupt:
+            pass  # stop cleanly; finalize what we have
+
+        return self.finalize()
+
+    def finalize(self) -> Dict[str, Statistics]:
+        return {name: runner.finalize() for name, runner in self.runners.items()}
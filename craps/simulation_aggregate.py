@@ -0,0 +1,215 @@
+"""Mergeable, fixed-size results for batch simulation runs.
+
+Workers used to ship every session's ``Statistics`` back through the
+process pool, and the report loaded the whole pickled list — roll,
+bankroll and at-risk histories included — before summing a handful of
+fields. ``SimulationAggregate`` keeps only what the report and the
+high-roller export read, in structures whose size does not grow with the
+number of sessions:
+
+- counters and sums (sessions, throws, amounts bet/won/lost, per-player net),
+- a fixed-bin ``Histogram`` of per-shooter nets,
+- ``TopK`` tables of the session high and low rollers,
+- the best session per strategy, by session number only: with the run's
+  ``master_seed`` that is enough to replay it (``replay_session``),
+- optionally, the run's per-phase roll timings (``RollProfiler``).
+
+Like ``Statistics.merge``, folding is additive: a worker reduces its
+sessions into one aggregate as it goes, and the parent merges partials in
+any order.
+"""
+from __future__ import annotations
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from craps.dice import CLASSIC_RNG
+from craps.profiler import RollProfiler
+from craps.statistics import Statistics
+
+#: (profit, session_number, player_name, strategy_name)
+RollerEntry = Tuple[int, int, str, str]
+
+
+@dataclass
+class Histogram:
+    """Fixed-width bins over [low, high), with under/overflow counts and
+    exact count/sum/sum-of-squares for the mean and spread."""
+    low: int = -2000
+    high: int = 2000
+    bin_width: int = 10
+    bins: List[int] = field(default_factory=list)
+    underflow: int = 0
+    overflow: int = 0
+    count: int = 0
+    total: int = 0
+    total_sq: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.bins:
+            self.bins = [0] * ((self.high - self.low) // self.bin_width)
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.bins[(value - self.low) // self.bin_width] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        if (self.low, self.high, self.bin_width) != (other.low, other.high, other.bin_width):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        self.bins = [a + b for a, b in zip(self.bins, other.bins)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+
+    def edges(self) -> List[int]:
+        return list(range(self.low, self.high + 1, self.bin_width))
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def stdev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return max(variance, 0.0) ** 0.5
+
+
+@dataclass
+class TopK:
+    """The ``k`` largest entries seen (or smallest, with ``largest=False``)."""
+    k: int = 10
+    largest: bool = True
+    entries: List[RollerEntry] = field(default_factory=list)  # heap, worst kept entry first
+
+    def _key(self, entry: RollerEntry) -> RollerEntry:
+        profit, session_number, player_name, strategy_name = entry
+        return (profit if self.largest else -profit, session_number, player_name, strategy_name)
+
+    def add(self, entry: RollerEntry) -> None:
+        keyed = self._key(entry)
+        if len(self.entries) < self.k:
+            heapq.heappush(self.entries, keyed)
+        elif keyed > self.entries[0]:
+            heapq.heapreplace(self.entries, keyed)
+
+    def merge(self, other: "TopK") -> None:
+        for entry in other.ranked():
+            self.add(entry)
+
+    def ranked(self) -> List[RollerEntry]:
+        """Best first."""
+        return [self._key(entry) for entry in sorted(self.entries, reverse=True)]
+
+
+@dataclass
+class SimulationAggregate:
+    #: Seed the run's sessions derive from; None for unseeded/legacy data.
+    master_seed: Optional[int] = None
+    #: Dice RNG version the run's sessions rolled with (see craps.dice).
+    rng_version: int = CLASSIC_RNG
+    sessions: int = 0
+    throws: int = 0
+    total_bet: int = 0
+    total_won: int = 0
+    total_lost: int = 0
+    #: player -> summed net win/loss across sessions.
+    player_net: Counter = field(default_factory=Counter)
+    #: player -> Counter of shooter outcomes ("won" / "lost" / "push").
+    shooter_outcomes: Dict[str, Counter] = field(default_factory=dict)
+    #: Every player's net per shooter.
+    shooter_nets: Histogram = field(default_factory=Histogram)
+    max_win: Optional[Tuple[int, str]] = None   # (net, player)
+    max_loss: Optional[Tuple[int, str]] = None  # (net, player)
+    high_rollers: TopK = field(default_factory=TopK)
+    low_rollers: TopK = field(default_factory=lambda: TopK(largest=False))
+    #: strategy -> best high-roller entry seen for it.
+    best_sessions: Dict[str, RollerEntry] = field(default_factory=dict)
+    #: Per-phase roll timings, when the run was profiled.
+    profile: Optional[RollProfiler] = None
+
+    def add(self, stats: Statistics) -> None:
+        """Fold one finished session in."""
+        self.sessions += 1
+        self.throws += stats.session_rolls
+        self.total_bet += stats.total_amount_bet
+        self.total_won += stats.total_amount_won
+        self.total_lost += stats.total_amount_lost
+        for player, player_stats in stats.player_stats.items():
+            self.player_net[player] += player_stats["net_win_loss"]
+
+        for shooter_result in stats.shooter_stats.values():
+            for player, net in shooter_result.items():
+                counter = self.shooter_outcomes.setdefault(player, Counter())
+                counter["won" if net > 0 else "lost" if net < 0 else "push"] += 1
+                self.shooter_nets.add(net)
+                if self.max_win is None or net > self.max_win[0]:
+                    self.max_win = (net, player)
+                if self.max_loss is None or net < self.max_loss[0]:
+                    self.max_loss = (net, player)
+
+        session_number = stats.session_number if stats.session_number is not None else -1
+        if stats.session_high_roller:
+            player_name, strategy_name, profit = stats.session_high_roller
+            entry = (profit, session_number, player_name, strategy_name)
+            self.high_rollers.add(entry)
+            self._offer_best_session(entry)
+        if stats.session_low_roller:
+            player_name, strategy_name, loss = stats.session_low_roller
+            self.low_rollers.add((loss, session_number, player_name, strategy_name))
+
+    def merge(self, other: "SimulationAggregate") -> None:
+        """Fold another partial aggregate in (order-independent totals)."""
+        if self.master_seed is None:
+            self.master_seed = other.master_seed
+        elif other.master_seed is not None and other.master_seed != self.master_seed:
+            raise ValueError("Cannot merge aggregates from runs with different master seeds")
+        if other.rng_version != self.rng_version:
+            raise ValueError("Cannot merge aggregates from runs with different dice RNG versions")
+        self.sessions += other.sessions
+        self.throws += other.throws
+        self.total_bet += other.total_bet
+        self.total_won += other.total_won
+        self.total_lost += other.total_lost
+        self.player_net.update(other.player_net)
+        for player, counter in other.shooter_outcomes.items():
+            self.shooter_outcomes.setdefault(player, Counter()).update(counter)
+        self.shooter_nets.merge(other.shooter_nets)
+        if other.max_win is not None and (self.max_win is None or other.max_win[0] > self.max_win[0]):
+            self.max_win = other.max_win
+        if other.max_loss is not None and (self.max_loss is None or other.max_loss[0] < self.max_loss[0]):
+            self.max_loss = other.max_loss
+        self.high_rollers.merge(other.high_rollers)
+        self.low_rollers.merge(other.low_rollers)
+        for entry in other.best_sessions.values():
+            self._offer_best_session(entry)
+        if other.profile is not None:
+            if self.profile is None:
+                self.profile = RollProfiler()
+            self.profile.merge(other.profile)
+
+    def _offer_best_session(self, entry: RollerEntry) -> None:
+        strategy_name = entry[3]
+        best = self.best_sessions.get(strategy_name)
+        # Ties go to the earlier session, whatever order partials arrive in.
+        if best is None or (entry[0], -entry[1]) > (best[0], -best[1]):
+            self.best_sessions[strategy_name] = entry
+
+    def house_take(self) -> int:
+        return self.total_lost - self.total_won
+
+    @classmethod
+    def from_sessions(cls, sessions: List[Statistics]) -> "SimulationAggregate":
+        aggregate = cls()
+        for stats in sessions:
+            aggregate.add(stats)
+        return aggregate
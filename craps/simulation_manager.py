@@ -1,19 +1,20 @@
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import List
+from typing import List, Optional
 from craps.statistics import Statistics
-from craps.simulation_runner import simulate_single_session
+from craps.simulation_runner import new_master_seed, replay_session
 from tqdm import tqdm
 
 class SimulationManager:
-    def __init__(self, num_sessions: int = 1000, max_workers: int = 4) -> None:
+    def __init__(self, num_sessions: int = 1000, max_workers: int = 4, master_seed: Optional[int] = None) -> None:
         self.num_sessions = num_sessions
         self.max_workers = max_workers
+        self.master_seed = master_seed if master_seed is not None else new_master_seed()
         self.stats_results: List[Statistics] = []
 
     def run_simulations(self) -> None:
 
         with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(simulate_single_session) for _ in range(self.num_sessions)]
+            futures = [executor.submit(replay_session, self.master_seed, i) for i in range(self.num_sessions)]
             for future in tqdm(as_completed(futures), total=self.num_sessions, desc="Running Simulations"):
                 result = future.result()
                 self.stats_results.append(result)
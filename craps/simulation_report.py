@@ -1,22 +1,26 @@
 import pickle
+from typing import List, Union
+from craps.simulation_aggregate import SimulationAggregate
 from craps.statistics import Statistics
 import matplotlib.pyplot as plt
 from collections import Counter
 
 def simulation_report(path: str) -> None:
     with open(path, "rb") as f:
-        sessions: list[Statistics] = pickle.load(f)
-    
-    summarize_simulation(sessions)
-    summarize_by_shooter(sessions)
+        results: Union[SimulationAggregate, List[Statistics]] = pickle.load(f)
+
+    # Older runs pickled the full per-session list.
+    aggregate = results if isinstance(results, SimulationAggregate) else SimulationAggregate.from_sessions(results)
+    summarize_simulation(aggregate)
+    summarize_by_shooter(aggregate)
 
-def summarize_simulation(sessions: list[Statistics]) -> None:
-    total_sessions = len(sessions)
-    total_throws = sum(s.session_rolls for s in sessions)
-    total_bet = sum(s.total_amount_bet for s in sessions)
-    total_won = sum(s.total_amount_won for s in sessions)
-    total_lost = sum(s.total_amount_lost for s in sessions)
-    total_take = sum(s.house_take() for s in sessions)
+def summarize_simulation(aggregate: SimulationAggregate) -> None:
+    total_sessions = aggregate.sessions
+    total_throws = aggregate.throws
+    total_bet = aggregate.total_bet
+    total_won = aggregate.total_won
+    total_lost = aggregate.total_lost
+    total_take = aggregate.house_take()
 
     throws_per_session = total_throws / total_sessions if total_sessions else 0
     house_edge = (total_take / total_bet * 100) if total_bet else 0
@@ -33,41 +37,26 @@ def summarize_simulation(sessions: list[Statistics]) -> None:
     print(f"House Edge           : {house_edge:.3f}%")
     print("-" * 80)
 
-def summarize_by_shooter(sessions: list[Statistics]) -> None:
-    from collections import Counter
+    for player, net in sorted(aggregate.player_net.items()):
+        per_session = net / total_sessions if total_sessions else 0
+        print(f"{player:>12} →  Net: ${net:,} (${per_session:,.2f} per session)")
 
-    print("\n📊 Shooter Outcome Summary")
+    print("\n🏆 Top Session High Rollers")
+    for profit, session_number, player, strategy in aggregate.high_rollers.ranked():
+        print(f"  ${profit:>8,}  {player} ({strategy}), session {session_number}")
+    print("\n🪦 Top Session Low Rollers")
+    for loss, session_number, player, strategy in aggregate.low_rollers.ranked():
+        print(f"  ${loss:>8,}  {player} ({strategy}), session {session_number}")
     print("-" * 80)
 
-    outcome_counter: dict[str, Counter] = {}
-    shooter_net_results = []
-
-    max_win = float('-inf')
-    max_loss = float('inf')
-    max_winner = ""
-    max_loser = ""
-
-    for stats in sessions:
-        for shooter_result in stats.shooter_stats.values():
-            for player, net in shooter_result.items():
-                if player not in outcome_counter:
-                    outcome_counter[player] = Counter()
-
-                if net > 0:
-                    outcome_counter[player]["won"] += 1
-                elif net < 0:
-                    outcome_counter[player]["lost"] += 1
-                else:
-                    outcome_counter[player]["push"] += 1
-
-                shooter_net_results.append(net)
+def summarize_by_shooter(aggregate: SimulationAggregate) -> None:
+    print("\n📊 Shooter Outcome Summary")
+    print("-" * 80)
 
-                if net > max_win:
-                    max_win = net
-                    max_winner = player
-                if net < max_loss:
-                    max_loss = net
-                    max_loser = player
+    outcome_counter = aggregate.shooter_outcomes
+    shooter_nets = aggregate.shooter_nets
+    max_win, max_winner = aggregate.max_win or (float('-inf'), "")
+    max_loss, max_loser = aggregate.max_loss or (float('inf'), "")
 
     print(f"📈 Shooter outcome histograms...")
     for player, counter in outcome_counter.items():
@@ -78,10 +67,12 @@ def summarize_by_shooter(sessions: list[Statistics]) -> None:
     print("-" * 80)
     print(f"🥇 Max won by a player in one shooter: {max_win:,} ({max_winner})")
     print(f"💀 Max lost by a player in one shooter: {max_loss:,} ({max_loser})")
+    print(f"📐 Net per shooter: mean {shooter_nets.mean():,.2f}, stdev {shooter_nets.stdev():,.2f}"
+          f" ({shooter_nets.underflow:,} below / {shooter_nets.overflow:,} above the histogram range)")
 
     # Histogram
     plt.figure(figsize=(10, 6))
-    plt.hist(shooter_net_results, bins=100, color='skyblue', edgecolor='black')
+    plt.stairs(shooter_nets.bins, shooter_nets.edges(), fill=True, color='skyblue', edgecolor='black')
     plt.title("Histogram of Net Win/Loss per Shooter")
     plt.xlabel("Net Amount Won or Lost by a Player per Shooter")
     plt.ylabel("Frequency")
@@ -1,9 +1,83 @@
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from craps.dice import CLASSIC_RNG
+from craps.profiler import RollProfiler
+from craps.simulation_aggregate import SimulationAggregate
 from craps.statistics import Statistics
 
 
-def simulate_single_session() -> Statistics:
+def session_seed(master_seed: int, session_index: int) -> int:
+    """The dice seed for one session of a run.
+
+    Equivalent to ``SeedSequence(master_seed).spawn(n)[session_index]``
+    without materializing the first ``session_index`` children, so each
+    session's stream is independent of the others and of the worker that
+    happens to run it, and any one session can be replayed from
+    ``(master_seed, session_index)`` alone.
+    """
+    sequence = np.random.SeedSequence(master_seed, spawn_key=(session_index,))
+    low, high = sequence.generate_state(2, dtype=np.uint32)
+    return (int(high) << 32) | int(low)
+
+
+def new_master_seed() -> int:
+    """Fresh OS entropy, for runs that were not given a seed."""
+    return int(np.random.SeedSequence().entropy) % (1 << 64)  # type: ignore[arg-type]
+
+
+def simulate_single_session(
+    dice_seed: Optional[int] = None,
+    rng_version: int = CLASSIC_RNG,
+    profiler: Optional[RollProfiler] = None,
+) -> Statistics:
     from config import NUM_SHOOTERS
     from craps.table_runner import TableRunner
 
-    runner = TableRunner(max_shooters=NUM_SHOOTERS, quiet_mode=True)
+    runner = TableRunner(
+        max_shooters=NUM_SHOOTERS,
+        dice_seed=dice_seed,
+        dice_rng_version=rng_version,
+        quiet_mode=True,
+        profiler=profiler,
+    )
     return runner.run()
+
+
+def replay_session(
+    master_seed: int,
+    session_index: int,
+    rng_version: int = CLASSIC_RNG,
+    profiler: Optional[RollProfiler] = None,
+) -> Statistics:
+    """Re-run one session of a seeded batch run, bit for bit. Pass the
+    run's dice ``rng_version``: the same seed rolls differently under each."""
+    stats = simulate_single_session(session_seed(master_seed, session_index), rng_version, profiler)
+    stats.session_number = session_index
+    return stats
+
+
+def simulate_session_block(
+    first_session: int,
+    count: int,
+    master_seed: int,
+    rng_version: int = CLASSIC_RNG,
+    profile: bool = False,
+) -> Tuple[SimulationAggregate, float]:
+    """Run ``count`` sessions in this worker and return them folded into one
+    aggregate, plus the wall time spent (for chunk-size tuning).
+
+    Sessions are numbered ``first_session`` onward and seeded from
+    ``(master_seed, session_number)``, so results do not depend on how the
+    run was chunked or which worker ran which block. With ``profile`` the
+    block's per-phase roll timings ride back in ``aggregate.profile``.
+    """
+    started = time.perf_counter()
+    aggregate = SimulationAggregate(master_seed=master_seed, rng_version=rng_version)
+    if profile:
+        aggregate.profile = RollProfiler()
+    for session_number in range(first_session, first_session + count):
+        aggregate.add(replay_session(master_seed, session_number, rng_version, aggregate.profile))
+    return aggregate, time.perf_counter() - started
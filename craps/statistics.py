@@ -26,6 +26,7 @@ class Statistics:
         self.roll_history: List[Dict[str, Any]] = []
         self.session_high_roller: Optional[tuple[str, str, int]] = None  # (player_name, strategy_name, profit)
         self.session_low_roller: Optional[tuple[str, str, int]] = None   # (player_name, strategy_name, loss)
+        self.session_number: Optional[int] = None  # position within a batch simulation run
 
         # For visualization
         self.roll_numbers: List[int] = [0]  # Start with roll 0
@@ -170,7 +171,7 @@ class Statistics:
     def update_player_risk(self, players: List[Any], table: Any) -> None:
         """Update the amount at risk for each player this roll."""
         for player in players:
-            at_risk = sum(b.amount for b in table.bets if b.owner == player and b.status == "active")
+            at_risk = table.bets.owner_total(player, active_only=True)
             if player.name not in self.at_risk_history:
                 self.at_risk_history[player.name] = []
             self.at_risk_history[player.name].append(at_risk)
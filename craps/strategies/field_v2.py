@@ -8,6 +8,7 @@ class FieldV2(ContractStrategy):
     """v2 port of FieldBetStrategy: keep one Field bet up in any phase."""
 
     name = "Field v2"
+    memoizable = True
 
     def __init__(self, min_bet: int) -> None:
         self.min_bet = min_bet
@@ -18,6 +18,7 @@ class IronCrossV2(ContractStrategy):
     around the point and a perpetual Field bet during the point phase."""
 
     name = "Iron Cross v2"
+    memoizable = True
 
     def __init__(
         self,
@@ -28,6 +29,12 @@ class IronCrossV2(ContractStrategy):
         self.min_bet = min_bet
         self.play_pass_line = play_pass_line
         self.odds_type = odds_type
+        # Odds are clamped to the bankroll; above the largest odds bet the
+        # bankroll makes no difference to the layout.
+        if play_pass_line and odds_type:
+            data = ODDS_MULTIPLIERS.get(odds_type)
+            multipliers = data.values() if isinstance(data, dict) else [data]
+            self.bankroll_cap = min_bet * max((m for m in multipliers if m), default=0)
 
     def wants(self, view: TableView, memo: Any) -> Tuple[Layout, Any]:
         specs: List[BetSpec] = []
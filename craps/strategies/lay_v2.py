@@ -15,6 +15,7 @@ class LayV2(ContractStrategy):
     point phase. v1 dedups on *active* lay bets specifically, so we do too."""
 
     name = "Lay v2"
+    memoizable = True
 
     def __init__(self, numbers_or_strategy: Union[str, List[int]]) -> None:
         if isinstance(numbers_or_strategy, str):
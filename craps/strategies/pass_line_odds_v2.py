@@ -16,6 +16,7 @@ class PassLineOddsV2(ContractStrategy):
     """
 
     name = "Pass Line Odds v2"
+    memoizable = True
 
     def __init__(self, odds_multiple: Union[int, str] = 1) -> None:
         self.odds_multiple = odds_multiple
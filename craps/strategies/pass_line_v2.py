@@ -14,6 +14,7 @@ class PassLineV2(ContractStrategy):
     """
 
     name = "Pass Line v2"
+    memoizable = True
 
     def __init__(self, bet_amount: int) -> None:
         self.bet_amount = bet_amount
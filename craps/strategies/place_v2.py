@@ -15,6 +15,7 @@ class PlaceV2(ContractStrategy):
     Pass Line point or an existing Place bet."""
 
     name = "Place v2"
+    memoizable = True
 
     def __init__(self, numbers_or_strategy: Union[str, List[int]]) -> None:
         if isinstance(numbers_or_strategy, str):
@@ -11,11 +11,19 @@ engine path. The adapter deliberately does NOT dedupe or reorder specs:
 existence checks belong in ``wants()`` (mirroring how v1 strategies guard
 with ``has_active_bet``), so a v2 port stays roll-for-roll identical to its
 v1 original under the regression harness.
+
+Strategies whose decisions depend only on a small state can opt into a
+decision cache (``ContractStrategy.memoizable``): the adapter keys each
+call on a compact signature read straight off the engine objects and
+replays the cached layout and memo on a hit, skipping both the
+``TableView`` build and ``wants()``.
 """
 from __future__ import annotations
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from craps.base_strategy import BaseStrategy
 from craps.bet import Bet
@@ -23,6 +31,7 @@ from craps.game_state import GameState
 from craps.player import Player
 
 if TYPE_CHECKING:
+    from craps.profiler import RollProfiler
     from craps.table import Table
 
 BetNumber = Union[int, Tuple[int, int], None]
@@ -110,12 +119,27 @@ def flat_bet_minimum(table_minimum: int, number: Optional[int]) -> int:
     return table_minimum
 
 
+#: Decisions each memoizable adapter keeps (least recently used evicted).
+DECISION_CACHE_SIZE = 256
+
+
 class ContractStrategy(ABC):
     """Base class for v2 strategies. Implementations must be pure: no I/O,
     no engine object access — state across rolls travels in the memo."""
 
     name: str = "Unnamed v2"
 
+    #: Opt-in decision cache. Only set this when ``wants()`` reads nothing
+    #: but the stage, phase/point/puck, table minimum and maximum, the
+    #: type/number/amount/status/parent type of the player's bets, and a
+    #: hashable memo — plus the bankroll up to ``bankroll_cap``.
+    memoizable: bool = False
+    #: For memoizable strategies that read ``view.bankroll``: the largest
+    #: bankroll ``wants()`` can tell apart (e.g. the biggest amount it clamps
+    #: to the bankroll). Bankrolls above it share cache entries. None means
+    #: the bankroll is never read.
+    bankroll_cap: Optional[int] = None
+
     @abstractmethod
     def wants(self, view: TableView, memo: Any) -> Tuple[Layout, Any]:
         """Return the bets to place this call and the next memo."""
@@ -126,36 +150,80 @@ class ContractStrategy(ABC):
 
 
 def build_table_view(game_state: GameState, player: Player, table: "Table", stage: str = "place") -> TableView:
-    own_bets = tuple(
-        BetView(
-            bet_type=b.bet_type,
-            amount=b.amount,
-            number=b.number,
-            status=b.status,
-            parent_type=b.parent_bet.bet_type if b.parent_bet is not None else None,
-            parent_number=b.parent_bet.number if b.parent_bet is not None else None,
-            hits=getattr(b, "hits", 0),
-            payout=b.resolved_payout,
-            unit=b.unit or 1,
+    return TableViewCache().build(game_state, player, table, stage)
+
+
+class TableViewCache:
+    """Builds one player's ``TableView`` call after call, reusing what did
+    not change.
+
+    Each live bet's fields are compared against the ones its ``BetView``
+    was built from; an unchanged bet keeps its ``BetView`` object, an
+    unchanged set of bets keeps the same ``bets`` tuple, and an unchanged
+    snapshot (per stage) is the same ``TableView`` as last time. Views are
+    frozen, so equal snapshots also hash equal.
+    """
+
+    def __init__(self) -> None:
+        #: id(bet) -> (bet, the fields its view holds, the view).
+        self._bet_views: Dict[int, Tuple[Bet, Tuple[Any, ...], BetView]] = {}
+        self._bets: Tuple[BetView, ...] = ()
+        #: stage -> (scalar fields, the view built from them).
+        self._views: Dict[str, Tuple[Tuple[Any, ...], TableView]] = {}
+
+    def build(self, game_state: GameState, player: Player, table: "Table", stage: str = "place") -> TableView:
+        previous = self._bet_views
+        current: Dict[int, Tuple[Bet, Tuple[Any, ...], BetView]] = {}
+        bet_views: List[BetView] = []
+        for b in table.bets.for_owner(player):
+            parent = b.parent_bet
+            fields = (
+                b.bet_type, b.amount, b.number, b.status,
+                parent.bet_type if parent is not None else None,
+                parent.number if parent is not None else None,
+                b.hits, b.resolved_payout, b.unit or 1,
+            )
+            entry = previous.get(id(b))
+            if entry is None or entry[0] is not b or entry[1] != fields:
+                entry = (b, fields, BetView(*fields))
+            current[id(b)] = entry
+            bet_views.append(entry[2])
+        self._bet_views = current
+
+        bets = self._bets
+        if len(bet_views) != len(bets) or any(new is not old for new, old in zip(bet_views, bets)):
+            bets = self._bets = tuple(bet_views)
+
+        stats = getattr(game_state, "stats", None)
+        rules = table.house_rules
+        phase, point, bankroll = game_state.phase, game_state.point, player.balance
+        last_roll_total = getattr(stats, "last_roll_total", None) if stats is not None else None
+        scalars = (
+            phase, point, game_state.previous_point, bankroll,
+            rules.table_minimum, rules.table_maximum, game_state.puck_on,
+            game_state.all_completed, game_state.tall_completed, game_state.small_completed,
+            last_roll_total,
         )
-        for b in table.bets if b.owner == player
-    )
-    stats = getattr(game_state, "stats", None)
-    return TableView(
-        phase=game_state.phase,
-        point=game_state.point,
-        previous_point=game_state.previous_point,
-        bankroll=player.balance,
-        bets=own_bets,
-        table_minimum=table.house_rules.table_minimum,
-        table_maximum=table.house_rules.table_maximum,
-        stage=stage,
-        puck_on=game_state.puck_on,
-        all_completed=game_state.all_completed,
-        tall_completed=game_state.tall_completed,
-        small_completed=game_state.small_completed,
-        last_roll_total=getattr(stats, "last_roll_total", None) if stats is not None else None,
-    )
+        cached = self._views.get(stage)
+        if cached is not None and cached[1].bets is bets and cached[0] == scalars:
+            return cached[1]
+        view = TableView(
+            phase=phase,
+            point=point,
+            previous_point=game_state.previous_point,
+            bankroll=bankroll,
+            bets=bets,
+            table_minimum=rules.table_minimum,
+            table_maximum=rules.table_maximum,
+            stage=stage,
+            puck_on=game_state.puck_on,
+            all_completed=game_state.all_completed,
+            tall_completed=game_state.tall_completed,
+            small_completed=game_state.small_completed,
+            last_roll_total=last_roll_total,
+        )
+        self._views[stage] = (scalars, view)
+        return view
 
 
 class V2StrategyAdapter(BaseStrategy):
@@ -169,6 +237,80 @@ class V2StrategyAdapter(BaseStrategy):
         self.contract = contract
         self.strategy_name = strategy_name or contract.name
         self._memo: Any = None
+        self._profiler: Optional["RollProfiler"] = None
+        self._profile_name = self.strategy_name
+        #: State signature -> (layout, next memo), for memoizable contracts.
+        self._cache: Optional["OrderedDict[Hashable, Tuple[Layout, Any]]"] = (
+            OrderedDict() if contract.memoizable else None
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._views = TableViewCache()
+
+    def profile(self, profiler: "RollProfiler", name: Optional[str] = None) -> None:
+        """Time every decision (wants() call or cache hit) into ``profiler``
+        under ``name``."""
+        self._profiler = profiler
+        self._profile_name = name or self.strategy_name
+
+    def _wants(self, game_state: GameState, player: Player, table: "Table", stage: str) -> Layout:
+        profiler = self._profiler
+        if profiler is None:
+            return self._decide(game_state, player, table, stage)
+        started = time.perf_counter()
+        layout = self._decide(game_state, player, table, stage)
+        profiler.add_strategy(self._profile_name, time.perf_counter() - started)
+        return layout
+
+    def _decide(self, game_state: GameState, player: Player, table: "Table", stage: str) -> Layout:
+        cache = self._cache
+        if cache is None:
+            view = self._views.build(game_state, player, table, stage)
+            layout, self._memo = self.contract.wants(view, self._memo)
+            return layout
+
+        key = self._signature(game_state, player, table, stage)
+        try:
+            hit = cache.get(key)
+        except TypeError:  # unhashable memo: decide uncached
+            view = self._views.build(game_state, player, table, stage)
+            layout, self._memo = self.contract.wants(view, self._memo)
+            return layout
+        if hit is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            layout, self._memo = hit
+            return layout
+
+        self.cache_misses += 1
+        view = self._views.build(game_state, player, table, stage)
+        layout, self._memo = self.contract.wants(view, self._memo)
+        cache[key] = (layout, self._memo)
+        if len(cache) > DECISION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return layout
+
+    def _signature(self, game_state: GameState, player: Player, table: "Table", stage: str) -> Hashable:
+        """Everything a memoizable ``wants()`` may read, without building
+        the view (phase and puck follow from the point)."""
+        bets = tuple(
+            (
+                b.bet_type, b.number, b.amount, b.status,
+                b.parent_bet.bet_type if b.parent_bet is not None else None,
+            )
+            for b in table.bets.for_owner(player)
+        )
+        cap = self.contract.bankroll_cap
+        rules = table.house_rules
+        return (
+            stage,
+            game_state.point,
+            bets,
+            rules.table_minimum,
+            rules.table_maximum,
+            min(player.balance, cap) if cap is not None else None,
+            self._memo,
+        )
 
     @property
     def turned_off(self) -> bool:
@@ -177,27 +319,19 @@ class V2StrategyAdapter(BaseStrategy):
         return bool(getattr(self.contract, "turned_off", False))
 
     def place_bets(self, game_state: GameState, player: Player, table: "Table") -> List[Bet]:
-        view = build_table_view(game_state, player, table)
-        layout, self._memo = self.contract.wants(view, self._memo)
+        layout = self._wants(game_state, player, table, "place")
 
         bets: List[Bet] = []
         for spec in layout:
             if spec.set_status is not None:
                 # Status spec: reshape a live bet (e.g. reactivation), place nothing
-                live = next(
-                    (b for b in table.bets
-                     if b.owner == player and b.bet_type == spec.bet_type and b.number == spec.number),
-                    None,
-                )
+                live = table.bets.find(player, spec.bet_type, spec.number)
                 if live is not None and live.status != spec.set_status:
                     live.status = spec.set_status
                 continue
             if spec.odds_on is not None:
-                parent = next(
-                    (b for b in table.bets
-                     if b.owner == player and b.bet_type == spec.odds_on
-                     and (spec.number is None or b.number == spec.number)),
-                    None,
+                parent = table.bets.find(
+                    player, spec.odds_on, spec.number, any_number=spec.number is None,
                 )
                 if parent is None:
                     continue  # No live parent bet to attach odds to
@@ -224,16 +358,11 @@ class V2StrategyAdapter(BaseStrategy):
         with no live match are ignored, mirroring the v1 engine discarding
         adjust_bets return values.
         """
-        view = build_table_view(game_state, player, table, stage="adjust")
-        layout, self._memo = self.contract.wants(view, self._memo)
+        layout = self._wants(game_state, player, table, "adjust")
 
         changed: List[Bet] = []
         for spec in layout:
-            live = next(
-                (b for b in table.bets
-                 if b.owner == player and b.bet_type == spec.bet_type and b.number == spec.number),
-                None,
-            )
+            live = table.bets.find(player, spec.bet_type, spec.number)
             if live is None:
                 continue
             if live.amount != spec.amount:
@@ -1,12 +1,17 @@
-from typing import List, Optional, Tuple, TYPE_CHECKING, Union
+from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING, Union
 from craps.bet import Bet
-from craps.play_by_play import PlayByPlay
+from craps.bet_store import BetStore
+from craps.play_by_play import PlayByPlay, narrating
 from craps.house_rules import HouseRules
 from craps.rules_engine import RulesEngine
+from craps.compiled_rules import compile_rules
 from craps.lineup import PlayerLineup
 from craps.game_state import GameState
 from craps.player import Player
 
+#: Odds follow their parent bet, so they resolve in a second pass.
+_ODDS_BET_TYPES = frozenset({"Pass Line Odds", "Come Odds", "Don't Pass Odds", "Don't Come Odds"})
+
 class Table:
     def __init__(self, house_rules: HouseRules, play_by_play: PlayByPlay, rules_engine: RulesEngine, player_lineup: PlayerLineup) -> None:
         """
@@ -19,11 +24,20 @@ class Table:
         self.house_rules = house_rules
         self.play_by_play = play_by_play
         self.rules_engine = rules_engine  # Use the passed RulesEngine
+        self.compiled_rules = compile_rules(house_rules)  # Per-roll resolution tables
         self.player_lineup = player_lineup
-        self.bets: List[Bet] = []  # All bets on the table
+        self._bets = BetStore()  # All bets on the table, indexed
         self.unit = self.house_rules.table_minimum // 5  # Unit for Place/Buy bets
         self.game_state: Optional[GameState] = None
 
+    @property
+    def bets(self) -> BetStore:
+        return self._bets
+
+    @bets.setter
+    def bets(self, bets: Iterable[Bet]) -> None:
+        self._bets = BetStore(bets)
+
     def get_rules_engine(self) -> RulesEngine:
         """Expose RulesEngine for other classes to query."""
         return self.rules_engine
@@ -49,24 +63,19 @@ class Table:
         :param number: The number associated with the bet (e.g., 6 or (2, 5) for Hop bets).
         :return: True if an active duplicate bet exists.
         """
-        for bet in self.bets:
-            if (
-                bet.owner == player
-                and bet.bet_type == bet_type
-                and bet.number == number
-            ):
-                return True
-        return False
+        return self.bets.find(player, bet_type, number) is not None
 
     def reactivate_inactive_bets(self) -> None:
         """
         Reactivate inactive Place bets when the point is set.
         """
+        narrate = narrating(self.play_by_play)
         reactivated_bets = []
         for bet in self.bets:
             if bet.bet_type.startswith("Place") and bet.status == "inactive":
                 bet.status = "active"
-                reactivated_bets.append(f"{bet.owner.name}'s {bet.bet_type}")
+                if narrate:
+                    reactivated_bets.append(f"{bet.owner.name}'s {bet.bet_type}")
 
         if reactivated_bets:
             message = f"{', '.join(reactivated_bets)} are now ON."
@@ -86,7 +95,7 @@ class Table:
             valid, message = self.validate_bet(bet, phase)
 
         if not valid:
-            if self.play_by_play and message:
+            if message and narrating(self.play_by_play):
                 self.play_by_play.write(f"  🚫 {message}")
             return False
 
@@ -99,7 +108,7 @@ class Table:
         if bet.vig and not self.house_rules.vig_on_win:
             commission = RulesEngine.calculate_vig(bet.bet_type, bet.amount, bet.number)
             bet.owner.balance -= commission
-            if self.play_by_play:
+            if narrating(self.play_by_play):
                 self.play_by_play.write(
                     f"  💸 {bet.owner.name} pays ${commission} commission to place the {bet.bet_type}."
                 )
@@ -158,7 +167,7 @@ class Table:
             return False, f"{bet.owner.name}'s {bet.bet_type} bet of ${bet.amount} must be in units of ${unit}."
 
         # Validate sufficient bankroll
-        total_risk = sum(b.amount for b in self.bets if b.owner == bet.owner)
+        total_risk = self.bets.owner_total(bet.owner)
         if bet.amount + total_risk > bet.owner.balance:
             return False, (
                 f"{bet.owner.name} cannot afford ${bet.amount} on {bet.bet_type} — "
@@ -182,35 +191,37 @@ class Table:
         :return: List of bets that were resolved (won/lost)
         """
         resolved_bets: List[Bet] = []
+        narrate = narrating(self.play_by_play)
 
         # 🥇 First pass: resolve non-odds bets
         for bet in self.bets:
             if bet.status == "inactive":
                 continue
-            if bet.bet_type not in ["Pass Line Odds", "Come Odds", "Don't Pass Odds", "Don't Come Odds"]:
+            if bet.bet_type not in _ODDS_BET_TYPES:
                 original_number = bet.number
                 original_status = bet.status
 
-                bet.resolve(self.rules_engine, dice_outcome, game_state, self.house_rules)
+                self.compiled_rules.resolve(bet, dice_outcome, game_state)
 
                 if bet.status != original_status and bet.status in ("won", "lost"):
                     resolved_bets.append(bet)
 
                 if (
-                    bet.bet_type in ["Come", "Don't Come"]
+                    narrate
+                    and bet.bet_type in ["Come", "Don't Come"]
                     and original_number is None
                     and bet.number is not None
                     and bet.status == "active"
                 ):
                     self.play_by_play.write(f"  ⏫ {bet.owner.name}'s {bet.bet_type} bet moves to the {bet.number}.")
-                elif bet.status == "push":
+                elif narrate and bet.status == "push":
                     self.play_by_play.write(f"  ⏸️ {bet.owner.name}'s {bet.bet_type} bet was barred and did not move.")
 
         # 🥈 Second pass: resolve odds bets (parent statuses are now reliable)
         for bet in self.bets:
             if bet.status == "inactive":
                 continue
-            if bet.bet_type in ["Pass Line Odds", "Come Odds", "Don't Pass Odds", "Don't Come Odds"]:
+            if bet.bet_type in _ODDS_BET_TYPES:
                 original_status = bet.status
                 bet.resolve(self.rules_engine, dice_outcome, game_state, self.house_rules)
 
@@ -247,12 +258,11 @@ class Table:
                 resolved_bet_ids.add(id(bet))
 
                 # Also settle attached odds bets
-                for attached in list(self.bets):
-                    if attached.parent_bet == bet:
-                        attached.owner.lose_bet(attached, self.play_by_play)
-                        self.bets.remove(attached)
-                        settled_bets.append(attached)
-                        resolved_bet_ids.add(id(attached))
+                for attached in self.bets.children(bet):
+                    attached.owner.lose_bet(attached, self.play_by_play)
+                    self.bets.remove(attached)
+                    settled_bets.append(attached)
+                    resolved_bet_ids.add(id(attached))
 
             # ✅ Handle Winning Bets
             elif bet.status == "won":
@@ -267,7 +277,7 @@ class Table:
                     )
                     if commission > 0:
                         bet.resolved_payout -= commission
-                        if self.play_by_play:
+                        if narrating(self.play_by_play):
                             self.play_by_play.write(
                                 f"  💸 {bet.owner.name} pays ${commission} commission on the winning {bet.bet_type}."
                             )
@@ -280,15 +290,14 @@ class Table:
 
                 if bet.bet_type in ["All", "Tall", "Small"]:
                     self.bets.remove(bet)
-                    if self.play_by_play:
+                    if narrating(self.play_by_play):
                         self.play_by_play.write(f"  🏆 {bet.owner.name}'s {bet.bet_type} bet returned after win.")
 
-                for attached in list(self.bets):
-                    if attached.parent_bet == bet:
-                        attached.owner.win_bet(attached, self.play_by_play)
-                        self.bets.remove(attached)
-                        settled_bets.append(attached)
-                        resolved_bet_ids.add(id(attached))
+                for attached in self.bets.children(bet):
+                    attached.owner.win_bet(attached, self.play_by_play)
+                    self.bets.remove(attached)
+                    settled_bets.append(attached)
+                    resolved_bet_ids.add(id(attached))
 
             # ✅ Handle Moved Bets
             elif bet.status.startswith("move "):
@@ -335,4 +344,4 @@ class Table:
 
     def total_risk(self) -> int:
         """Calculate total amount risked on the table for the current roll."""
-        return sum(bet.amount for bet in self.bets)
+        return self.bets.total()
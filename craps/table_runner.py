@@ -12,9 +12,13 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 from craps.craps_engine import CrapsEngine, PostRollSummary
+from craps.dice import CLASSIC_RNG
 from craps.player import Player
+from craps.profiler import RollProfiler
+from craps.serialization import EventEncoder
 from craps.session_recorder import SessionRecorder
 from craps.statistics import Statistics
+from craps.strategy_contract import V2StrategyAdapter
 
 #: (player_name, strategy_name) pairs; strategy names are PlayerLineup keys.
 LineupConfig = Sequence[Tuple[str, str]]
@@ -30,9 +34,12 @@ class TableRunner:
         max_shooters: int = 10,
         max_rolls: Optional[int] = None,
         dice_seed: Optional[int] = None,
+        dice_rng_version: int = CLASSIC_RNG,
         record: bool = False,
         sessions_dir: Union[str, Path] = "sessions",
+        compress_recording: bool = False,
         quiet_mode: bool = True,
+        profiler: Optional[RollProfiler] = None,
     ) -> None:
         self.table_id = table_id
         self.players = players  # None → ACTIVE_PLAYERS from config.py
@@ -41,14 +48,29 @@ class TableRunner:
         self.max_shooters = max_shooters
         self.max_rolls = max_rolls
         self.dice_seed = dice_seed
+        self.dice_rng_version = dice_rng_version
         self.engine = CrapsEngine(quiet_mode=quiet_mode)
+        self.profiler = profiler
+        self.engine.profiler = profiler
+        self._encoder: Optional[EventEncoder] = None
         self.recorder: Optional[SessionRecorder] = None
         if record:
             # Before setup_session, so SessionStarted lands in the log.
-            recorder = SessionRecorder(table_id, sessions_dir)
-            recorder.subscribe(self.engine.events)
+            recorder = SessionRecorder(table_id, sessions_dir, compress=compress_recording)
+            recorder.attach(self.encoder)
             self.recorder = recorder
 
+    @property
+    def encoder(self) -> EventEncoder:
+        """The table's wire encoder, shared by every consumer that wants
+        encoded events (recorder, broadcaster). Subscribed on first use,
+        so unobserved runs never encode anything; wire consumers attach
+        before ``start_session`` to see ``SessionStarted``."""
+        if self._encoder is None:
+            self._encoder = EventEncoder(self.table_id)
+            self._encoder.subscribe(self.engine.events)
+        return self._encoder
+
     def start_session(self) -> None:
         """Initialize the engine, seat the lineup, and assign the first shooter."""
         engine = self.engine
@@ -57,6 +79,7 @@ class TableRunner:
             num_shooters=self.max_shooters,
             dice_mode="live",
             dice_seed=self.dice_seed,
+            dice_rng_version=self.dice_rng_version,
         ):
             raise RuntimeError("Failed to initialize session.")
 
@@ -68,12 +91,20 @@ class TableRunner:
         engine.lock_session()
         engine.assign_next_shooter()
 
+        if self.profiler is not None and engine.player_lineup is not None:
+            for player in engine.player_lineup.get_active_players_list():
+                strategy = player.betting_strategy
+                if isinstance(strategy, V2StrategyAdapter):
+                    strategy.profile(self.profiler, player.strategy_name)
+
     def roll_once(self) -> PostRollSummary:
         """One complete roll cycle: accept → roll → resolve → refresh → post-roll.
 
         The single place the per-roll sequence lives; the sync run() loop
         and the async TableSession driver both call it.
         """
+        if self.profiler is not None:
+            return self._profiled_roll_once(self.profiler)
         engine = self.engine
         engine.accept_bets()
         outcome = engine.roll_dice()
@@ -85,6 +116,38 @@ class TableRunner:
         engine.log_player_bets()
         return engine.handle_post_roll(outcome, prev_phase)
 
+    def _profiled_roll_once(self, profiler: RollProfiler) -> PostRollSummary:
+        """roll_once with every stage on the clock."""
+        engine = self.engine
+        clock = time.perf_counter
+        started = clock()
+        engine.accept_bets()
+        now = clock()
+        profiler.add_phase("accept_bets", now - started)
+        started = now
+        outcome = engine.roll_dice()
+        now = clock()
+        profiler.add_phase("roll_dice", now - started)
+        if engine.game_state is None:
+            raise RuntimeError("Game state not initialized")
+        prev_phase = engine.game_state.phase
+        started = clock()
+        engine.resolve_bets(outcome)
+        now = clock()
+        profiler.add_phase("resolve_bets", now - started)
+        started = now
+        engine.refresh_bet_statuses()
+        now = clock()
+        profiler.add_phase("refresh_bet_statuses", now - started)
+        started = now
+        engine.log_player_bets()
+        now = clock()
+        profiler.add_phase("log_player_bets", now - started)
+        started = now
+        summary = engine.handle_post_roll(outcome, prev_phase)
+        profiler.add_phase("handle_post_roll", clock() - started)
+        return summary
+
     def run(self) -> Statistics:
         self.start_session()
 
@@ -1,11 +1,13 @@
 from datetime import datetime
+from typing import Optional
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from craps.statistics import Statistics
-from craps.simulation_runner import simulate_single_session
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from craps.simulation_aggregate import SimulationAggregate
+from craps.dice import CLASSIC_RNG, FAST_RNG
+from craps.simulation_runner import new_master_seed, simulate_session_block
 from simulation_utils import get_dynamic_worker_count
 from craps.simulation_report import simulation_report
-from craps.high_roller import export_high_roller_histories
+from craps.high_roller import export_high_roller_replays
 import pickle
 import os
 import argparse
@@ -15,46 +17,118 @@ def parse_args():
     parser.add_argument("--sessions", type=int, default=100, help="Number of sessions to run (default: 100)")
     parser.add_argument("--mode", choices=["live", "history"], default="live", help="Dice mode")
     parser.add_argument("--quiet", action="store_true", help="Suppress logging output")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Sessions per worker task (default: auto-tuned from measured session time)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Master seed; session N is replayable from (seed, N) (default: fresh entropy, printed)")
+    parser.add_argument("--fast-rng", action="store_true",
+                        help="Roll with the buffered NumPy dice RNG (version 2); seeds are not interchangeable with the default RNG")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each roll_once stage and each strategy's wants(); print the breakdown at the end")
     return parser.parse_args()
 
+class ChunkSizer:
+    """Sizes worker tasks from measured per-session time.
+
+    Starts with small probe blocks, then aims each block at roughly
+    ``target_seconds`` of work — long enough that pickling one aggregate
+    and one future per block is noise, short enough that the tail of the
+    run still spreads across every worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        chunk_size: Optional[int] = None,
+        target_seconds: float = 2.0,
+        initial_size: int = 4,
+    ) -> None:
+        self.max_workers = max_workers
+        self.fixed_size = chunk_size
+        self.target_seconds = target_seconds
+        self.initial_size = initial_size
+        self.sessions_timed = 0
+        self.seconds_timed = 0.0
+
+    def record(self, count: int, elapsed: float) -> None:
+        self.sessions_timed += count
+        self.seconds_timed += elapsed
+
+    def next_size(self, remaining: int) -> int:
+        if self.fixed_size is not None:
+            return max(1, min(self.fixed_size, remaining))
+        if not self.sessions_timed or self.seconds_timed <= 0:
+            return max(1, min(self.initial_size, remaining))
+        per_session = self.seconds_timed / self.sessions_timed
+        size = int(self.target_seconds / per_session)
+        # Leave at least two blocks per worker for the rest of the run.
+        size = min(size, -(-remaining // (self.max_workers * 2)))
+        return max(1, min(size, remaining))
+
 class SimulationManager:
-    def __init__(self, num_sessions: int = 1000, max_workers: int = 4) -> None:
+    def __init__(
+        self,
+        num_sessions: int = 1000,
+        max_workers: int = 4,
+        chunk_size: Optional[int] = None,
+        master_seed: Optional[int] = None,
+        rng_version: int = CLASSIC_RNG,
+        profile: bool = False,
+    ) -> None:
         self.num_sessions = num_sessions
         self.max_workers = max_workers
-        self.stats_results: list[Statistics] = []
+        self.chunk_sizer = ChunkSizer(max_workers, chunk_size)
+        self.master_seed = master_seed if master_seed is not None else new_master_seed()
+        self.rng_version = rng_version
+        self.profile = profile
+        self.aggregate = SimulationAggregate(master_seed=self.master_seed, rng_version=rng_version)
 
-    def submit_simulations(self, executor: ProcessPoolExecutor):
-        return [executor.submit(simulate_single_session) for _ in range(self.num_sessions)]
+    def submit_block(self, executor: ProcessPoolExecutor, first_session: int) -> tuple[Future, int]:
+        count = self.chunk_sizer.next_size(self.num_sessions - first_session)
+        return executor.submit(simulate_session_block, first_session, count, self.master_seed, self.rng_version, self.profile), count
 
     def run_simulations(self) -> None:
         start_time = datetime.now()
         print(f"⏰ Starting {self.num_sessions:,} simulations with {self.max_workers} workers at {start_time.strftime('%H:%M:%S')}")
+        print(f"🌱 Master seed: {self.master_seed} (dice RNG v{self.rng_version})")
+
+        block_sizes: dict[Future, int] = {}
+        next_session = 0
+        in_flight: set[Future] = set()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor, tqdm(
+            total=self.num_sessions,
+            desc="Running Simulations",
+            unit="session",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed} • {rate_fmt}]",
+        ) as progress:
+            while next_session < self.num_sessions or in_flight:
+                # Keep two blocks queued per worker so none sits idle.
+                while next_session < self.num_sessions and len(in_flight) < self.max_workers * 2:
+                    future, count = self.submit_block(executor, next_session)
+                    block_sizes[future] = count
+                    next_session += count
+                    in_flight.add(future)
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = self.submit_simulations(executor)
-            session_counter = 0
-            for future in tqdm(
-                as_completed(futures),
-                total=self.num_sessions,
-                desc="Running Simulations",
-                unit="session",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed} • {rate_fmt}]",
-            ):
-                result = future.result()
-                result.session_number = session_counter
-                self.stats_results.append(result)
-                session_counter += 1
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    partial, elapsed = future.result()
+                    count = block_sizes.pop(future)
+                    self.chunk_sizer.record(count, elapsed)
+                    self.aggregate.merge(partial)
+                    progress.update(count)
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         minutes, seconds = divmod(int(duration), 60)
         print(f"🏁 Finished at {end_time.strftime('%H:%M:%S')} (⌛ Duration: {minutes:02d}:{seconds:02d})")
+        if self.aggregate.profile is not None:
+            print(f"⏱️ Roll-loop profile (summed across workers):\n{self.aggregate.profile.report()}")
 
     def save_results(self, path="output/aggregated_stats.pkl") -> None:
         with open(path, "wb") as f:
-            pickle.dump(self.stats_results, f)
+            pickle.dump(self.aggregate, f)
         file_size_mb = os.path.getsize(path) / (1024 * 1024)
-        print(f"💾 Saved {len(self.stats_results):,} sessions to {path} ({file_size_mb:.2f} MB)")
+        print(f"💾 Saved {self.aggregate.sessions:,} sessions to {path} ({file_size_mb:.2f} MB)")
 
 if __name__ == "__main__":
     args = parse_args()
@@ -68,8 +142,15 @@ if __name__ == "__main__":
         exit(0)
 
     worker_count = get_dynamic_worker_count(target_utilization=0.80)
-    sim = SimulationManager(num_sessions=session_count, max_workers=worker_count)
+    sim = SimulationManager(
+        num_sessions=session_count,
+        max_workers=worker_count,
+        chunk_size=args.chunk_size,
+        master_seed=args.seed,
+        rng_version=FAST_RNG if args.fast_rng else CLASSIC_RNG,
+        profile=args.profile,
+    )
     sim.run_simulations()
     sim.save_results()
     simulation_report("output/aggregated_stats.pkl")
-    export_high_roller_histories(simulation_data={"sessions": sim.stats_results})
+    export_high_roller_replays(sim.aggregate)
@@ -0,0 +1,41 @@
+"""Convert CSV/JSON roll histories to the binary ``.rolls`` format.
+
+With no arguments, converts every ``.csv`` and ``.json`` file in
+``saves/``; each ``.rolls`` file is written next to its source.
+
+Usage: python scripts/convert_roll_history.py [FILE ...]
+"""
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from craps.roll_store import RollStore, convert_roll_history
+
+SAVES_DIR = Path(__file__).resolve().parents[1] / "saves"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert CSV/JSON roll histories to the binary .rolls format."
+    )
+    parser.add_argument("files", nargs="*", type=Path)
+    args = parser.parse_args()
+
+    sources = args.files or sorted(
+        path for pattern in ("*.csv", "*.json") for path in SAVES_DIR.glob(pattern)
+    )
+    if not sources:
+        print("Nothing to convert.")
+        return 0
+    for source in sources:
+        target = convert_roll_history(source)
+        # ASCII only: Windows consoles default to cp1252.
+        print(f"{source} -> {target} ({len(RollStore(target))} rolls)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -94,8 +94,10 @@ def verify(
     num_shooters: int = 10,
     lineup: Optional[LineupConfig] = None,
     sessions_dir: str = "sessions",
+    compress: bool = False,
 ) -> Tuple[Statistics, Statistics]:
-    """Run live, replay from JSONL, assert parity. Returns both stats."""
+    """Run live, replay from the recording (JSONL, or block-compressed
+    with ``compress``), assert parity. Returns both stats."""
     if lineup is None:
         lineup = DEFAULT_LINEUP
 
@@ -106,6 +108,7 @@ def verify(
         dice_seed=seed,
         record=True,
         sessions_dir=sessions_dir,
+        compress_recording=compress,
     )
     captured: List[Event] = []
     runner.engine.events.subscribe(Event, captured.append)
@@ -158,10 +161,16 @@ def main() -> int:
     parser.add_argument("--seed", type=int, default=4242)
     parser.add_argument("--shooters", type=int, default=10)
     parser.add_argument("--sessions-dir", default="sessions")
+    parser.add_argument(
+        "--compress", action="store_true", help="record block-compressed JSONL (.jsonl.gz)"
+    )
     args = parser.parse_args()
 
     live, replayed = verify(
-        seed=args.seed, num_shooters=args.shooters, sessions_dir=args.sessions_dir
+        seed=args.seed,
+        num_shooters=args.shooters,
+        sessions_dir=args.sessions_dir,
+        compress=args.compress,
     )
     finals: Dict[str, int] = {
         name: history[-1] for name, history in replayed.bankroll_history.items()
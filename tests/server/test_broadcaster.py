@@ -0,0 +1,184 @@
+"""Broadcaster history: a bounded ring in memory, older events read
+back from the archive recording through its offset index."""
+import asyncio
+import json
+
+import pytest
+
+from craps.events import (
+    BankrollsUpdated,
+    BetsRequested,
+    EventBus,
+    RiskUpdated,
+    SessionFinalized,
+    ShooterAssigned,
+)
+from craps.serialization import EventEncoder
+from craps.server.broadcaster import COALESCE, DISCONNECT, RESYNC, Broadcaster
+from craps.session_recorder import SessionRecorder
+
+
+def parse_frame(frame):
+    """(id, event, data) of one SSE frame."""
+    fields = dict(line.split(": ", 1) for line in frame.decode("utf-8").splitlines() if line)
+    return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+
+def publish_session(tmp_path, num_events, capacity, index_stride=4):
+    bus = EventBus()
+    encoder = EventEncoder("t")
+    encoder.subscribe(bus)
+    recorder = SessionRecorder("t", tmp_path, index_stride=index_stride)
+    recorder.attach(encoder)
+    broadcaster = Broadcaster("t", archive=recorder, capacity=capacity)
+    broadcaster.attach(encoder)
+    for i in range(num_events - 1):
+        bus.publish(ShooterAssigned(shooter_index=i, shooter_name=f"S{i}"))
+    bus.publish(SessionFinalized(session_rolls=0))
+    return broadcaster, recorder
+
+
+def test_ring_is_bounded_and_history_is_whole(tmp_path):
+    broadcaster, _ = publish_session(tmp_path, num_events=50, capacity=8)
+    assert len(broadcaster.ring) == 8
+    assert broadcaster.next_seq == 50
+
+    history = list(broadcaster.history())
+    assert [e.seq for e in history] == list(range(50))
+    assert json.loads(history[3].line)["shooter_name"] == "S3"
+    assert history[3].sse.startswith(b"id: 3\nevent: ShooterAssigned\n")
+
+
+def test_history_pages_across_the_archive_and_ring(tmp_path):
+    broadcaster, _ = publish_session(tmp_path, num_events=50, capacity=8)
+    for after_seq in (-1, 0, 5, 38, 41, 42, 48, 49):
+        for limit in (0, 1, 3, 7, 100):
+            page = [e.seq for e in broadcaster.history(after_seq, limit=limit)]
+            assert page == list(range(after_seq + 1, min(after_seq + 1 + limit, 50)))
+
+
+def test_recorder_reads_any_range_from_its_index(tmp_path):
+    _, recorder = publish_session(tmp_path, num_events=30, capacity=8, index_stride=7)
+    lines = recorder.path.read_text(encoding="utf-8").splitlines()
+    assert len(recorder.index.offsets) == 5  # seqs 0, 7, 14, 21, 28
+    for after_seq in range(-1, 30):
+        for stop_seq in (after_seq + 1, after_seq + 3, 30, 99):
+            assert list(recorder.read_lines(after_seq, stop_seq)) == lines[after_seq + 1:stop_seq]
+
+
+def test_listen_replays_evicted_history(tmp_path):
+    broadcaster, _ = publish_session(tmp_path, num_events=40, capacity=5)
+
+    async def collect(after_seq):
+        return [parse_frame(frame)[0] async for frame in broadcaster.listen(after_seq)]
+
+    assert asyncio.run(collect(-1)) == list(range(40))
+    assert asyncio.run(collect(17)) == list(range(18, 40))
+
+
+def test_without_an_archive_everything_stays_in_memory():
+    bus = EventBus()
+    broadcaster = Broadcaster("t", capacity=4)
+    broadcaster.subscribe(bus)
+    for i in range(10):
+        bus.publish(ShooterAssigned(shooter_index=i, shooter_name="S"))
+    assert len(broadcaster.ring) == 10
+    assert [e.seq for e in broadcaster.history(6)] == [7, 8, 9]
+
+
+def stalled_listener(broadcaster, bus, events):
+    """Open a listen, take its first frame, publish ``events`` without
+    reading, then drain it; returns the frames read after the first."""
+    async def run():
+        stream = broadcaster.listen()
+        await stream.__anext__()
+        for event in events:
+            bus.publish(event)
+        bus.publish(SessionFinalized(session_rolls=0))
+        return [parse_frame(frame) async for frame in stream]
+    return asyncio.run(run())
+
+
+def live_broadcaster(queue_size, policy):
+    bus = EventBus()
+    broadcaster = Broadcaster("t", queue_size=queue_size, policy=policy)
+    broadcaster.subscribe(bus)
+    bus.publish(BetsRequested())  # seq 0, replayed as history
+    return broadcaster, bus
+
+
+def bankrolls(n):
+    return BankrollsUpdated(bankrolls=(("A", n),))
+
+
+def test_listener_within_its_queue_gets_everything():
+    broadcaster, bus = live_broadcaster(queue_size=10, policy=RESYNC)
+    frames = stalled_listener(broadcaster, bus, [BetsRequested()] * 9)
+    assert [seq for seq, _, _ in frames] == list(range(1, 11))
+    assert broadcaster.metrics()["dropped_events"] == 0
+
+
+def test_resync_drops_the_queue_and_names_the_seq_to_resume_after():
+    broadcaster, bus = live_broadcaster(queue_size=5, policy=RESYNC)
+    frames = stalled_listener(broadcaster, bus, [BetsRequested()] * 20)
+    assert frames == [(0, "resync", {"after_seq": 0})]
+    metrics = broadcaster.metrics()
+    assert metrics["resyncs"] == 1
+    assert metrics["dropped_events"] == 6  # five queued plus the one that overflowed
+    assert metrics["listeners"] == 0
+
+
+def test_disconnect_just_ends_the_stream():
+    broadcaster, bus = live_broadcaster(queue_size=5, policy=DISCONNECT)
+    assert stalled_listener(broadcaster, bus, [BetsRequested()] * 20) == []
+    assert broadcaster.metrics()["disconnects"] == 1
+
+
+def test_coalesce_keeps_the_latest_snapshots():
+    broadcaster, bus = live_broadcaster(queue_size=6, policy=COALESCE)
+    events = []
+    for n in range(10):
+        events += [bankrolls(n), RiskUpdated(at_risk=(("A", n),))]
+    events.append(BetsRequested())
+    frames = stalled_listener(broadcaster, bus, events)
+
+    # Every event still reaches the client in order; superseded snapshots are gone.
+    assert [seq for seq, _, _ in frames] == sorted(seq for seq, _, _ in frames)
+    assert frames[-1][1] == "SessionFinalized"
+    assert frames[-2][1] == "BetsRequested"
+    assert ("BankrollsUpdated", [["A", 9]]) in [(kind, data.get("bankrolls")) for _, kind, data in frames]
+    assert ("RiskUpdated", [["A", 9]]) in [(kind, data.get("at_risk")) for _, kind, data in frames]
+    metrics = broadcaster.metrics()
+    assert metrics["coalesced_events"] == len(events) + 1 - len(frames)
+    assert metrics["resyncs"] == 0
+
+
+def test_coalesce_falls_back_to_resync_when_nothing_is_superseded():
+    broadcaster, bus = live_broadcaster(queue_size=5, policy=COALESCE)
+    frames = stalled_listener(broadcaster, bus, [BetsRequested()] * 20)
+    assert frames == [(0, "resync", {"after_seq": 0})]
+    assert broadcaster.metrics()["resyncs"] == 1
+
+
+def test_metrics_report_live_queue_depths():
+    broadcaster, bus = live_broadcaster(queue_size=50, policy=RESYNC)
+
+    async def run():
+        stream = broadcaster.listen()
+        await stream.__anext__()
+        for _ in range(7):
+            bus.publish(BetsRequested())
+        metrics = broadcaster.metrics()
+        await stream.aclose()
+        return metrics
+
+    metrics = asyncio.run(run())
+    assert metrics["listeners"] == 1
+    assert metrics["queue_depths"] == [7]
+    assert metrics["max_queue_depth"] == 7
+    assert broadcaster.metrics()["listeners"] == 0
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="policy"):
+        Broadcaster("t", policy="buffer-forever")
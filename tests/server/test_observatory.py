@@ -6,6 +6,7 @@ task makes progress while the test thread polls or sleeps.
 """
 import json
 import time
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -25,6 +26,14 @@ def client(tmp_path):
         yield test_client
 
 
+@pytest.fixture
+def small_history_client(tmp_path):
+    """Tables that keep only 16 events in memory, so sessions spill."""
+    app = create_app(sessions_dir=tmp_path / "sessions", history_capacity=16)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 def create_table(client, **overrides):
     body = {
         "table_id": "t1",
@@ -100,6 +109,19 @@ def test_create_start_finish_and_stats(client):
     assert recordings[0]["name"].startswith("t1_")
 
 
+def test_profiled_table_reports_stage_timings(client):
+    create_table(client, profile=True)
+    client.post("/tables/t1/start")
+    snap = wait_for_state(client, "t1", "finished")
+
+    profile = client.get("/tables/t1/profile").json()
+    assert profile["phases"]["roll_dice"]["calls"] == snap["session_rolls"]
+    assert set(profile["strategies"]) == {"Pass-Line", "Field"}
+
+    create_table(client, table_id="t2")
+    assert client.get("/tables/t2/profile").status_code == 404
+
+
 def test_strategy_list_matches_lineup_vocabulary(client):
     strategies = client.get("/tables/strategies").json()
     assert "Pass-Line" in strategies
@@ -322,6 +344,125 @@ def test_recording_events_page_matches_live_buffer(client):
     assert client.get("/recordings/notthere.jsonl/events").status_code == 404
 
 
+@pytest.mark.parametrize("record", [True, False], ids=["recorded", "unrecorded"])
+def test_spilled_history_serves_pages_and_streams(small_history_client, record):
+    client = small_history_client
+    create_table(client, record=record)
+    client.post("/tables/t1/start")
+    wait_for_state(client, "t1", "finished")
+
+    events = client.get("/tables/t1/events?limit=100000").json()
+    assert events["total"] > 16
+    assert [e["seq"] for e in events["events"]] == list(range(events["total"]))
+    page = client.get("/tables/t1/events?after_seq=4&limit=5").json()
+    assert page["events"] == events["events"][5:10]
+    assert page["next_after_seq"] == 9
+
+    with client.stream("GET", "/tables/t1/stream", headers={"Last-Event-ID": "2"}) as resp:
+        frames = list(iter_frames(resp))
+    assert [f["data"] for f in frames] == events["events"][3:]
+    assert len(client.get("/recordings").json()) == (1 if record else 0)
+
+
+def test_deleting_a_table_removes_its_spilled_history(small_history_client):
+    client = small_history_client
+    create_table(client, record=False)
+    client.post("/tables/t1/start")
+    wait_for_state(client, "t1", "finished")
+    session = client.app.state.director.get("t1")
+    spill_dir = Path(session._spill_dir.name)
+    assert any(spill_dir.iterdir())
+
+    assert client.delete("/tables/t1").status_code == 204
+    assert not spill_dir.exists()
+    assert client.get("/tables/t1").status_code == 404
+    assert client.delete("/tables/t1").status_code == 404
+
+
+def test_shutdown_removes_spilled_history(tmp_path):
+    app = create_app(sessions_dir=tmp_path / "sessions")
+    with TestClient(app) as client:
+        create_table(client, record=False)
+        spill_dir = Path(client.app.state.director.get("t1")._spill_dir.name)
+        assert spill_dir.is_dir()
+    assert not spill_dir.exists()
+
+
+def test_listener_metrics(client):
+    create_table(client)
+    metrics = client.get("/tables/t1/listeners").json()
+    assert metrics["table_id"] == "t1"
+    assert metrics["policy"] == "coalesce"
+    assert metrics["listeners"] == 0
+    assert metrics["dropped_events"] == 0
+    assert client.get("/tables/nope/listeners").status_code == 404
+
+
+def test_reconnect_is_gapless_across_spilled_history(small_history_client):
+    client = small_history_client
+    create_table(client, roll_delay_ms=2, num_shooters=3)
+    client.post("/tables/t1/start")
+
+    head = []
+    with client.stream("GET", "/tables/t1/stream") as resp:
+        for frame in iter_frames(resp):
+            head.append(frame)
+            if len(head) == 10:
+                break
+    wait_for_state(client, "t1", "finished")  # the ring has long moved on
+
+    with client.stream(
+        "GET", "/tables/t1/stream",
+        headers={"Last-Event-ID": str(head[-1]["id"])},
+    ) as resp:
+        tail = list(iter_frames(resp))
+
+    ids = [f["id"] for f in head + tail]
+    assert ids == list(range(len(ids)))
+    assert (head + tail)[-1]["event"] == "SessionFinalized"
+
+
+def test_recording_pages_seek_through_the_index(client, tmp_path):
+    create_table(client)
+    client.post("/tables/t1/start")
+    wait_for_state(client, "t1", "finished")
+    name = client.get("/recordings").json()[0]["name"]
+    recording = tmp_path / "sessions" / name
+    assert (tmp_path / "sessions" / (name + ".idx")).is_file()
+    assert [r["name"] for r in client.get("/recordings").json()] == [name]
+
+    live = client.get("/tables/t1/events?limit=100000").json()["events"]
+    for after_seq in (-1, 0, 255, 256, len(live) - 5):
+        page = client.get(f"/recordings/{name}/events?after_seq={after_seq}&limit=9").json()
+        assert page["events"] == live[after_seq + 1:after_seq + 10]
+        assert page["total"] == len(live)
+
+    # A recording without an index (older, or interrupted) still pages.
+    (tmp_path / "sessions" / (name + ".idx")).unlink()
+    legacy = recording.with_name("legacy.jsonl")
+    recording.rename(legacy)
+    page = client.get("/recordings/legacy.jsonl/events?after_seq=10&limit=3").json()
+    assert page["events"] == live[11:14]
+    assert page["next_after_seq"] == 13
+
+
+def test_compressed_recordings_page_and_spill(tmp_path):
+    app = create_app(sessions_dir=tmp_path / "sessions", history_capacity=16, compress_recordings=True)
+    with TestClient(app) as client:
+        create_table(client)
+        client.post("/tables/t1/start")
+        wait_for_state(client, "t1", "finished")
+
+        live = client.get("/tables/t1/events?limit=100000").json()["events"]
+        assert [e["seq"] for e in live] == list(range(len(live)))
+        name = client.get("/recordings").json()[0]["name"]
+        assert name.endswith(".jsonl.gz")
+        for after_seq in (-1, 255, len(live) - 5):
+            page = client.get(f"/recordings/{name}/events?after_seq={after_seq}&limit=9").json()
+            assert page["events"] == live[after_seq + 1:after_seq + 10]
+            assert page["total"] == len(live)
+
+
 # ----------------------------------------------------------------------- D6
 
 def test_bare_bones_table_refuses_ats_over_http(client):
@@ -0,0 +1,133 @@
+"""BatchEngine must be money-identical to CrapsEngine on the same dice.
+
+Each batch session is replayed through the object engine with its dice
+row forced, one player per strategy; final bankrolls, amount bet per
+player and rolls played must match exactly.
+"""
+import numpy as np
+import pytest
+
+from config import HOUSE_RULES
+from craps.batch_engine import BatchEngine
+from craps.craps_engine import CrapsEngine
+from craps.events import BetResolved
+from craps.player import Player
+from craps.strategies.field_v2 import FieldV2
+from craps.strategies.lay_v2 import LayV2
+from craps.strategies.pass_line_odds_v2 import PassLineOddsV2
+from craps.strategies.pass_line_v2 import PassLineV2
+from craps.strategies.place_v2 import PlaceV2
+from craps.strategy_contract import V2StrategyAdapter
+
+MIN_BET = HOUSE_RULES["table_minimum"]
+NUM_SHOOTERS = 8
+ROLLS_PER_SESSION = 1500
+
+
+def lineup():
+    return [
+        PassLineV2(MIN_BET),
+        PassLineOddsV2("3x-4x-5x"),
+        PassLineOddsV2(2),
+        FieldV2(MIN_BET),
+        PlaceV2("inside"),
+        PlaceV2("across"),
+        PlaceV2([6, 8]),
+    ]
+
+
+def run_reference(strategies, dice_row, house_rules, num_shooters, bankroll):
+    """Play one session through the object engine; return per-player
+    (balance, amount bet) and the number of rolls."""
+    engine = CrapsEngine(quiet_mode=True)
+    assert engine.setup_session(
+        house_rules_dict=house_rules,
+        num_shooters=num_shooters,
+        dice_mode="live",
+        dice_seed=0,
+    )
+    players = []
+    for i, contract in enumerate(strategies):
+        player = Player(name=f"P{i}", initial_balance=bankroll, strategy_name=f"P{i}")
+        player.betting_strategy = V2StrategyAdapter(contract)
+        engine.player_lineup.add_player(player)
+        players.append(player)
+    engine.stats.initialize_player_stats(players)
+    engine.stats.num_players = len(players)
+    engine.lock_session()
+    engine.assign_next_shooter()
+
+    wagered = {p.name: 0 for p in players}
+
+    def on_resolved(e):
+        if e.status in ("won", "lost"):
+            wagered[e.player_name] += e.amount
+
+    engine.events.subscribe(BetResolved, on_resolved)
+    engine.dice.forced_rolls.extend(tuple(int(d) for d in pair) for pair in dice_row)
+
+    rolls = 0
+    shooters = 0
+    while shooters < num_shooters and engine.dice.forced_rolls:
+        engine.accept_bets()
+        outcome = engine.roll_dice()
+        prev_phase = engine.game_state.phase
+        engine.resolve_bets(outcome)
+        engine.refresh_bet_statuses()
+        summary = engine.handle_post_roll(outcome, prev_phase)
+        rolls += 1
+        if summary.new_shooter_assigned:
+            shooters += 1
+    return [(p.balance, wagered[p.name]) for p in players], rolls
+
+
+@pytest.mark.parametrize("house_rules,bankroll", [
+    (HOUSE_RULES, 500),
+    ({**HOUSE_RULES, "field_bet_payout_12": 2, "leave_winning_bets_up": False}, 300),
+    ({**HOUSE_RULES, "table_minimum": 25}, 150),
+], ids=["default", "no-press", "near-ruin"])
+def test_batch_matches_object_engine(house_rules, bankroll):
+    rng = np.random.default_rng(2024)
+    dice = rng.integers(1, 7, size=(6, ROLLS_PER_SESSION, 2))
+    strategies = lineup()
+
+    batch = BatchEngine(strategies, house_rules, num_shooters=NUM_SHOOTERS, initial_bankroll=bankroll)
+    result = batch.run(dice)
+
+    for s in range(dice.shape[0]):
+        expected, rolls = run_reference(strategies, dice[s], house_rules, NUM_SHOOTERS, bankroll)
+        assert int(result.rolls[s]) == rolls, s
+        assert bool(result.finished[s])
+        actual = [(int(b), int(w)) for b, w in zip(result.bankrolls[s], result.wagered[s])]
+        assert actual == expected, s
+
+
+def test_run_random_finishes_every_session():
+    result = BatchEngine([PassLineV2(MIN_BET)], num_shooters=3).run_random(200, seed=7, block_rolls=16)
+    assert result.finished.all()
+    assert (result.shooters == 3).all()
+    assert result.bankrolls.shape == (200, 1)
+    assert result.total_rolls == int(result.rolls.sum())
+
+
+def test_run_random_is_seeded():
+    engine = BatchEngine([FieldV2(MIN_BET)], num_shooters=2)
+    first = engine.run_random(50, seed=3)
+    second = engine.run_random(50, seed=3)
+    assert np.array_equal(first.bankrolls, second.bankrolls)
+
+
+def test_max_rolls_caps_sessions():
+    result = BatchEngine([PassLineV2(MIN_BET)], num_shooters=1000, max_rolls=40).run_random(20, seed=1)
+    assert (result.rolls == 40).all()
+    assert not result.finished.any()
+
+
+def test_unsupported_strategy_is_rejected():
+    with pytest.raises(ValueError, match="LayV2"):
+        BatchEngine([LayV2("inside")])
+
+
+def test_dice_shape_is_checked():
+    with pytest.raises(ValueError, match="shape"):
+        BatchEngine([PassLineV2(MIN_BET)]).run(np.ones((3, 4)))
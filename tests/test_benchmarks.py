@@ -0,0 +1,48 @@
+"""Smoke test for the benchmark runner: every workload runs and reports.
+
+Timings are not asserted — only that the suite covers what it claims and
+that its JSON round-trips through the baseline comparison.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+import run_benchmarks  # type: ignore[import-not-found]  # noqa: E402  # pyright: ignore[reportMissingImports] — benchmarks/ path added above
+
+
+def test_suite_covers_every_strategy_and_hot_path():
+    report = run_benchmarks.run_suite(rolls=40, repeat=1, seed=7)
+    results = report["results"]
+    for name in run_benchmarks.strategy_names():
+        assert f"roll_once/{name}" in results
+    for name in (
+        "roll_once/full-table",
+        "rules_engine.resolve_bet",
+        "table.settle_resolved_bets",
+        "serialize_event",
+        "session_recorder.write",
+    ):
+        assert results[name]["ops"] > 0
+    assert len(run_benchmarks.full_table()) == 15
+
+
+def test_report_compares_against_a_saved_baseline(tmp_path):
+    report = run_benchmarks.run_suite(rolls=40, repeat=1, only="full-table")
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(report))
+    baseline = json.loads(baseline_path.read_text())
+    baseline["results"]["roll_once/full-table"]["ops_per_sec"] /= 2
+    changes = run_benchmarks.compare(report, baseline)
+    assert list(changes) == ["roll_once/full-table"]
+    assert changes["roll_once/full-table"] > 99.0
+
+
+def test_only_builds_the_selected_workloads(monkeypatch):
+    def unexpected(*args):
+        raise AssertionError("setup of an unselected workload ran")
+    monkeypatch.setattr(run_benchmarks, "recorded_events", unexpected)
+    monkeypatch.setattr(run_benchmarks, "roll_once_workload", unexpected)
+    report = run_benchmarks.run_suite(rolls=40, repeat=1, only="resolve_bet")
+    assert list(report["results"]) == ["rules_engine.resolve_bet"]
@@ -0,0 +1,129 @@
+"""BetStore keeps list behavior while indexing by owner, type and parent."""
+import pytest
+
+from craps.bet import Bet
+from craps.bet_store import BetStore
+from craps.player import Player
+
+
+@pytest.fixture
+def players():
+    return Player("Alice"), Player("Bob")
+
+
+def bet(bet_type, owner, number=None, amount=10, parent=None):
+    return Bet(bet_type, amount, owner, (1, 1), number=number, parent_bet=parent)
+
+
+def test_iteration_keeps_placement_order_across_removals(players):
+    alice, bob = players
+    bets = [bet("Pass Line", alice), bet("Field", bob), bet("Place", alice, 6), bet("Place", bob, 8)]
+    store = BetStore(bets)
+    store.remove(bets[1])
+    store.append(bets[1])
+    assert list(store) == [bets[0], bets[2], bets[3], bets[1]]
+    assert store[0] is bets[0] and store[-1] is bets[1]
+    assert len(store) == 4 and bets[2] in store
+
+
+def test_removing_while_iterating_is_safe(players):
+    alice, _ = players
+    store = BetStore(bet("Place", alice, n) for n in (4, 5, 6))
+    for b in store:
+        store.remove(b)
+    assert not store and list(store) == []
+
+
+def test_owner_and_type_lookups(players):
+    alice, bob = players
+    place_6 = bet("Place", alice, 6, amount=12)
+    place_8 = bet("Place", alice, 8, amount=12)
+    field = bet("Field", alice, amount=5)
+    store = BetStore([place_6, bet("Place", bob, 6), place_8, field])
+
+    assert store.for_owner(alice) == [place_6, place_8, field]
+    assert store.of_type(alice, "Place") == [place_6, place_8]
+    assert store.find(alice, "Place", 8) is place_8
+    assert store.find(alice, "Place", 5) is None
+    assert store.find(alice, "Place", any_number=True) is place_6
+    assert store.owner_total(alice) == 29
+    field.status = "inactive"
+    assert store.owner_total(alice, active_only=True) == 24
+
+
+def test_find_sees_numbers_that_changed_on_the_table(players):
+    alice, _ = players
+    come = bet("Come", alice)
+    store = BetStore([come])
+    come.number = 9  # travelled
+    assert store.find(alice, "Come", 9) is come
+    assert store.find(alice, "Come", None) is None
+
+
+def test_children_index_follows_parent_bet(players):
+    alice, bob = players
+    line = bet("Pass Line", alice)
+    odds = bet("Pass Line Odds", alice, parent=line)
+    other = bet("Pass Line", bob)
+    store = BetStore([line, other, odds])
+    assert store.children(line) == [odds]
+    assert store.children(other) == []
+    store.remove(odds)
+    assert store.children(line) == []
+
+
+def test_double_add_and_missing_remove_raise(players):
+    alice, _ = players
+    b = bet("Field", alice)
+    store = BetStore([b])
+    with pytest.raises(ValueError):
+        store.append(b)
+    store.clear()
+    with pytest.raises(ValueError):
+        store.remove(b)
+    assert store.for_owner(alice) == []
+
+
+def test_risk_totals_follow_placement_presses_and_status(players):
+    alice, bob = players
+    place_6 = bet("Place", alice, 6, amount=12)
+    field = bet("Field", bob, amount=5)
+    store = BetStore([place_6, field])
+    assert store.total() == 17
+    assert store.owner_total(alice) == store.owner_total(alice, active_only=True) == 12
+
+    place_6.amount += 6  # press
+    place_6.status = "inactive"
+    assert store.total() == 23
+    assert store.owner_total(alice) == 18 and store.owner_total(alice, active_only=True) == 0
+
+    place_6.status = "active"
+    assert store.owner_total(alice, active_only=True) == 18
+    store.remove(place_6)
+    place_6.amount = 100  # off the table: no longer counted
+    assert store.total() == 5 and store.owner_total(alice) == 0
+    store.clear()
+    assert store.total() == 0 and store.owner_total(bob, active_only=True) == 0
+
+
+def test_risk_totals_match_a_rescan_through_a_session():
+    from craps.table_runner import TableRunner
+
+    runner = TableRunner(
+        players=[("Crosstopher", "Iron Cross"), ("Molly", "3-Point Molly"), ("Linus", "Pass-Line w/ Odds")],
+        max_shooters=5,
+        dice_seed=13,
+    )
+    runner.start_session()
+    engine = runner.engine
+    players = engine.player_lineup.get_active_players_list()
+    for _ in range(200):
+        runner.roll_once()
+        bets = list(engine.table.bets)
+        assert engine.table.total_risk() == sum(b.amount for b in bets)
+        for player in players:
+            mine = [b for b in bets if b.owner is player]
+            assert engine.table.bets.owner_total(player) == sum(b.amount for b in mine)
+            assert engine.table.bets.owner_total(player, active_only=True) == sum(
+                b.amount for b in mine if b.status == "active"
+            )
@@ -0,0 +1,79 @@
+"""Compiled resolution tables must agree with RulesEngine.resolve_bet.
+
+The tables are derived from the reference resolver, so these tests pin
+the contract rather than the math: every compiled entry reproduces the
+resolver's status and payout on real bets, and everything outside the
+table still reaches the resolver.
+"""
+import pytest
+
+from craps.compiled_rules import COMPILED_BET_TYPES, compile_rules
+from craps.game_state import GameState
+from craps.house_rules import HouseRules
+from craps.player import Player
+from craps.rules_engine import RulesEngine
+from craps.bet import Bet
+
+
+def make_bet(bet_type, amount, number):
+    player = Player("Prober", initial_balance=10_000)
+    return Bet(bet_type, amount, player, (1, 1), number=number)
+
+
+@pytest.mark.parametrize("config", [{}, {"field_bet_payout_2": 3, "field_bet_payout_12": 2}], ids=["default", "triple-2"])
+def test_every_compiled_entry_matches_the_resolver(config):
+    house_rules = HouseRules(config)
+    compiled = compile_rules(house_rules)
+    game_state = GameState(stats=None)
+
+    for (bet_type, number, point, die_1, die_2) in compiled.table:
+        for amount in (5, 12, 25):
+            game_state.point = point
+            reference = make_bet(bet_type, amount, number)
+            expected = RulesEngine.resolve_bet(reference, (die_1, die_2), game_state, house_rules)
+
+            bet = make_bet(bet_type, amount, number)
+            compiled.resolve(bet, (die_1, die_2), game_state)
+
+            key = (bet_type, number, point, die_1, die_2, amount)
+            assert bet.status == reference.status, key
+            assert bet.number == reference.number, key
+            assert bet.resolved_payout == expected, key
+
+
+def test_all_compiled_types_have_entries():
+    compiled = compile_rules(HouseRules({}))
+    assert {key[0] for key in compiled.table} == set(COMPILED_BET_TYPES)
+
+
+def test_inactive_bets_are_untouched():
+    compiled = compile_rules(HouseRules({}))
+    bet = make_bet("Place", 12, 6)
+    bet.status = "inactive"
+    bet.resolved_payout = 99
+    game_state = GameState(stats=None)
+    game_state.point = 4
+    compiled.resolve(bet, (3, 3), game_state)
+    assert bet.status == "inactive"
+    assert bet.resolved_payout == 0
+
+
+def test_odds_bets_fall_back_to_the_resolver():
+    compiled = compile_rules(HouseRules({}))
+    game_state = GameState(stats=None)
+    game_state.point = 6
+    parent = make_bet("Pass Line", 10, None)
+    parent.status = "won"
+    odds = make_bet("Pass Line Odds", 10, None)
+    odds.parent_bet = parent
+
+    assert compiled.lookup(odds, (3, 3), game_state) is None
+    compiled.resolve(odds, (3, 3), game_state)
+    assert odds.status == "won"
+    assert odds.number == 6
+    assert odds.resolved_payout == 12  # 6:5 true odds
+
+
+def test_tables_are_shared_per_field_configuration():
+    assert compile_rules(HouseRules({})) is compile_rules(HouseRules({"table_minimum": 25}))
+    assert compile_rules(HouseRules({})) is not compile_rules(HouseRules({"field_bet_payout_12": 2}))
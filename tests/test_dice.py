@@ -1,7 +1,9 @@
+import random
 import sys
 import os
 import unittest
-from craps.dice import Dice
+from collections import Counter
+from craps.dice import CLASSIC_RNG, FAST_RNG, Dice
 
 class TestDice(unittest.TestCase):
     def test_roll(self):
@@ -98,5 +100,39 @@ class TestDice(unittest.TestCase):
                 msg=f"Total outcome {total} probability is not within tolerance."
             )
 
+    def test_classic_rng_keeps_the_seeded_stream(self):
+        # Goldens and recordings depend on this exact sequence.
+        reference = random.Random(42)
+        dice = Dice(seed=42, rng_version=CLASSIC_RNG)
+        for _ in range(1000):
+            self.assertEqual(dice.roll(), (reference.randint(1, 6), reference.randint(1, 6)))
+
+    def test_fast_rng_is_seeded_and_block_size_independent(self):
+        small = Dice(seed=7, rng_version=FAST_RNG, buffer_size=3)
+        large = Dice(seed=7, rng_version=FAST_RNG)
+        rolls = [small.roll() for _ in range(50)]
+        self.assertEqual(rolls, [large.roll() for _ in range(50)])
+        self.assertNotEqual(rolls, [Dice(seed=8, rng_version=FAST_RNG).roll() for _ in range(50)])
+        self.assertTrue(all(isinstance(die, int) for roll in rolls for die in roll))
+
+    def test_fast_rng_distribution(self):
+        dice = Dice(seed=1234, rng_version=FAST_RNG)
+        num_rolls = 1_000_000
+        totals = Counter(sum(dice.roll()) for _ in range(num_rolls))
+        for total in range(2, 13):
+            expected = (6 - abs(total - 7)) / 36
+            self.assertAlmostEqual(totals[total] / num_rolls, expected, delta=0.001)
+
+    def test_forced_rolls_do_not_consume_the_buffer(self):
+        reference = Dice(seed=3, rng_version=FAST_RNG)
+        dice = Dice(seed=3, rng_version=FAST_RNG)
+        dice.forced_rolls.extend([(6, 6), (1, 1)])
+        self.assertEqual([dice.roll(), dice.roll()], [(6, 6), (1, 1)])
+        self.assertEqual([dice.roll() for _ in range(5)], [reference.roll() for _ in range(5)])
+
+    def test_unknown_rng_version_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Dice(seed=1, rng_version=3)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -7,6 +7,7 @@ from config import HOUSE_RULES, DICE_TEST_PATTERNS
 from craps.craps_engine import CrapsEngine
 from craps.events import (
     Event,
+    EventBus,
     SessionStarted,
     ShooterAssigned,
     BetPlaced,
@@ -104,6 +105,47 @@ class TestEngineEvents(unittest.TestCase):
         self.assertTrue(engine.setup_session(house_rules_dict=HOUSE_RULES, num_shooters=1))
         self.assertEqual(started, [SessionStarted(num_shooters=1)])
 
+    def test_quiet_engine_only_wires_the_events_its_consumers_read(self):
+        engine = CrapsEngine(quiet_mode=True)
+        self.assertTrue(engine.setup_session(house_rules_dict=HOUSE_RULES, num_shooters=1))
+        self.assertTrue(engine.events.has_subscribers(BetResolved))
+        self.assertFalse(engine.events.has_subscribers(BetPlaced))
+
+
+class TestEventBus(unittest.TestCase):
+    def test_dispatch_runs_concrete_handlers_before_base_handlers(self):
+        bus = EventBus()
+        calls = []
+        bus.subscribe(Event, lambda e: calls.append("event"))
+        bus.subscribe(SevenOut, lambda e: calls.append("seven-out"))
+        bus.publish(SevenOut(shooter_index=0))
+        self.assertEqual(calls, ["seven-out", "event"])
+
+    def test_late_subscribers_see_the_next_publish(self):
+        bus = EventBus()
+        seen = []
+        bus.publish(SessionStarted(num_shooters=1))  # warms the dispatch cache
+        bus.subscribe(Event, seen.append)
+        bus.publish(SessionStarted(num_shooters=2))
+        self.assertEqual(seen, [SessionStarted(num_shooters=2)])
+
+    def test_has_subscribers_sees_base_class_handlers(self):
+        bus = EventBus()
+        self.assertFalse(bus.has_subscribers(PointHit))
+        bus.subscribe(SevenOut, lambda e: None)
+        self.assertFalse(bus.has_subscribers(PointHit))
+        bus.subscribe(Event, lambda e: None)
+        self.assertTrue(bus.has_subscribers(PointHit))
+
+    def test_events_and_bets_are_slotted(self):
+        from craps.bet import Bet
+        from craps.player import Player
+
+        self.assertFalse(hasattr(SessionStarted(num_shooters=1), "__dict__"))
+        bet = Bet("".join(["Pl", "ace"]), 12, Player("Slim"), (7, 6), number=6)
+        self.assertFalse(hasattr(bet, "__dict__"))
+        self.assertIs(bet.bet_type, "Place")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+"""FastForwardEngine against the roll-by-roll engine.
+
+Replayed off the same dice it must reproduce a TableRunner session's
+statistics exactly; sampled, its sessions must match the roll-by-roll
+engine's in distribution.
+"""
+import math
+import statistics
+
+import pytest
+
+from config import HOUSE_RULES
+from craps.craps_engine import CrapsEngine
+from craps.dice import Dice
+from craps.edge import EdgeTracker
+from craps.events import BetResolved
+from craps.fast_forward import FastForwardEngine
+from craps.player import Player
+from craps.strategies.field_v2 import FieldV2
+from craps.strategies.pass_line_odds_v2 import PassLineOddsV2
+from craps.strategies.pass_line_v2 import PassLineV2
+from craps.strategy_contract import V2StrategyAdapter
+from craps.table_runner import TableRunner
+
+MIN_BET = HOUSE_RULES["table_minimum"]
+
+# The PlayerLineup strategies and their v2 equivalents.
+REFERENCE_LINEUP = [("A", "Pass-Line"), ("B", "Pass-Line w/ Odds")]
+
+
+def fast_lineup():
+    return [("A", PassLineV2(MIN_BET)), ("B", PassLineOddsV2("1x"))]
+
+
+SAME_FIELDS = [
+    "session_rolls", "total_amount_bet", "total_amount_won", "total_amount_lost",
+    "total_sevens", "max_table_risk", "last_roll_total", "shooter_stats",
+    "seven_out_rolls", "point_number_rolls", "roll_numbers", "bankroll_history",
+    "at_risk_history", "player_stats", "player_bankrolls", "highest_bankroll",
+    "lowest_bankroll", "session_highest_bankroll", "session_lowest_bankroll",
+]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_replay_matches_table_runner(seed):
+    expected = TableRunner(players=REFERENCE_LINEUP, dice_seed=seed).run()
+    actual = FastForwardEngine(fast_lineup()).replay(Dice(seed=seed))
+
+    for name in SAME_FIELDS:
+        assert getattr(actual, name) == getattr(expected, name), name
+    # Strategy names differ (lineup key vs contract name); who and how much must not.
+    for name in ("session_high_roller", "session_low_roller"):
+        assert getattr(actual, name)[::2] == getattr(expected, name)[::2], name
+
+
+def test_replay_feeds_edge_tracker_like_the_engine():
+    runner = TableRunner(players=REFERENCE_LINEUP, dice_seed=11)
+    expected = EdgeTracker(lambda: runner.engine.house_rules)
+    expected.subscribe(runner.engine.events)
+    runner.run()
+
+    engine = FastForwardEngine(fast_lineup())
+    actual = EdgeTracker(lambda: engine.house_rules)
+    actual.subscribe(engine.events)
+    engine.replay(Dice(seed=11))
+
+    assert actual.wagered == expected.wagered
+    assert actual.pnl == expected.pnl
+    assert actual.snapshot() == expected.snapshot()
+
+
+def test_replay_matches_near_ruin():
+    """Bets the bankroll can't cover are skipped exactly as the engine skips them."""
+    contracts = [PassLineV2(25), PassLineOddsV2("3x-4x-5x")]
+    house_rules = {**HOUSE_RULES, "table_minimum": 25}
+    bankroll = 100
+
+    engine = CrapsEngine(quiet_mode=True)
+    assert engine.setup_session(house_rules_dict=house_rules, num_shooters=12, dice_mode="live", dice_seed=5)
+    players = []
+    for i, contract in enumerate(contracts):
+        player = Player(name=f"P{i}", initial_balance=bankroll, strategy_name=f"P{i}")
+        player.betting_strategy = V2StrategyAdapter(contract)
+        engine.player_lineup.add_player(player)
+        players.append(player)
+    engine.stats.initialize_player_stats(players)
+    engine.lock_session()
+    engine.assign_next_shooter()
+    shooters = 0
+    while shooters < 12:
+        engine.accept_bets()
+        outcome = engine.roll_dice()
+        prev_phase = engine.game_state.phase
+        engine.resolve_bets(outcome)
+        engine.refresh_bet_statuses()
+        shooters += engine.handle_post_roll(outcome, prev_phase).new_shooter_assigned
+
+    fast = FastForwardEngine(
+        [(p.name, c) for p, c in zip(players, contracts)],
+        house_rules=house_rules, num_shooters=12, initial_bankroll=bankroll,
+    ).replay(Dice(seed=5))
+
+    assert [p.balance for p in players] == fast.player_bankrolls
+    assert engine.stats.total_amount_bet == fast.total_amount_bet
+    assert engine.stats.bankroll_history == fast.bankroll_history
+    assert engine.stats.at_risk_history == fast.at_risk_history
+
+
+def test_sampled_sessions_match_roll_by_roll_distribution():
+    """Mean session length, action and results agree within sampling error."""
+    reference = [TableRunner(players=REFERENCE_LINEUP, dice_seed=seed).run() for seed in range(150)]
+    engine = FastForwardEngine(fast_lineup())
+    sampled = [engine.run(seed=seed) for seed in range(3000)]
+
+    measures = {
+        "rolls": lambda s: s.session_rolls,
+        "amount bet": lambda s: s.total_amount_bet,
+        "points made": lambda s: len(s.point_number_rolls),
+        "sevens": lambda s: s.total_sevens,
+        "net A": lambda s: s.player_stats["A"]["net_win_loss"],
+        "net B": lambda s: s.player_stats["B"]["net_win_loss"],
+    }
+    for name, measure in measures.items():
+        a = [measure(s) for s in reference]
+        b = [measure(s) for s in sampled]
+        stderr = math.sqrt(statistics.variance(a) / len(a) + statistics.variance(b) / len(b))
+        z = (statistics.mean(a) - statistics.mean(b)) / stderr
+        assert abs(z) < 4, (name, statistics.mean(a), statistics.mean(b))
+
+
+def test_sampled_sessions_are_seeded_and_complete():
+    engine = FastForwardEngine(fast_lineup(), num_shooters=6)
+    first = engine.run(seed=3)
+    second = engine.run(seed=3)
+    assert first.player_stats == second.player_stats
+    assert first.bankroll_history == second.bankroll_history
+    assert sorted(first.shooter_stats) == list(range(1, 7))
+    assert len(first.seven_out_rolls) == 12  # recorded twice per seven-out
+    assert len(first.bankroll_history["A"]) == first.session_rolls
+
+
+def test_max_rolls_caps_the_session():
+    stats = FastForwardEngine(fast_lineup(), num_shooters=1000, max_rolls=50).run(seed=1)
+    assert stats.session_rolls == 50
+    assert len(stats.at_risk_history["B"]) == 50
+    assert stats.roll_numbers[-1] == 50
+
+
+def test_publishes_resolutions_only_when_someone_listens():
+    engine = FastForwardEngine(fast_lineup(), num_shooters=3)
+    resolved = []
+    engine.events.subscribe(BetResolved, resolved.append)
+    stats = engine.run(seed=4)
+    assert sum(e.amount for e in resolved) == stats.total_amount_bet
+    assert {e.bet_type for e in resolved} <= {"Pass Line", "Pass Line Odds"}
+
+
+def test_rejects_strategies_it_cannot_model():
+    with pytest.raises(ValueError, match="FieldV2"):
+        FastForwardEngine([("A", FieldV2(MIN_BET))])
@@ -0,0 +1,77 @@
+import gzip
+import os
+
+from craps.play_by_play import PlayByPlay
+
+
+def test_lines_are_buffered_until_flush(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), flush_seconds=3600)
+    pbp.write("first")
+    pbp.write("second")
+    assert open(pbp.play_by_play_file, encoding="utf-8").read() == ""
+    pbp.flush()
+    assert open(pbp.play_by_play_file, encoding="utf-8").read() == "first\nsecond\n"
+    pbp.close()
+    pbp.write("third")  # reopens in append mode
+    pbp.close()
+    assert open(pbp.play_by_play_file, encoding="utf-8").read() == "first\nsecond\nthird\n"
+
+
+def test_compressed_log(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), compress=True)
+    pbp.write("🎲 Roll #1 → (3, 4) = 7")
+    pbp.close()
+    assert pbp.play_by_play_file.endswith(".txt.gz")
+    with gzip.open(pbp.play_by_play_file, "rt", encoding="utf-8") as f:
+        assert f.read() == "🎲 Roll #1 → (3, 4) = 7\n"
+
+
+def test_rotation_keeps_the_configured_backups(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), max_bytes=10, backups=2)
+    for n in range(4):
+        pbp.write(f"line {n} ...")  # 13 chars: every write rotates
+    pbp.write("tail")
+    pbp.close()
+    path = pbp.play_by_play_file
+    assert open(path, encoding="utf-8").read() == "tail\n"
+    assert open(f"{path}.1", encoding="utf-8").read() == "line 3 ...\n"
+    assert open(f"{path}.2", encoding="utf-8").read() == "line 2 ...\n"
+    assert not os.path.exists(f"{path}.3")
+
+
+def test_rotation_counts_utf8_bytes(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), max_bytes=12)
+    pbp.write("🎲 → 7")  # 6 characters, 11 bytes with the newline
+    pbp.write("x")
+    pbp.close()
+    assert os.path.exists(f"{pbp.play_by_play_file}.1")
+
+
+def test_compressed_rotation_counts_uncompressed_bytes_across_reopens(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), compress=True, max_bytes=30, flush_seconds=3600)
+    pbp.write("a" * 19)  # 20 bytes: under the limit
+    pbp.close()
+    pbp.write("b" * 19)  # reopened; 40 bytes rotates
+    assert pbp._file is None
+    with gzip.open(f"{pbp.play_by_play_file}.1", "rt", encoding="utf-8") as f:
+        assert f.read() == "a" * 19 + "\n" + "b" * 19 + "\n"
+
+
+def test_compressed_log_is_buffered(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path), compress=True, flush_seconds=3600)
+    pbp.write("first")
+    pbp.write("second")
+    assert os.path.getsize(pbp.play_by_play_file) < 20  # the gzip header at most
+    pbp.close()
+    with gzip.open(pbp.play_by_play_file, "rt", encoding="utf-8") as f:
+        assert f.read() == "first\nsecond\n"
+
+
+def test_clearing_closes_the_open_handle(tmp_path):
+    pbp = PlayByPlay(output_folder=str(tmp_path))
+    pbp.write("old session")
+    pbp.clear_play_by_play_file()
+    assert not os.path.exists(pbp.play_by_play_file)
+    pbp.write("new session")
+    pbp.close()
+    assert open(pbp.play_by_play_file, encoding="utf-8").read() == "new session\n"
@@ -70,6 +70,24 @@ class TestPlayer(unittest.TestCase):
         win_amount = 150
         self.player.receive_payout(win_amount, self.play_by_play)
         self.assertEqual(self.player.balance, initial_balance + win_amount)
+
+    def test_quiet_play_by_play_skips_narration(self):
+        """Quiet engines settle bets without formatting narration."""
+        from unittest import mock
+        from craps.bet import Bet
+        from craps.craps_engine import CrapsEngine
+
+        quiet = PlayByPlay(engine=CrapsEngine(quiet_mode=True))
+        self.assertFalse(quiet.enabled)
+        self.assertTrue(self.play_by_play.enabled)
+
+        bet = Bet("Field", 10, self.player, (1, 1))
+        bet.status = "won"
+        with mock.patch.object(quiet, "write") as write:
+            self.player.win_bet(bet, quiet)
+            self.player.lose_bet(bet, quiet)
+        write.assert_not_called()
+        self.assertEqual(self.player.balance, 1000)
     
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+from craps.profiler import PHASES, RollProfiler
+from craps.simulation_runner import simulate_session_block
+from craps.table_runner import TableRunner
+
+
+def test_profiled_run_times_every_stage_and_strategy():
+    profiler = RollProfiler()
+    runner = TableRunner(
+        players=[("Linus", "Pass-Line"), ("Crosstopher", "Iron Cross")],
+        max_shooters=3,
+        dice_seed=11,
+        profiler=profiler,
+    )
+    stats = runner.run()
+    snapshot = profiler.snapshot()
+    assert list(snapshot["phases"]) == list(PHASES)
+    for timing in snapshot["phases"].values():
+        assert timing["calls"] == stats.session_rolls
+    # wants() runs at bet collection and again at adjustment
+    assert set(snapshot["strategies"]) == {"Pass-Line", "Iron Cross"}
+    for timing in snapshot["strategies"].values():
+        assert timing["calls"] == 2 * stats.session_rolls
+
+
+def test_profiling_does_not_change_the_session():
+    def run(profiler):
+        runner = TableRunner(
+            players=[("Crosstopher", "Iron Cross")], max_shooters=3, dice_seed=5, profiler=profiler,
+        )
+        return runner.run()
+
+    plain, profiled = run(None), run(RollProfiler())
+    assert plain.session_rolls == profiled.session_rolls
+    assert plain.bankroll_history == profiled.bankroll_history
+
+
+def test_profiles_ride_back_in_merged_aggregates():
+    first, _ = simulate_session_block(0, 2, master_seed=3, profile=True)
+    second, _ = simulate_session_block(2, 2, master_seed=3, profile=True)
+    assert first.profile is not None and second.profile is not None
+    rolls = first.profile.phases["roll_dice"].calls + second.profile.phases["roll_dice"].calls
+    first.merge(second)
+    assert first.profile.phases["roll_dice"].calls == rolls == first.throws
+
+    unprofiled, _ = simulate_session_block(0, 1, master_seed=3)
+    assert unprofiled.profile is None
@@ -40,7 +40,7 @@ from craps.strategies.all_tall_small_v2 import AllTallSmallV2
 from craps.strategies.three_point_v2 import ThreePointMollyV2, ThreePointDollyV2
 from craps.strategies.three_two_one_v2 import ThreeTwoOneV2
 from craps.strategies.regress_press_v2 import RegressPressV2
-from craps.strategy_contract import V2StrategyAdapter
+from craps.strategy_contract import TableViewCache, V2StrategyAdapter, build_table_view
 
 MIN_BET = HOUSE_RULES["table_minimum"]
 SEEDS = range(10)
@@ -189,6 +189,62 @@ class TestV2RegressionParity(unittest.TestCase):
                 self.assert_parity(old_factory, new_factory)
 
 
+class TestDecisionCache(unittest.TestCase):
+    """Memoizable strategies replay cached decisions; the money must not move."""
+
+    def test_cached_decisions_match_uncached(self):
+        for name in ("PassLine", "IronCross", "Field", "Across", "LayOutside", "PassLineOdds1x"):
+            new_factory = STRATEGY_PAIRS[name][1]
+            adapters = []
+
+            def cached(engine):
+                adapter = new_factory(engine)
+                adapters.append(adapter)
+                return adapter
+
+            def uncached(engine):
+                adapter = new_factory(engine)
+                adapter._cache = None
+                return adapter
+
+            with self.subTest(strategy=name):
+                self.assertTrue(new_factory(None).contract.memoizable)
+                self.assertEqual(run_session(cached, 3), run_session(uncached, 3))
+                self.assertGreater(adapters[0].cache_hits, adapters[0].cache_misses)
+
+    def test_unmarked_strategies_are_not_cached(self):
+        adapter = V2StrategyAdapter(RegressPressV2(high_unit=10, low_unit=3, regression_factor=2, regress_units=5))
+        run_session(lambda e: adapter, 3, num_shooters=5)
+        self.assertEqual(adapter.cache_hits + adapter.cache_misses, 0)
+
+
+class TestTableViewCache(unittest.TestCase):
+
+    def test_unchanged_snapshots_are_reused(self):
+        from craps.table_runner import TableRunner
+
+        runner = TableRunner(players=[("Crosstopher", "Iron Cross")], max_shooters=5, dice_seed=4)
+        runner.start_session()
+        engine = runner.engine
+        player = engine.player_lineup.get_active_players_list()[0]
+        views = TableViewCache()
+        while len(engine.table.bets.for_owner(player)) < 3:
+            runner.roll_once()
+
+        first = views.build(engine.game_state, player, engine.table, "adjust")
+        self.assertIs(views.build(engine.game_state, player, engine.table, "adjust"), first)
+        self.assertEqual(first, build_table_view(engine.game_state, player, engine.table, "adjust"))
+
+        pressed = engine.table.bets.for_owner(player)[-1]
+        pressed.amount += 6
+        second = views.build(engine.game_state, player, engine.table, "adjust")
+        self.assertIsNot(second, first)
+        self.assertEqual(second, build_table_view(engine.game_state, player, engine.table, "adjust"))
+        self.assertEqual(second.bets[-1].amount, pressed.amount)
+        for old, new in zip(first.bets[:-1], second.bets[:-1]):
+            self.assertIs(old, new)
+
+
 class TestSeededDice(unittest.TestCase):
 
     def test_same_seed_same_sequence(self):
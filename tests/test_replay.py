@@ -3,6 +3,8 @@
 Imports the verification logic from scripts/verify_replay.py so the gate
 has a single source of truth; CI runs it here, humans run the script.
 """
+import gzip
+import json
 import sys
 from pathlib import Path
 
@@ -10,7 +12,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
 import verify_replay  # noqa: E402  # pyright: ignore[reportMissingImports] — scripts/ path added above
 
-from craps.session_recorder import load_session  # noqa: E402
+from craps.serialization import EncodedEvent, deserialize_event  # noqa: E402
+from craps.session_recorder import RecordingIndex, SessionRecorder, index_path, is_recording, load_session  # noqa: E402
 from craps.table_runner import TableRunner  # noqa: E402
 
 
@@ -56,3 +59,117 @@ def test_max_rolls_stops_the_runner(tmp_path):
     # triggered close (finalize emits it, but the explicit close also ran).
     events = [event for _, _, event in load_session(runner.recorder.path)]
     assert sum(1 for e in events if type(e).__name__ == "DiceRolled") == 5
+
+
+def test_compressed_recording_replays_to_identical_stats(tmp_path):
+    live, replayed = verify_replay.verify(
+        seed=1234, num_shooters=3, sessions_dir=str(tmp_path), compress=True
+    )
+    assert live.session_rolls == replayed.session_rolls
+    recordings = [p for p in tmp_path.iterdir() if is_recording(p)]
+    assert len(recordings) == 1
+    assert recordings[0].name.endswith(".jsonl.gz")
+
+
+def record_session(tmp_path, compress=False):
+    runner = TableRunner(
+        table_id="indexed",
+        players=[("Linus", "Pass-Line"), ("Fielder", "Field")],
+        max_shooters=3,
+        dice_seed=5,
+        record=True,
+        sessions_dir=str(tmp_path),
+        compress_recording=compress,
+    )
+    runner.run()
+    assert runner.recorder is not None
+    return runner.recorder
+
+
+def test_recorder_saves_a_sidecar_index_on_close(tmp_path):
+    recorder = record_session(tmp_path)
+    lines = recorder.path.read_text(encoding="utf-8").splitlines()
+
+    saved = RecordingIndex.load(recorder.path)
+    assert saved == recorder.index
+    assert saved == RecordingIndex.build(recorder.path)
+    assert saved.count == len(lines)
+    assert list(saved.read_lines(recorder.path, 300, 310)) == lines[301:310]
+    assert list(saved.read_lines(recorder.path, len(lines) - 3)) == lines[-2:]
+
+
+def test_stale_or_missing_index_is_rebuilt(tmp_path):
+    recorder = record_session(tmp_path)
+    lines = recorder.path.read_text(encoding="utf-8").splitlines()
+    with recorder.path.open("a", encoding="utf-8") as f:
+        f.write(lines[-1] + "\n")  # the recording outgrew its index
+    assert RecordingIndex.load(recorder.path) is None
+    assert RecordingIndex.for_recording(recorder.path).count == len(lines) + 1
+    assert RecordingIndex.load(recorder.path) is not None  # re-saved
+
+    index_path(recorder.path).unlink()
+    assert RecordingIndex.for_recording(recorder.path).count == len(lines) + 1
+
+
+def test_index_reads_legacy_line_endings_and_blank_lines(tmp_path):
+    recorder = record_session(tmp_path)
+    lines = recorder.path.read_text(encoding="utf-8").splitlines()
+    legacy = tmp_path / "legacy.jsonl"
+    legacy.write_bytes(b"".join(line.encode() + b"\r\n" + (b"\n" if i % 50 == 0 else b"")
+                                for i, line in enumerate(lines)))
+
+    index = RecordingIndex.build(legacy, stride=16)
+    assert index.count == len(lines)
+    assert index.size == legacy.stat().st_size
+    for after_seq in (-1, 15, 49, 50, 51, len(lines) - 2):
+        assert list(index.read_lines(legacy, after_seq, after_seq + 40)) == lines[after_seq + 1:after_seq + 40]
+
+
+def test_compressed_recording_is_block_indexed_gzip(tmp_path):
+    plain = record_session(tmp_path / "plain")
+    packed = record_session(tmp_path / "packed", compress=True)
+    lines = plain.path.read_text(encoding="utf-8").splitlines()
+
+    assert packed.path.name.endswith(".jsonl.gz")
+    assert gzip.decompress(packed.path.read_bytes()).decode().splitlines() == lines
+    assert packed.path.stat().st_size * 5 < plain.path.stat().st_size
+    assert [e for _, _, e in load_session(packed.path)] == [e for _, _, e in load_session(plain.path)]
+
+    saved = RecordingIndex.load(packed.path)
+    assert saved == packed.index == RecordingIndex.build(packed.path)
+    assert saved.count == len(lines)
+    for after_seq in (-1, 254, 255, 256, len(lines) - 3):
+        assert list(saved.read_lines(packed.path, after_seq, after_seq + 300)) == lines[after_seq + 1:after_seq + 300]
+
+
+def test_compressed_recorder_reads_its_unwritten_block(tmp_path):
+    lines = record_session(tmp_path).path.read_text(encoding="utf-8").splitlines()
+    recorder = SessionRecorder("mid", tmp_path / "mid", index_stride=16, compress=True)
+
+    def feed(chunk):
+        for line in chunk:
+            recorder._on_encoded(deserialize_event(json.loads(line))[2], EncodedEvent.from_line(line))
+
+    feed(lines[:40])  # two blocks written, eight lines pending
+    assert recorder.index.count == 32 and recorder.count == 40
+    assert list(recorder.read_lines()) == lines[:40]
+    assert list(recorder.read_lines(20, 36)) == lines[21:36]
+    snapshot = recorder.read_lines(35)
+    feed(lines[40:60])
+    assert list(snapshot) == lines[36:40]
+    recorder.close()
+    assert list(recorder.read_lines(-1)) == lines[:60]
+    assert gzip.decompress(recorder.path.read_bytes()).decode().splitlines() == lines[:60]
+
+
+def test_single_member_gzip_of_a_recording_is_readable(tmp_path):
+    recorder = record_session(tmp_path)
+    lines = recorder.path.read_text(encoding="utf-8").splitlines()
+    zipped = tmp_path / "zipped.jsonl.gz"
+    zipped.write_bytes(gzip.compress(recorder.path.read_bytes()))
+
+    index = RecordingIndex.for_recording(zipped)
+    assert index.count == len(lines)
+    assert set(index.offsets) == {0}
+    assert list(index.read_lines(zipped, 300, 303)) == lines[301:303]
+    assert [e for _, _, e in load_session(zipped)] == [e for _, _, e in load_session(recorder.path)]
@@ -0,0 +1,90 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from craps.dice import Dice
+from craps.roll_history_manager import RollHistoryManager
+from craps.roll_store import HEADER_SIZE, RollStore, convert_roll_history, write_rolls
+from craps.table_runner import TableRunner
+
+SAVES = Path(__file__).resolve().parents[1] / "saves"
+
+
+def session_rolls():
+    runner = TableRunner(players=[("Linus", "Pass-Line")], max_shooters=4, dice_seed=21)
+    runner.run()
+    return runner.engine.roll_history
+
+
+def test_session_history_round_trips_through_two_bytes_a_roll(tmp_path):
+    history = session_rolls()
+    manager = RollHistoryManager(output_folder=str(tmp_path))
+    manager.save_roll_history(history)
+    assert Path(manager.roll_history_file).stat().st_size == HEADER_SIZE + 2 * len(history)
+    assert manager.load_roll_history() == history
+
+
+def test_dice_history_mode_replays_a_rolls_file(tmp_path):
+    history = session_rolls()
+    path = tmp_path / "session.rolls"
+    write_rolls(path, history)
+    dice = Dice(str(path))
+    assert [dice.roll() for _ in history] == [tuple(roll["dice"]) for roll in history]
+    with pytest.raises(IndexError):
+        dice.roll()
+
+
+def test_dice_history_mode_streams_across_blocks(tmp_path):
+    history = session_rolls()
+    path = tmp_path / "session.rolls"
+    write_rolls(path, history)
+    dice = Dice(str(path), buffer_size=3)
+    assert [dice.roll() for _ in history] == [tuple(roll["dice"]) for roll in history]
+    assert dice.current_roll_index == len(history)
+
+
+def test_dice_history_mode_streams_a_legacy_csv(tmp_path):
+    path = tmp_path / "legacy.csv"
+    path.write_text("shooter_num,dice,total\n1,\"[3, 4]\",7\n1,\"[6, 6]\",12\n", encoding="utf-8")
+    dice = Dice(str(path))
+    assert [dice.roll(), dice.roll()] == [(3, 4), (6, 6)]
+    with pytest.raises(IndexError):
+        dice.roll()
+
+
+def test_columns_decode_in_bulk(tmp_path):
+    history = session_rolls()
+    path = tmp_path / "session.rolls"
+    write_rolls(path, history)
+    columns = RollStore(path).columns()
+    assert columns["total"].tolist() == [roll["total"] for roll in history]
+    assert columns["shooter_num"].tolist() == [roll["shooter_num"] for roll in history]
+
+
+def test_legacy_csv_converts(tmp_path):
+    history = session_rolls()
+    source = tmp_path / "legacy.csv"
+    with source.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["shooter_num", "roll_number", "dice", "total", "phase", "point"])
+        writer.writeheader()
+        for roll in history:
+            writer.writerow({**roll, "dice": str(list(roll["dice"]))})
+    target = convert_roll_history(source)
+    assert target == tmp_path / "legacy.rolls"
+    assert list(RollStore(target).rolls()) == history
+
+
+@pytest.mark.parametrize("save", sorted(SAVES.glob("*.json")), ids=lambda p: p.name)
+def test_saved_json_sessions_convert(tmp_path, save):
+    target = convert_roll_history(save, tmp_path / "saved.rolls")
+    rolls = list(RollStore(target).rolls())
+    assert rolls and rolls[0]["roll_number"] == 1
+    assert all(roll["total"] == sum(roll["dice"]) for roll in rolls)
+
+
+def test_non_rolls_files_are_rejected(tmp_path):
+    path = tmp_path / "bogus.rolls"
+    path.write_bytes(b"not a roll history file")
+    with pytest.raises(ValueError):
+        RollStore(path)
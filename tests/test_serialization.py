@@ -2,6 +2,7 @@
 import json
 
 import pytest
+from craps import events
 
 from craps.events import (
     BankrollsUpdated,
@@ -23,7 +24,17 @@ from craps.events import (
     SevenOut,
     ShooterAssigned,
 )
-from craps.serialization import EVENT_TYPES, deserialize_event, serialize_event
+from craps import serialization
+from craps.serialization import (
+    EVENT_TYPES,
+    EventEncoder,
+    deserialize_event,
+    encode_event,
+    serialize_event,
+)
+from craps.server.broadcaster import Broadcaster
+from craps.session_recorder import load_session
+from craps.table_runner import TableRunner
 
 ONE_OF_EACH = [
     SessionStarted(num_shooters=10),
@@ -87,7 +98,11 @@ def test_registry_covers_every_event_type():
         cls = stack.pop()
         subclasses.add(cls)
         stack.extend(cls.__subclasses__())
-    assert set(EVENT_TYPES.values()) == subclasses
+    # slots=True dataclasses leave their pre-slots original behind in
+    # __subclasses__; the registry must hold the exported class per name.
+    assert set(EVENT_TYPES) == {cls.__name__ for cls in subclasses}
+    for name, cls in EVENT_TYPES.items():
+        assert getattr(events, name) is cls
 
 
 @pytest.mark.parametrize("event", ONE_OF_EACH, ids=lambda e: type(e).__name__)
@@ -123,3 +138,57 @@ def test_payload_field_names_match_dataclass_fields():
 def test_unknown_event_type_rejected():
     with pytest.raises(ValueError, match="Unknown event type"):
         deserialize_event({"seq": 0, "table_id": "t", "type": "NotAnEvent"})
+
+
+@pytest.mark.parametrize("event", ONE_OF_EACH, ids=lambda e: type(e).__name__)
+def test_encoded_forms_match_the_envelope(event):
+    encoded = encode_event(event, seq=5, table_id="t")
+    envelope = serialize_event(event, seq=5, table_id="t")
+    assert json.loads(encoded.line) == json.loads(json.dumps(envelope))
+    assert "\n" not in encoded.line
+    assert encoded.sse == (
+        f"id: 5\nevent: {type(event).__name__}\ndata: {encoded.line}\n\n".encode("utf-8")
+    )
+    assert (encoded.seq, encoded.type) == (5, type(event).__name__)
+
+
+def test_encoder_numbers_events_and_shares_one_encoding():
+    bus = events.EventBus()
+    encoder = EventEncoder("t")
+    encoder.subscribe(bus)
+    first, second = [], []
+    encoder.add_sink(lambda event, encoded: first.append(encoded))
+    encoder.add_sink(lambda event, encoded: second.append(encoded))
+    for event in ONE_OF_EACH:
+        bus.publish(event)
+
+    assert [e.seq for e in first] == list(range(len(ONE_OF_EACH)))
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_recorder_and_broadcaster_encode_each_event_once(tmp_path, monkeypatch):
+    calls = []
+
+    def counting_encode(event, seq, table_id):
+        calls.append(seq)
+        return encode_event(event, seq, table_id)
+
+    monkeypatch.setattr(serialization, "encode_event", counting_encode)
+    runner = TableRunner(players=[("Linus", "Pass-Line")], max_shooters=2, dice_seed=3,
+                         record=True, sessions_dir=tmp_path)
+    broadcaster = Broadcaster(runner.table_id)
+    broadcaster.attach(runner.encoder)
+    runner.run()
+
+    history = list(broadcaster.history())
+    assert calls == list(range(len(history)))
+    assert runner.recorder is not None
+    lines = runner.recorder.path.read_text(encoding="utf-8").splitlines()
+    assert lines == [encoded.line for encoded in history]
+    assert [seq for seq, _, _ in load_session(runner.recorder.path)] == calls
+
+
+def test_unobserved_runner_encodes_nothing():
+    runner = TableRunner(players=[("Linus", "Pass-Line")], max_shooters=1, dice_seed=3)
+    runner.start_session()
+    assert not runner.engine.events.has_subscribers(events.BetsRequested)
@@ -0,0 +1,35 @@
+import pytest
+
+from craps.shared_dice import SharedDiceRunner
+from craps.table_runner import TableRunner
+
+LINEUP = [("Linus", "Pass-Line"), ("Crosstopher", "Iron Cross"), ("Fielder", "Field")]
+
+
+def test_every_sub_table_sees_the_same_rolls():
+    runner = SharedDiceRunner(players=LINEUP, max_shooters=4, dice_seed=17)
+    results = runner.run()
+    assert list(results) == [name for name, _ in LINEUP]
+    dice = {name: [roll["dice"] for roll in runner.runners[name].engine.roll_history] for name in results}
+    assert dice["Linus"] == dice["Crosstopher"] == dice["Fielder"]
+    assert {stats.session_rolls for stats in results.values()} == {len(dice["Linus"])}
+    for name, stats in results.items():
+        assert set(stats.player_stats) == {name}
+
+
+def test_sub_tables_match_solo_sessions_on_the_same_seed():
+    results = SharedDiceRunner(players=LINEUP, max_shooters=3, dice_seed=8).run()
+    for name, strategy_name in LINEUP:
+        solo = TableRunner(players=[(name, strategy_name)], max_shooters=3, dice_seed=8).run()
+        assert results[name].session_rolls == solo.session_rolls
+        assert results[name].bankroll_history == solo.bankroll_history
+
+
+def test_roll_limit_stops_every_sub_table():
+    results = SharedDiceRunner(players=LINEUP, max_shooters=50, max_rolls=25, dice_seed=2).run()
+    assert {stats.session_rolls for stats in results.values()} == {25}
+
+
+def test_duplicate_names_are_rejected():
+    with pytest.raises(ValueError):
+        SharedDiceRunner(players=[("Linus", "Pass-Line"), ("Linus", "Field")])
@@ -0,0 +1,155 @@
+"""Chunked simulation runs: block workers, aggregate merging, chunk sizing,
+and per-session seeding."""
+import numpy as np
+import pytest
+
+from craps.dice import FAST_RNG
+from craps.simulation_aggregate import Histogram, SimulationAggregate, TopK
+from craps.simulation_runner import replay_session, session_seed, simulate_session_block
+from craps.statistics import Statistics
+from run_simulation import ChunkSizer, SimulationManager
+
+
+def make_stats(rolls, bet, won, lost, shooters, high_roller=None):
+    stats = Statistics(table_minimum=10, num_shooters=len(shooters), num_players=2)
+    stats.session_rolls = rolls
+    stats.total_amount_bet = bet
+    stats.total_amount_won = won
+    stats.total_amount_lost = lost
+    stats.shooter_stats = dict(enumerate(shooters, start=1))
+    stats.session_high_roller = high_roller
+    for player in ("Alice", "Bob"):
+        net = sum(shooter.get(player, 0) for shooter in shooters)
+        stats.player_stats[player] = {"net_win_loss": net}
+    return stats
+
+
+SESSIONS = [
+    make_stats(90, 400, 150, 210, [{"Alice": 20, "Bob": -10}, {"Alice": 0, "Bob": -40}], ("Alice", "Pass", 20)),
+    make_stats(40, 100, 10, 60, [{"Alice": -50, "Bob": 15}], ("Bob", "Field", 15)),
+    make_stats(120, 800, 420, 300, [{"Alice": 75, "Bob": 5}], ("Alice", "Pass", 75)),
+]
+
+
+def test_merging_partials_matches_adding_every_session():
+    whole = SimulationAggregate.from_sessions(SESSIONS)
+    merged = SimulationAggregate.from_sessions(SESSIONS[:1])
+    merged.merge(SimulationAggregate.from_sessions(SESSIONS[1:]))
+
+    for aggregate in (whole, merged):
+        assert aggregate.sessions == 3
+        assert aggregate.throws == 250
+        assert aggregate.total_bet == 1300
+        assert aggregate.house_take() == 570 - 580
+        assert aggregate.shooter_outcomes["Alice"] == {"won": 2, "lost": 1, "push": 1}
+        assert aggregate.shooter_outcomes["Bob"] == {"won": 2, "lost": 2}
+        assert aggregate.max_win == (75, "Alice")
+        assert aggregate.max_loss == (-50, "Alice")
+        assert aggregate.best_sessions["Pass"] == (75, -1, "Alice", "Pass")
+        assert aggregate.best_sessions["Field"] == (15, -1, "Bob", "Field")
+        assert aggregate.shooter_nets.count == 8
+        assert aggregate.shooter_nets.total == 15
+        assert [entry[0] for entry in aggregate.high_rollers.ranked()] == [75, 20, 15]
+    assert merged.shooter_nets == whole.shooter_nets
+    assert merged.player_net == whole.player_net
+
+
+def test_histogram_bins_and_overflow():
+    histogram = Histogram(low=-20, high=20, bin_width=10)
+    for value in (-25, -20, -1, 0, 9, 19, 20):
+        histogram.add(value)
+    assert histogram.bins == [1, 1, 2, 1]
+    assert (histogram.underflow, histogram.overflow) == (1, 1)
+    assert histogram.edges() == [-20, -10, 0, 10, 20]
+    with pytest.raises(ValueError):
+        histogram.merge(Histogram(low=-20, high=20, bin_width=5))
+
+
+def test_top_k_keeps_the_extremes_across_merges():
+    highs, lows = TopK(k=2), TopK(k=2, largest=False)
+    other_highs, other_lows = TopK(k=2), TopK(k=2, largest=False)
+    for i, profit in enumerate([5, -30, 40, 0, 12, -8]):
+        entry = (profit, i, "P", "S")
+        (highs if i % 2 else other_highs).add(entry)
+        (lows if i % 2 else other_lows).add(entry)
+    highs.merge(other_highs)
+    lows.merge(other_lows)
+    assert [e[0] for e in highs.ranked()] == [40, 12]
+    assert [e[0] for e in lows.ranked()] == [-30, -8]
+
+
+def test_merging_runs_with_different_seeds_is_refused():
+    with pytest.raises(ValueError):
+        SimulationAggregate(master_seed=1).merge(SimulationAggregate(master_seed=2))
+
+
+def test_session_seed_matches_seed_sequence_spawn():
+    child = np.random.SeedSequence(1234).spawn(6)[5]
+    low, high = child.generate_state(2, dtype=np.uint32)
+    assert session_seed(1234, 5) == (int(high) << 32) | int(low)
+    assert len({session_seed(1234, i) for i in range(100)}) == 100
+
+
+def test_results_do_not_depend_on_chunking():
+    whole, _ = simulate_session_block(0, 6, master_seed=99)
+    chunked, _ = simulate_session_block(3, 3, master_seed=99)
+    first, _ = simulate_session_block(0, 3, master_seed=99)
+    chunked.merge(first)
+    assert (chunked.throws, chunked.total_bet, chunked.player_net) == (whole.throws, whole.total_bet, whole.player_net)
+    assert chunked.high_rollers.ranked() == whole.high_rollers.ranked()
+    assert chunked.best_sessions == whole.best_sessions
+
+
+def test_best_sessions_replay_from_the_master_seed():
+    aggregate, _ = simulate_session_block(0, 4, master_seed=7)
+    for profit, session_number, player, strategy in aggregate.best_sessions.values():
+        replayed = replay_session(7, session_number)
+        assert replayed.session_high_roller == (player, strategy, profit)
+        assert replayed.session_number == session_number
+
+
+def test_fast_rng_runs_replay_under_their_own_version():
+    aggregate, _ = simulate_session_block(0, 3, master_seed=7, rng_version=FAST_RNG)
+    assert aggregate.rng_version == FAST_RNG
+    for profit, session_number, player, strategy in aggregate.best_sessions.values():
+        replayed = replay_session(7, session_number, FAST_RNG)
+        assert replayed.session_high_roller == (player, strategy, profit)
+    with pytest.raises(ValueError):
+        aggregate.merge(SimulationAggregate(master_seed=7))
+
+
+def test_session_block_numbers_sessions_from_its_offset():
+    aggregate, elapsed = simulate_session_block(first_session=40, count=3, master_seed=5)
+    assert aggregate.sessions == 3
+    assert aggregate.master_seed == 5
+    assert aggregate.throws > 0
+    assert elapsed > 0
+    for _, session_number, _, _ in aggregate.best_sessions.values():
+        assert 40 <= session_number < 43
+
+
+def test_chunk_sizer_probes_then_targets_block_time():
+    sizer = ChunkSizer(max_workers=4, target_seconds=2.0, initial_size=4)
+    assert sizer.next_size(remaining=100_000) == 4
+    sizer.record(count=4, elapsed=0.2)  # 50ms per session
+    assert sizer.next_size(remaining=100_000) == 40
+    # Near the end, blocks shrink so every worker still gets work.
+    assert sizer.next_size(remaining=40) == 5
+    assert sizer.next_size(remaining=1) == 1
+
+
+def test_fixed_chunk_size_is_respected():
+    sizer = ChunkSizer(max_workers=4, chunk_size=25)
+    sizer.record(count=1, elapsed=10.0)
+    assert sizer.next_size(remaining=1000) == 25
+    assert sizer.next_size(remaining=7) == 7
+
+
+def test_manager_runs_every_session_exactly_once():
+    manager = SimulationManager(num_sessions=12, max_workers=2, chunk_size=5, master_seed=3)
+    manager.run_simulations()
+    assert manager.aggregate.sessions == 12
+
+    serial, _ = simulate_session_block(0, 12, master_seed=3)
+    assert manager.aggregate.throws == serial.throws
+    assert manager.aggregate.player_net == serial.player_net
@@ -3,7 +3,9 @@
  * reconnects automatically and sends Last-Event-ID, which the server
  * answers with a gapless resume — no client-side gap logic needed.
  * A fresh connection replays the session from seq 0, so a late-joining
- * felt builds complete state.
+ * felt builds complete state. A client that falls too far behind gets a
+ * `resync` frame (id = last seq it received) and the stream ends; the
+ * automatic reconnect resumes from there, so it needs no handling here.
  */
 import { EVENT_TYPES, type Envelope } from './events'
 